@@ -14,25 +14,19 @@ klima kontrolü ve sensör okuma işlemlerini yapar.
 """
 
 from .home_automation import HomeAutomationSystemConnection
-import time
+from .log import get_logger
+from .protocol import read_plan, set_encoder
+
+_log = get_logger("api.board1")
 
 
 class AirConditionerSystemConnection(HomeAutomationSystemConnection):
     """
     Board #1 ile iletişim - Klima Sistemi
     
-    UART Protokolü (R2.1.4-1):
-    ┌─────────┬────────────────────────────────┬──────────────┐
-    │ Komut   │ Açıklama                       │ Cevap        │
-    ├─────────┼────────────────────────────────┼──────────────┤
-    │ 0x01    │ İstenen sıcaklık (ondalık) AL  │ 1 byte (0-9) │
-    │ 0x02    │ İstenen sıcaklık (tam) AL      │ 1 byte       │
-    │ 0x03    │ Ortam sıcaklığı (ondalık) AL   │ 1 byte (0-9) │
-    │ 0x04    │ Ortam sıcaklığı (tam) AL       │ 1 byte       │
-    │ 0x05    │ Fan hızı AL                    │ 1 byte       │
-    │ 0x80|val│ Sıcaklık (ondalık) AYARLA      │ -            │
-    │ 0xC0|val│ Sıcaklık (tam) AYARLA          │ -            │
-    └─────────┴────────────────────────────────┴──────────────┘
+    UART Protokolü (R2.1.4-1): api.protocol.BOARD1_CHANNELS
+    - GET: desired_temp (0x02/0x01), ambient_temp (0x04/0x03), fan_speed (0x05)
+    - SET: 0xC0|tam + 0x80|ondalık → desired_temp (10.0-50.0°C)
     
     Örnek Kullanım:
         >>> ac = AirConditionerSystemConnection()
@@ -44,6 +38,13 @@ class AirConditionerSystemConnection(HomeAutomationSystemConnection):
         >>> ac.close()
     """
     
+    BOARD = "1"
+    # update() toplu okuma planı (GET vektörü + çözücü, protokol şemasından)
+    READ_PLAN = read_plan("1")
+    UPDATE_COMMANDS = READ_PLAN.commands
+    # setDesiredTemp() SET kodlayıcısı (aralık + 6 bit doğrulaması)
+    SET_ENCODER = set_encoder("1")
+    
     def __init__(self):
         """
         Constructor - Board #1 için başlangıç değerleri
@@ -62,66 +63,73 @@ class AirConditionerSystemConnection(HomeAutomationSystemConnection):
         2. İstenen sıcaklığı oku
         3. Fan hızını oku
         
+        Toplu modda (pipelined, varsayılan) beş GET komutu tek
+        seferde gönderilir; 9600 baud'da tüm okuma ~10 ms sürer.
+        Cevaplardan biri eksikse komutlar byte byte tekrarlanır
+        (setBatchFallback(False) ile kapatılırsa o turdaki değerler
+        güncellenmez, son bilinen değerler korunur).
+        
         Returns:
             bool: Tüm okumalar başarılı ise True
             
         Example:
-            >>> ac.update()
-            ✓ Veriler güncellendi
-              Ortam Sıcaklığı: 22.5°C
-              İstenen Sıcaklık: 24.0°C
-              Fan Hızı: 3 rps
+            >>> ac.update()     # çıktı yok; günlük isteğe bağlıdır (api.log)
+            True
+            >>> configure("debug")  # değerler ve byte izleri konsola
         """
         try:
-            print("\n📥 Board #1'den veriler okunuyor...")
+            _log.debug("📥 Board #1'den veriler okunuyor...")
             
             # ─────────────────────────────────────────────────────
-            # 1. ORTAM SICAKLIĞINI OKU (DS18B20 - AMBIENT_TEMP)
+            # 0. GET KOMUTLARINI GÖNDER, CEVAPLARI TOPLA
             # ─────────────────────────────────────────────────────
-            self._send_byte(0x04)  # Komut: Ambient temp (integral)
-            temp_h = self._read_byte()
-            
-            self._send_byte(0x03)  # Komut: Ambient temp (fractional)
-            temp_l = self._read_byte()
+            # TTL'i dolmamış kanallar önbellekten gelir (api.read_cache)
+            fetched = set()
+            values = self.readChannels(fetched=fetched)
+            ambient = values["ambient_temp"]
+            desired = values["desired_temp"]
+            fan = values["fan_speed"]
             
-            if temp_h is not None and temp_l is not None:
-                self.ambientTemperature = float(temp_h) + float(temp_l) / 10.0
-                print(f"  ✓ Ortam Sıcaklığı: {self.ambientTemperature:.1f}°C")
+            # ─────────────────────────────────────────────────────
+            # 1. ORTAM SICAKLIĞI (DS18B20 - AMBIENT_TEMP)
+            # ─────────────────────────────────────────────────────
+            if ambient is not None:
+                self.ambientTemperature = ambient
+                _log.debug("  ✓ Ortam Sıcaklığı: %.1f°C", self.ambientTemperature)
             else:
-                print(f"  ✗ Ortam sıcaklığı okunamadı!")
+                _log.warning("  ✗ Ortam sıcaklığı okunamadı!")
             
             # ─────────────────────────────────────────────────────
-            # 2. İSTENEN SICAKLIĞI OKU (DESIRED_TEMP)
+            # 2. İSTENEN SICAKLIK (DESIRED_TEMP)
             # ─────────────────────────────────────────────────────
-            self._send_byte(0x02)  # Komut: Desired temp (integral)
-            des_h = self._read_byte()
-            
-            self._send_byte(0x01)  # Komut: Desired temp (fractional)
-            des_l = self._read_byte()
-            
-            if des_h is not None and des_l is not None:
-                self.desiredTemperature = float(des_h) + float(des_l) / 10.0
-                print(f"  ✓ İstenen Sıcaklık: {self.desiredTemperature:.1f}°C")
+            if desired is not None:
+                self.desiredTemperature = desired
+                _log.debug("  ✓ İstenen Sıcaklık: %.1f°C", self.desiredTemperature)
             else:
-                print(f"  ✗ İstenen sıcaklık okunamadı!")
+                _log.warning("  ✗ İstenen sıcaklık okunamadı!")
             
             # ─────────────────────────────────────────────────────
-            # 3. FAN HIZINI OKU (FAN_SPEED)
+            # 3. FAN HIZI (FAN_SPEED)
             # ─────────────────────────────────────────────────────
-            self._send_byte(0x05)  # Komut: Fan speed
-            fan = self._read_byte()
-            
             if fan is not None:
                 self.fanSpeed = int(fan)
-                print(f"  ✓ Fan Hızı: {self.fanSpeed} rps")
+                _log.debug("  ✓ Fan Hızı: %s rps", self.fanSpeed)
             else:
-                print(f"  ✗ Fan hızı okunamadı!")
+                _log.warning("  ✗ Fan hızı okunamadı!")
+            
+            # ─────────────────────────────────────────────────────
+            # 4. GEÇMİŞE KAYDET (yalnızca bu turda porttan okunanlar)
+            # ─────────────────────────────────────────────────────
+            self._record({name: values[name] for name in fetched})
             
-            print("✓ Veriler başarıyla güncellendi!\n")
+            if None in values.values():
+                _log.warning("⚠ Board #1 verileri kısmen güncellendi", extra={"event": "update", "fields": values})
+                return False
+            _log.info("✓ Board #1 verileri güncellendi", extra={"event": "update", "fields": values})
             return True
             
         except Exception as e:
-            print(f"✗ Update sırasında hata: {e}")
+            _log.error("✗ Update sırasında hata: %s", e)
             return False
     
     def setDesiredTemp(self, temperature):
@@ -140,60 +148,47 @@ class AirConditionerSystemConnection(HomeAutomationSystemConnection):
             
         Note:
             - 10-50°C arası geçerli
-            - Protokol: 0xC0|tam_kısım + 0x80|ondalık_kısım
+            - Değer 0.1°C'ye yuvarlanır (44.4 → tam=44, ondalık=4)
+            - Protokol: 0xC0|tam_kısım + 0x80|ondalık_kısım (api.protocol)
             
         Example:
-            >>> ac.setDesiredTemp(24.5)
-            ✓ Sıcaklık ayarlandı: 24.5°C
+            >>> ac.setDesiredTemp(24.5)   # günlük (api.log): ✓ Sıcaklık ayarlandı: 24.5°C
             True
             
-            >>> ac.setDesiredTemp(5.0)
-            ✗ Hata: Sıcaklık 10-50°C arası olmalı!
+            >>> ac.setDesiredTemp(5.0)    # günlük: ✗ Hata: İstenen sıcaklık 10-50 °C arası olmalı ...
             False
         """
         # ─────────────────────────────────────────────────────
-        # GEÇERLİLİK KONTROLÜ
+        # GEÇERLİLİK KONTROLÜ + KODLAMA (protokol şemasından)
         # ─────────────────────────────────────────────────────
-        if temperature < 10.0 or temperature > 50.0:
-            print(f"✗ Hata: Sıcaklık 10-50°C arası olmalı! (Girilen: {temperature:.1f}°C)")
-            print(f"  → Geçerli aralık: 10.0°C - 50.0°C")
+        # Örnek: 24.5°C → 0xD8 (11|24), 0x85 (10|5)
+        try:
+            cmd_h, cmd_l = self.SET_ENCODER.encode(temperature)
+        except ValueError as e:
+            _log.error("✗ Hata: %s", e)
             return False
         
         try:
-            # ─────────────────────────────────────────────────────
-            # SICAKLIK DEĞERINI TAM VE ONDALIK OLARAK AYIR
-            # ─────────────────────────────────────────────────────
-            # Örnek: 24.5°C → tam=24, ondalık=5
-            temp_h = int(temperature)                      # Tam kısım
-            temp_l = int((temperature - temp_h) * 10)     # Ondalık kısım
-            
-            print(f"📤 Sıcaklık ayarlanıyor: {temperature:.1f}°C")
-            print(f"   → Tam kısım: {temp_h}")
-            print(f"   → Ondalık kısım: {temp_l}")
-            
-            # ─────────────────────────────────────────────────────
-            # PDF'DEKİ PROTOKOLE GÖRE KOMUT GÖNDER
-            # ─────────────────────────────────────────────────────
-            # Format: 11XXXXXX (tam), 10XXXXXX (ondalık)
-            
-            # 1. Tam kısımı gönder (0xC0 = 11000000 binary)
-            cmd_h = 0xC0 | (temp_h & 0x3F)  # 0x3F = 00111111 (6-bit mask)
-            self._send_byte(cmd_h)
-            print(f"   → Komut gönderildi: 0x{cmd_h:02X} (tam kısım)")
-            
-            # 2. Ondalık kısımı gönder (0x80 = 10000000 binary)
-            cmd_l = 0x80 | (temp_l & 0x3F)
-            self._send_byte(cmd_l)
-            print(f"   → Komut gönderildi: 0x{cmd_l:02X} (ondalık kısım)")
-            
-            # PIC'in işlemesi için bekle
-            time.sleep(0.2)
-            
-            print(f"✓ Sıcaklık başarıyla ayarlandı: {temperature:.1f}°C\n")
+            _log.debug("📤 Sıcaklık ayarlanıyor: %.1f°C (tam=%d, ondalık=%d)",
+                       temperature, cmd_h & 0x3F, cmd_l & 0x3F)
+            
+            # 1. Tam kısımı (11XXXXXX), 2. ondalık kısımı (10XXXXXX) gönder.
+            # Çift kilit altında: araya başka iş parçacığının GET'i giremez
+            with self._wireLock:
+                sent = self._send_byte(cmd_h) and self._send_byte(cmd_l)
+            # Önbellekteki (ve o an okunmakta olan) eski değer kullanılmasın
+            self.readCache.invalidate(self.SET_ENCODER.channel.name)
+            if not sent:
+                _log.error("✗ Sıcaklık gönderilemedi: %.1f°C", temperature)
+                return False
+            _log.debug("   → Komut gönderildi: 0x%02X 0x%02X", cmd_h, cmd_l)
+            
+            _log.info("✓ Sıcaklık ayarlandı: %.1f°C", temperature,
+                      extra={"event": "set", "fields": {"desired_temp": temperature}})
             return True
             
         except Exception as e:
-            print(f"✗ Sıcaklık ayarlama hatası: {e}")
+            _log.error("✗ Sıcaklık ayarlama hatası: %s", e)
             return False
     
     # ═════════════════════════════════════════════════════════
@@ -0,0 +1,489 @@
+"""
+Home Automation System Connection - asyncio Sürümü
+EEM Projesi - Asenkron UART İletişim Sınıfları
+
+Bu modül HomeAutomationSystemConnection ve alt sınıflarının
+asyncio tabanlı kardeşlerini sağlar. Tek bir event loop, port
+başına thread açmadan birçok board'u ve birçok eşzamanlı
+istemciyi yönetebilir.
+
+Özellikler:
+- Seri port okuma event loop'a bağlıdır (POSIX: add_reader)
+- Cevap gelir gelmez tamamlanan GET işlemleri (komut başına deadline)
+- Toplu (pipelined) okuma ve byte byte geri dönüş
+- Aynı porttaki eşzamanlı istekler asyncio.Lock ile sıralanır
+"""
+
+import asyncio
+
+import serial
+
+from .air_conditioner import AirConditionerSystemConnection
+from .board_ready import READY_TIMEOUT, open_port, wait_ready_async
+from .curtain_control import CurtainControlSystemConnection
+from .log import get_logger
+
+_log = get_logger("api.async")
+
+
+class AsyncHomeAutomationSystemConnection:
+    """
+    Home Automation Sistemleri için asyncio bağlantı sınıfı
+
+    Seri port bloklamayan modda (timeout=0) açılır. POSIX
+    sistemlerde port dosya tanımlayıcısı event loop'a okuyucu
+    olarak eklenir; fileno() desteklemeyen platformlarda küçük bir
+    asyncio görevi gelen byte'ları toplar. Her iki durumda da ek
+    thread kullanılmaz.
+
+    Örnek Kullanım:
+        >>> ac = AsyncAirConditionerSystemConnection()
+        >>> ac.setComPort("/dev/ttyUSB0")
+        >>> await ac.open()
+        >>> await ac.update()
+        >>> await ac.setDesiredTemp(24.5)
+        >>> await ac.close()
+    """
+
+    def __init__(self):
+        """Constructor - Başlangıç değerleri"""
+        self.comPort = None
+        self.baudRate = 9600
+        self.ser = None
+        self.commandTimeout = 0.3  # Komut başına cevap süresi üst sınırı (s)
+        self.pipelined = True      # update(): GET komutlarını tek seferde gönder
+        self.batchFallback = True  # Toplu okuma eksikse byte byte tekrar dene
+        self.history = None        # TelemetryHistory (setHistory ile bağlanır)
+        self.dtrReset = True       # Port açılınca DTR kartı resetler (False: bekleme yok)
+        self.readyTimeout = READY_TIMEOUT  # Hazır olma yoklaması üst sınırı (s)
+        self.intWindow = False     # 1 byte'lık tam kısmı şemadaki pencereye aç (basınç)
+
+        self._loop = None
+        self._rx = bytearray()     # Event loop'un topladığı, henüz okunmamış byte'lar
+        self._rx_event = None
+        self._poll_task = None
+        self._lock = None          # Aynı porttaki işlemleri sıralar
+
+    def setComPort(self, port):
+        """
+        COM port numarasını ayarla
+
+        Args:
+            port (str): COM port adı (örn: "COM14", "/dev/pts/3")
+        """
+        self.comPort = port
+
+    def setBaudRate(self, baudrate):
+        """
+        Baud rate'i ayarla
+
+        Args:
+            baudrate (int): Baud rate değeri (varsayılan: 9600)
+        """
+        self.baudRate = baudrate
+
+    def setCommandTimeout(self, seconds):
+        """
+        Komut başına cevap bekleme süresini (deadline) ayarla
+
+        Args:
+            seconds (float): Üst sınır (varsayılan: 0.3 s)
+        """
+        self.commandTimeout = seconds
+
+    def setPipelined(self, enabled):
+        """
+        Toplu (pipelined) okuma modunu aç/kapat
+
+        Args:
+            enabled (bool): True = toplu mod, False = byte byte mod
+        """
+        self.pipelined = bool(enabled)
+
+    def setBatchFallback(self, enabled):
+        """
+        Toplu okumada cevap eksikse byte byte moda geri dönüşü aç/kapat
+
+        Args:
+            enabled (bool): True = eksik turda komutları tek tek tekrarla
+        """
+        self.batchFallback = bool(enabled)
+
+    def setDtrReset(self, enabled):
+        """
+        Port açılışında DTR reseti aç/kapat
+
+        Args:
+            enabled (bool): False = DTR düşük tutulur, hiç beklenmez
+        """
+        self.dtrReset = bool(enabled)
+
+    def setIntWindow(self, enabled):
+        """
+        1 byte'lık tam kısmın şemadaki pencereye açılmasını aç/kapat
+
+        Args:
+            enabled (bool): True = basınç 245 → 1013 hPa; False = ham byte
+        """
+        self.intWindow = bool(enabled)
+
+    def setReadyTimeout(self, seconds):
+        """
+        Reset sonrası hazır olma yoklamasının üst sınırını ayarla
+
+        Args:
+            seconds (float): Üst sınır (varsayılan: 2 s)
+        """
+        self.readyTimeout = float(seconds)
+
+    def setHistory(self, history):
+        """
+        update() sonuçlarının kaydedileceği geçmiş deposunu bağla
+
+        Args:
+            history (TelemetryHistory): Ortak depo (None = kaydetme)
+        """
+        self.history = history
+
+    def _record(self, values):
+        if self.history is not None:
+            self.history.record(values)
+
+    async def open(self):
+        """
+        Seri portu aç ve event loop'a bağla
+
+        Returns:
+            bool: Başarılı ise True, hata varsa False
+        """
+        if not self.comPort:
+            print("✗ Hata: COM port ayarlanmamış!")
+            return False
+
+        try:
+            # timeout=0: bloklamayan okuma
+            self.ser = open_port(self.comPort, self.baudRate, timeout=0, dtr_reset=self.dtrReset)
+            self.ser.reset_input_buffer()
+            self.ser.reset_output_buffer()
+            if self.dtrReset and await wait_ready_async(self.ser, self.readyTimeout) is None:
+                _log.warning("⚠ Kart %s s içinde cevap vermedi: %s", self.readyTimeout, self.comPort)
+        except serial.SerialException as e:
+            print(f"✗ Port açma hatası: {e}")
+            return False
+
+        self._loop = asyncio.get_running_loop()
+        self._rx.clear()
+        self._rx_event = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+        try:
+            self._loop.add_reader(self.ser.fileno(), self._on_readable)
+        except (AttributeError, NotImplementedError, OSError):
+            # fileno() yok (örn: Windows) → event loop içinde yoklama
+            self._poll_task = self._loop.create_task(self._poll_reader())
+        return True
+
+    async def close(self):
+        """
+        Seri portu kapat
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        if not self.is_open():
+            return False
+
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        else:
+            self._loop.remove_reader(self.ser.fileno())
+        self.ser.close()
+        return True
+
+    def is_open(self):
+        """
+        Port açık mı kontrol et
+
+        Returns:
+            bool: Port açık ise True
+        """
+        return self.ser is not None and self.ser.is_open
+
+    # ═════════════════════════════════════════════════════════
+    # EVENT LOOP OKUYUCU
+    # ═════════════════════════════════════════════════════════
+
+    def _on_readable(self):
+        """Port okunabilir olduğunda event loop tarafından çağrılır"""
+        try:
+            data = self.ser.read(self.ser.in_waiting or 1)
+        except Exception as e:
+            _log.error("✗ Byte okuma hatası: %s", e)
+            return
+        if data:
+            self._rx.extend(data)
+            self._rx_event.set()
+
+    async def _poll_reader(self):
+        """fileno() desteklenmiyorsa gelen byte'ları 1 ms aralıkla topla"""
+        while self.is_open():
+            if self.ser.in_waiting:
+                self._on_readable()
+            await asyncio.sleep(0.001)
+
+    async def _read_exact(self, count):
+        """
+        count byte gelene veya commandTimeout dolana kadar bekle
+
+        Returns:
+            bytes: Gelen byte'lar (timeout'ta count'tan kısa olabilir)
+        """
+        deadline = self._loop.time() + self.commandTimeout
+        while len(self._rx) < count:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            self._rx_event.clear()
+            try:
+                await asyncio.wait_for(self._rx_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        data = bytes(self._rx[:count])
+        del self._rx[:count]
+        return data
+
+    def _discard_input(self):
+        """Önceki timeout'tan kalan geç cevapları at"""
+        self.ser.reset_input_buffer()
+        self._rx.clear()
+
+    # ═════════════════════════════════════════════════════════
+    # İŞLEM (TRANSACTION) KATMANI
+    # ═════════════════════════════════════════════════════════
+
+    async def _send_bytes(self, cmds):
+        """
+        Cevapsız (SET) komut byte'larını gönder (internal method)
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        if not self.is_open():
+            _log.error("✗ Hata: Port açık değil!")
+            return False
+
+        async with self._lock:
+            try:
+                self.ser.write(bytes(cmds))
+                return True
+            except Exception as e:
+                _log.error("✗ Byte gönderme hatası: %s", e)
+                return False
+
+    async def _query(self, cmd):
+        """
+        GET komutu gönder ve cevabını bekle (internal method)
+
+        Returns:
+            int or None: Cevap byte'ı veya None (timeout/error)
+        """
+        replies = await self._transact([cmd])
+        return replies[0] if replies else None
+
+    async def _query_batch(self, cmds):
+        """
+        GET komut listesini tek seferde gönder, cevapları sırayla oku
+        (internal method)
+
+        Eksik cevapta sıra eşlemesine güvenilemeyeceği için tüm
+        liste None döner (bkz. HomeAutomationSystemConnection).
+
+        Returns:
+            list: Her komut için cevap byte'ı; eksik cevapta tümü None
+        """
+        replies = await self._transact(cmds)
+        if replies is None:
+            return [None] * len(cmds)
+        return replies
+
+    async def _query_many(self, cmds):
+        """
+        GET komut listesini mevcut moda göre çalıştır (internal method)
+
+        Returns:
+            list: Her komut için cevap byte'ı veya None
+        """
+        if self.pipelined:
+            replies = await self._query_batch(cmds)
+            if None not in replies or not self.batchFallback:
+                return replies
+        return [await self._query(cmd) for cmd in cmds]
+
+    async def _transact(self, cmds):
+        """
+        Komutları gönder, len(cmds) cevap byte'ı bekle
+
+        Returns:
+            list or None: Cevaplar; eksik cevap/hata durumunda None
+        """
+        if not self.is_open():
+            _log.error("✗ Hata: Port açık değil!")
+            return None
+
+        async with self._lock:
+            try:
+                self._discard_input()
+                self.ser.write(bytes(cmds))
+            except Exception as e:
+                _log.error("✗ Byte gönderme hatası: %s", e)
+                return None
+            data = await self._read_exact(len(cmds))
+
+        if len(data) != len(cmds):
+            return None
+        return list(data)
+
+
+class AsyncAirConditionerSystemConnection(AsyncHomeAutomationSystemConnection):
+    """
+    Board #1 ile asyncio iletişim - Klima Sistemi
+
+    Protokol AirConditionerSystemConnection ile aynıdır.
+    """
+
+    READ_PLAN = AirConditionerSystemConnection.READ_PLAN
+    UPDATE_COMMANDS = READ_PLAN.commands
+    SET_ENCODER = AirConditionerSystemConnection.SET_ENCODER
+
+    def __init__(self):
+        super().__init__()
+        self.ambientTemperature = 0.0    # Ortam sıcaklığı (°C)
+        self.desiredTemperature = 0.0    # İstenen sıcaklık (°C)
+        self.fanSpeed = 0                # Fan hızı (rps)
+
+    async def update(self):
+        """
+        Board #1'den tüm sensör verilerini oku
+
+        Okunamayan değerler için son bilinen değer korunur.
+
+        Returns:
+            bool: Tüm okumalar başarılı ise True
+        """
+        values = self.READ_PLAN.decode(await self._query_many(self.UPDATE_COMMANDS))
+        ambient, desired, fan = values["ambient_temp"], values["desired_temp"], values["fan_speed"]
+        if ambient is not None:
+            self.ambientTemperature = ambient
+        if desired is not None:
+            self.desiredTemperature = desired
+        if fan is not None:
+            self.fanSpeed = int(fan)
+        self._record(values)
+        return None not in values.values()
+
+    async def setDesiredTemp(self, temperature):
+        """
+        İstenen sıcaklığı ayarla (10.0°C - 50.0°C)
+
+        Returns:
+            bool: Başarılı ise True, geçersiz değer veya hata varsa False
+        """
+        try:
+            cmds = self.SET_ENCODER.encode(temperature)
+        except ValueError as e:
+            print(f"✗ Hata: {e}")
+            return False
+        return await self._send_bytes(cmds)
+
+    def getAmbientTemp(self):
+        """Son okunan ortam sıcaklığı (°C)"""
+        return self.ambientTemperature
+
+    def getDesiredTemp(self):
+        """Son okunan istenen sıcaklık (°C)"""
+        return self.desiredTemperature
+
+    def getFanSpeed(self):
+        """Son okunan fan hızı (rps)"""
+        return self.fanSpeed
+
+
+class AsyncCurtainControlSystemConnection(AsyncHomeAutomationSystemConnection):
+    """
+    Board #2 ile asyncio iletişim - Perde Kontrol Sistemi
+
+    Protokol CurtainControlSystemConnection ile aynıdır.
+    """
+
+    READ_PLAN = CurtainControlSystemConnection.READ_PLAN
+    UPDATE_COMMANDS = READ_PLAN.commands
+    SET_ENCODER = CurtainControlSystemConnection.SET_ENCODER
+    # Şema kanalı → özellik adı
+    ATTRIBUTES = {
+        "curtain": "curtainStatus",
+        "outdoor_temp": "outdoorTemperature",
+        "outdoor_press": "outdoorPressure",
+        "light": "lightIntensity",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.curtainStatus = 0.0         # Perde durumu (0=açık, 100=kapalı)
+        self.outdoorTemperature = 0.0    # Dış sıcaklık (°C)
+        self.outdoorPressure = 0.0       # Dış basınç (hPa)
+        self.lightIntensity = 0.0        # Işık şiddeti (Lux)
+
+    async def update(self):
+        """
+        Board #2'den tüm sensör verilerini oku
+
+        Okunamayan değerler için son bilinen değer korunur.
+
+        Returns:
+            bool: Tüm okumalar başarılı ise True
+        """
+        values = self.READ_PLAN.decode(await self._query_many(self.UPDATE_COMMANDS), self.intWindow)
+        for channel, name in self.ATTRIBUTES.items():
+            if values[channel] is not None:
+                setattr(self, name, values[channel])
+        self._record({
+            "outdoor_temp": values["outdoor_temp"],
+            "outdoor_press": values["outdoor_press"],
+            "light_intensity": values["light"],
+            "current_curtain": values["curtain"],
+        })
+        return None not in values.values()
+
+    async def setCurtainStatus(self, status):
+        """
+        Perde durumunu ayarla (0-100%)
+
+        Bilinen protokol sınırı: 6 bitlik SET yükü tek çiftte en fazla
+        %63.9 taşır; üstü gönderilmez, False döner (SetEncoder.wire_maximum)
+
+        Returns:
+            bool: Başarılı ise True, geçersiz değer veya hata varsa False
+        """
+        try:
+            cmds = self.SET_ENCODER.encode(status)
+        except ValueError as e:
+            print(f"✗ Hata: {e}")
+            return False
+        return await self._send_bytes(cmds)
+
+    def getOutdoorTemp(self):
+        """Son okunan dış sıcaklık (°C)"""
+        return self.outdoorTemperature
+
+    def getOutdoorPress(self):
+        """Son okunan dış basınç (hPa)"""
+        return self.outdoorPressure
+
+    def getLightIntensity(self):
+        """Son okunan ışık şiddeti (Lux)"""
+        return self.lightIntensity
+
+    def getCurtainStatus(self):
+        """Son okunan perde durumu (%)"""
+        return self.curtainStatus
@@ -0,0 +1,116 @@
+"""
+Board Hazır Olma Yoklaması
+EEM Projesi - Hızlı Bağlantı
+
+Seri port açılırken DTR hattı kalkar; DTR'si MCLR'ye bağlı kartlarda
+bu PIC'i resetler ve firmware açılana kadar gönderilen byte'lar
+kaybolur. Eskiden bunun için her açılışta koşulsuz 2 s (Board #2
+aracında 1 s) beklenirdi.
+
+Bunun yerine:
+- Zararsız bir GET (0x05: Board #1 fan hızı, Board #2 basınç
+  ondalığı) kısa aralıklarla gönderilir; ilk cevap gelince kart
+  hazırdır ve beklenmeden dönülür
+- Bekleme üst sınırı ayarlanabilir (ready_timeout); kart bu sürede
+  cevap vermezse bağlantı yine kurulur (eski davranış), yalnızca
+  uyarı yazılır
+- DTR reseti kapalıysa (dtr_reset=False) port DTR düşük tutularak
+  açılır, kart resetlenmez ve hiç beklenmez
+
+Kullanım:
+    ser = open_port("COM14", 9600, timeout=0.3, dtr_reset=True)
+    waited = wait_ready(ser, timeout=2.0)     # None = cevap yok
+"""
+
+import asyncio
+import time
+
+import serial
+
+PROBE_COMMAND = 0x05      # Her iki board'da da durum değiştirmeyen GET
+PROBE_INTERVAL = 0.05     # Cevapsız yoklamalar arası süre (s)
+READY_TIMEOUT = 2.0       # Eski sabit reset beklemesi kadar üst sınır (s)
+
+
+def open_port(port, baudrate=9600, timeout=0.3, dtr_reset=True):
+    """
+    Seri portu 8N1 olarak aç
+
+    Args:
+        port (str): Port adı (örn: "COM14", "/dev/ttyUSB0")
+        baudrate (int): Baud hızı
+        timeout (float): Okuma zaman aşımı (s)
+        dtr_reset (bool): False = DTR düşük tutulur (açılışta reset kenarı yok)
+
+    Returns:
+        serial.Serial: Açık port
+    """
+    ser = serial.Serial(baudrate=baudrate, bytesize=8, parity='N', stopbits=1, timeout=timeout)
+    ser.port = port
+    if not dtr_reset:
+        ser.dtr = False   # open() bu durumu uygular: PIC resetlenmez
+    ser.open()
+    return ser
+
+
+def wait_ready(ser, timeout=READY_TIMEOUT, probe=PROBE_COMMAND, interval=PROBE_INTERVAL):
+    """
+    Kart bir yoklamaya cevap verene kadar bekle
+
+    Her turda giriş tamponu temizlenir, probe gönderilir ve interval
+    kadar cevap beklenir. Dönüşte giriş tamponu boştur ve portun
+    okuma zaman aşımı eski değerine döner.
+
+    Args:
+        ser (serial.Serial): Açık port
+        timeout (float): Toplam bekleme üst sınırı (s)
+        probe (int): Gönderilecek GET komutu
+        interval (float): Tur başına cevap bekleme süresi (s)
+
+    Returns:
+        float or None: Hazır olana kadar geçen süre (s), cevap yoksa None
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    saved = ser.timeout
+    try:
+        while True:
+            ser.reset_input_buffer()
+            ser.write(bytes([probe]))
+            ser.flush()
+            ser.timeout = max(0.0, min(interval, deadline - time.monotonic()))
+            if ser.read(1):
+                return time.monotonic() - started
+            if time.monotonic() >= deadline:
+                return None
+    finally:
+        ser.timeout = saved
+        ser.reset_input_buffer()
+
+
+async def wait_ready_async(ser, timeout=READY_TIMEOUT, probe=PROBE_COMMAND, interval=PROBE_INTERVAL):
+    """
+    wait_ready()'nin event loop'u bloklamayan sürümü
+
+    Port bloklamayan modda (timeout=0) açılmış olmalıdır; cevap
+    in_waiting ile yoklanır.
+
+    Returns:
+        float or None: Hazır olana kadar geçen süre (s), cevap yoksa None
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    try:
+        while True:
+            ser.reset_input_buffer()
+            ser.write(bytes([probe]))
+            ser.flush()
+            sent = time.monotonic()
+            while time.monotonic() - sent < interval:
+                if ser.in_waiting:
+                    return time.monotonic() - started
+                if time.monotonic() >= deadline:
+                    return None
+                await asyncio.sleep(0.002)
+    finally:
+        ser.reset_input_buffer()
@@ -8,34 +8,26 @@ Bu modül Board #2 (PIC16F877A) ile iletişim kurarak
 perde kontrolü ve sensör okuma işlemlerini yapar.
 
 Özellikler:
-- Perde durumu ayarlama (0-100%)
+- Perde durumu ayarlama (0-100%; 6 bit SET yükü nedeniyle hatta en fazla %63.9)
 - Dış sıcaklık okuma (BMP180)
 - Dış basınç okuma (BMP180)
 - Işık şiddeti okuma (LDR)
 """
 
 from .home_automation import HomeAutomationSystemConnection
-import time
+from .log import get_logger
+from .protocol import read_plan, set_encoder
+
+_log = get_logger("api.board2")
 
 class CurtainControlSystemConnection(HomeAutomationSystemConnection):
     """
     Board #2 ile iletişim - Perde Kontrol Sistemi
     
-    UART Protokolü (R2.2.6-1 - PDF sayfa 18-19):
-    ┌─────────┬────────────────────────────────┬──────────────┐
-    │ Komut   │ Açıklama                       │ Cevap        │
-    ├─────────┼────────────────────────────────┼──────────────┤
-    │ 0x01    │ Perde durumu (ondalık) AL      │ 1 byte (0-9) │
-    │ 0x02    │ Perde durumu (tam) AL          │ 1 byte       │
-    │ 0x03    │ Dış sıcaklık (ondalık) AL      │ 1 byte (0-9) │
-    │ 0x04    │ Dış sıcaklık (tam) AL          │ 1 byte       │
-    │ 0x05    │ Dış basınç (ondalık) AL        │ 1 byte       │
-    │ 0x06    │ Dış basınç (tam) AL            │ 1 byte       │
-    │ 0x07    │ Işık (ondalık) AL              │ 1 byte       │
-    │ 0x08    │ Işık (tam) AL                  │ 1 byte       │
-    │ 0x80|val│ Perde (ondalık) AYARLA         │ -            │
-    │ 0xC0|val│ Perde (tam) AYARLA             │ -            │
-    └─────────┴────────────────────────────────┴──────────────┘
+    UART Protokolü (R2.2.6-1 - PDF sayfa 18-19): api.protocol.BOARD2_CHANNELS
+    - GET: curtain (0x02/0x01), outdoor_temp (0x04/0x03),
+      outdoor_press (0x06/0x05), light (0x08/0x07)
+    - SET: 0xC0|tam + 0x80|ondalık → curtain (6 bit yük: en fazla %63.9)
     
     Örnek Kullanım:
         >>> curtain = CurtainControlSystemConnection()
@@ -47,6 +39,13 @@ class CurtainControlSystemConnection(HomeAutomationSystemConnection):
         >>> curtain.close()
     """
     
+    BOARD = "2"
+    # update() toplu okuma planı (GET vektörü + çözücü, protokol şemasından)
+    READ_PLAN = read_plan("2")
+    UPDATE_COMMANDS = READ_PLAN.commands
+    # setCurtainStatus() SET kodlayıcısı (aralık + 6 bit doğrulaması)
+    SET_ENCODER = set_encoder("2")
+    
     def __init__(self):
         """
         Constructor - Board #2 için başlangıç değerleri
@@ -67,86 +66,85 @@ class CurtainControlSystemConnection(HomeAutomationSystemConnection):
         3. Işık şiddetini oku (LDR sensörü)
         4. Perde durumunu oku (Step motor pozisyonu)
         
+        Toplu modda (pipelined, varsayılan) sekiz GET komutu tek
+        seferde gönderilir ve cevaplar okuma planıyla tek geçişte
+        çözülür. Cevaplardan biri eksikse komutlar byte byte
+        tekrarlanır (setBatchFallback ile ayarlanabilir).
+        
         Returns:
             bool: Tüm okumalar başarılı ise True
             
         Example:
-            >>> curtain.update()
-            ✓ Veriler güncellendi
-              Dış Sıcaklık: 15.5°C
-              Dış Basınç: 1013.2 hPa
-              Işık: 450.0 Lux
-              Perde: %25.0
+            >>> curtain.update()     # çıktı yok; günlük isteğe bağlıdır (api.log)
+            True
+            >>> configure("debug")  # değerler ve byte izleri konsola
         """
         try:
-            print("\n📥 Board #2'den veriler okunuyor...")
+            _log.debug("📥 Board #2'den veriler okunuyor...")
             
             # ─────────────────────────────────────────────────────
-            # 1. DIŞ SICAKLIĞI OKU (BMP180 - OUTDOOR_TEMP)
+            # 0. GET KOMUTLARINI GÖNDER, CEVAPLARI TOPLA
             # ─────────────────────────────────────────────────────
-            self._send_byte(0x04)  # Komut: Outdoor temp (integral)
-            temp_h = self._read_byte()
+            # TTL'i dolmamış kanallar önbellekten gelir (api.read_cache)
+            fetched = set()
+            values = self.readChannels(fetched=fetched)
+            curtain = values["curtain"]
+            temp = values["outdoor_temp"]
+            press = values["outdoor_press"]
+            light = values["light"]
             
-            self._send_byte(0x03)  # Komut: Outdoor temp (fractional)
-            temp_l = self._read_byte()
-            
-            if temp_h is not None and temp_l is not None:
-                self.outdoorTemperature = float(temp_h) + float(temp_l) / 10.0
-                print(f"  ✓ Dış Sıcaklık: {self.outdoorTemperature:.1f}°C")
+            # ─────────────────────────────────────────────────────
+            # 1. DIŞ SICAKLIK (BMP180 - OUTDOOR_TEMP)
+            # ─────────────────────────────────────────────────────
+            if temp is not None:
+                self.outdoorTemperature = temp
+                _log.debug("  ✓ Dış Sıcaklık: %.1f°C", self.outdoorTemperature)
             else:
-                print(f"  ✗ Dış sıcaklık okunamadı!")
+                _log.warning("  ✗ Dış sıcaklık okunamadı!")
             
             # ─────────────────────────────────────────────────────
-            # 2. DIŞ BASINCI OKU (BMP180 - OUTDOOR_PRESS)
+            # 2. DIŞ BASINÇ (BMP180 - OUTDOOR_PRESS)
             # ─────────────────────────────────────────────────────
-            self._send_byte(0x06)  # Komut: Outdoor pressure (integral)
-            press_h = self._read_byte()
-            
-            self._send_byte(0x05)  # Komut: Outdoor pressure (fractional)
-            press_l = self._read_byte()
-            
-            if press_h is not None and press_l is not None:
-                # Basınç 300-1100 hPa arası (BMP180 özelliği)
-                self.outdoorPressure = float(press_h) + float(press_l) / 10.0
-                print(f"  ✓ Dış Basınç: {self.outdoorPressure:.1f} hPa")
+            if press is not None:
+                # Tam kısım 1 byte gelir; setIntWindow(True) ise 850-1100 hPa penceresine açılır
+                self.outdoorPressure = press
+                _log.debug("  ✓ Dış Basınç: %.1f hPa", self.outdoorPressure)
             else:
-                print(f"  ✗ Dış basınç okunamadı!")
+                _log.warning("  ✗ Dış basınç okunamadı!")
             
             # ─────────────────────────────────────────────────────
-            # 3. IŞIK ŞİDDETİNİ OKU (LDR - LIGHT_INTENSITY)
+            # 3. IŞIK ŞİDDETİ (LDR - LIGHT_INTENSITY)
             # ─────────────────────────────────────────────────────
-            self._send_byte(0x08)  # Komut: Light intensity (integral)
-            light_h = self._read_byte()
-            
-            self._send_byte(0x07)  # Komut: Light intensity (fractional)
-            light_l = self._read_byte()
-            
-            if light_h is not None and light_l is not None:
-                self.lightIntensity = float(light_h) + float(light_l) / 10.0
-                print(f"  ✓ Işık Şiddeti: {self.lightIntensity:.1f} Lux")
+            if light is not None:
+                self.lightIntensity = light
+                _log.debug("  ✓ Işık Şiddeti: %.1f Lux", self.lightIntensity)
             else:
-                print(f"  ✗ Işık şiddeti okunamadı!")
+                _log.warning("  ✗ Işık şiddeti okunamadı!")
             
             # ─────────────────────────────────────────────────────
-            # 4. PERDE DURUMUNU OKU (CURTAIN_STATE)
+            # 4. PERDE DURUMU (CURTAIN_STATE)
             # ─────────────────────────────────────────────────────
-            self._send_byte(0x02)  # Komut: Curtain status (integral)
-            curt_h = self._read_byte()
-            
-            self._send_byte(0x01)  # Komut: Curtain status (fractional)
-            curt_l = self._read_byte()
-            
-            if curt_h is not None and curt_l is not None:
-                self.curtainStatus = float(curt_h) + float(curt_l) / 10.0
-                print(f"  ✓ Perde Durumu: %{self.curtainStatus:.1f}")
+            if curtain is not None:
+                self.curtainStatus = curtain
+                _log.debug("  ✓ Perde Durumu: %%%.1f", self.curtainStatus)
             else:
-                print(f"  ✗ Perde durumu okunamadı!")
+                _log.warning("  ✗ Perde durumu okunamadı!")
             
-            print("✓ Veriler başarıyla güncellendi!\n")
+            # ─────────────────────────────────────────────────────
+            # 5. GEÇMİŞE KAYDET (yalnızca bu turda porttan okunanlar)
+            # ─────────────────────────────────────────────────────
+            keys = {"outdoor_temp": "outdoor_temp", "outdoor_press": "outdoor_press",
+                    "light": "light_intensity", "curtain": "current_curtain"}
+            self._record({keys[name]: values[name] for name in fetched})
+            
+            if None in values.values():
+                _log.warning("⚠ Board #2 verileri kısmen güncellendi", extra={"event": "update", "fields": values})
+                return False
+            _log.info("✓ Board #2 verileri güncellendi", extra={"event": "update", "fields": values})
             return True
             
         except Exception as e:
-            print(f"✗ Update sırasında hata: {e}")
+            _log.error("✗ Update sırasında hata: %s", e)
             return False
     
     def setCurtainStatus(self, status):
@@ -167,61 +165,53 @@ class CurtainControlSystemConnection(HomeAutomationSystemConnection):
             
         Note:
             - Step motor 10 step/% oranında döner (R2.2.1)
-            - 0-100% arası geçerli
-            - Protokol: 0xC0|tam_kısım + 0x80|ondalık_kısım
+            - 0-100% arası geçerli; bilinen protokol sınırı: SET yükü
+              6 bit olduğundan tek çiftle en fazla %63.9 gönderilebilir
+              (üstü reddedilir, SetEncoder.wire_maximum)
+            - Değer 0.1'e yuvarlanır
+            - Protokol: 0xC0|tam_kısım + 0x80|ondalık_kısım (api.protocol)
             
         Example:
-            >>> curtain.setCurtainStatus(50.0)
-            ✓ Perde ayarlandı: %50.0
+            >>> curtain.setCurtainStatus(50.0)   # günlük (api.log): ✓ Perde ayarlandı: %50.0
             True
             
-            >>> curtain.setCurtainStatus(150.0)
-            ✗ Hata: Perde %0-100 arası olmalı!
+            >>> curtain.setCurtainStatus(80.0)   # günlük: ✗ Hata: Perde en fazla 63.9 % gönderilebilir ...
             False
         """
         # ─────────────────────────────────────────────────────
-        # GEÇERLİLİK KONTROLÜ
+        # GEÇERLİLİK KONTROLÜ + KODLAMA (protokol şemasından)
         # ─────────────────────────────────────────────────────
-        if status < 0.0 or status > 100.0:
-            print(f"✗ Hata: Perde %0-100 arası olmalı! (Girilen: {status:.1f}%)")
-            print(f"  → Geçerli aralık: 0.0% (tam açık) - 100.0% (tam kapalı)")
+        # Örnek: 25.5% → 0xD9 (11|25), 0x85 (10|5)
+        try:
+            cmd_h, cmd_l = self.SET_ENCODER.encode(status)
+        except ValueError as e:
+            _log.error("✗ Hata: %s", e)
             return False
         
         try:
-            # ─────────────────────────────────────────────────────
-            # PERDE DEĞERINI TAM VE ONDALIK OLARAK AYIR
-            # ─────────────────────────────────────────────────────
-            # Örnek: 75.5% → tam=75, ondalık=5
-            status_h = int(status)                      # Tam kısım
-            status_l = int((status - status_h) * 10)   # Ondalık kısım
+            _log.debug("📤 Perde ayarlanıyor: %%%.1f (tam=%d, ondalık=%d)",
+                       status, cmd_h & 0x3F, cmd_l & 0x3F)
             
-            print(f"📤 Perde ayarlanıyor: %{status:.1f}")
-            print(f"   → Tam kısım: {status_h}")
-            print(f"   → Ondalık kısım: {status_l}")
+            # 1. Tam kısımı (11XXXXXX), 2. ondalık kısımı (10XXXXXX) gönder.
+            # Çift kilit altında: araya başka iş parçacığının GET'i giremez
+            with self._wireLock:
+                sent = self._send_byte(cmd_h) and self._send_byte(cmd_l)
+            # Önbellekteki (ve o an okunmakta olan) eski değer kullanılmasın
+            self.readCache.invalidate(self.SET_ENCODER.channel.name)
+            if not sent:
+                _log.error("✗ Perde gönderilemedi: %%%.1f", status)
+                return False
+            _log.debug("   → Komut gönderildi: 0x%02X 0x%02X", cmd_h, cmd_l)
             
-            # ─────────────────────────────────────────────────────
-            # PDF'DEKİ PROTOKOLE GÖRE KOMUT GÖNDER
-            # ─────────────────────────────────────────────────────
-            # Format: 11XXXXXX (tam), 10XXXXXX (ondalık)
-            
-            # 1. Tam kısımı gönder (0xC0 = 11000000 binary)
-            cmd_h = 0xC0 | (status_h & 0x3F)  # 0x3F = 00111111 (6-bit mask)
-            self._send_byte(cmd_h)
-            print(f"   → Komut gönderildi: 0x{cmd_h:02X} (tam kısım)")
+            # Not: Step motor hareketi arka planda sürer; konum
+            # update() ile getCurtainStatus() üzerinden izlenir.
             
-            # 2. Ondalık kısımı gönder (0x80 = 10000000 binary)
-            cmd_l = 0x80 | (status_l & 0x3F)
-            self._send_byte(cmd_l)
-            print(f"   → Komut gönderildi: 0x{cmd_l:02X} (ondalık kısım)")
-            
-            # Step motorun dönmesi için bekle
-            time.sleep(0.2)
-            
-            print(f"✓ Perde başarıyla ayarlandı: %{status:.1f}\n")
+            _log.info("✓ Perde ayarlandı: %%%.1f", status,
+                      extra={"event": "set", "fields": {"desired_curtain": status}})
             return True
             
         except Exception as e:
-            print(f"✗ Perde ayarlama hatası: {e}")
+            _log.error("✗ Perde ayarlama hatası: %s", e)
             return False
     
     # ═════════════════════════════════════════════════════════
@@ -249,8 +239,9 @@ class CurtainControlSystemConnection(HomeAutomationSystemConnection):
             float: Dış basınç (hPa)
             
         Note:
-            BMP180 sensörü: 300-1100 hPa arası
-            Güncel değer için önce update() çağırın
+            BMP180 sensörü 300-1100 hPa ölçer; firmware tam kısmın
+            düşük byte'ını gönderdiğinden 850-1100 hPa okunabilir
+            (api.protocol). Güncel değer için önce update() çağırın
         """
         return self.outdoorPressure
     
@@ -7,7 +7,15 @@ fonksiyonlarını sağlar.
 """
 
 import serial
-import time
+import threading
+
+from .board_ready import READY_TIMEOUT, open_port, wait_ready
+from .log import TIMEOUT, get_logger
+from .protocol import BOARDS, read_plan
+from .read_cache import ReadCache
+from .serial_broker import BrokerSerial, is_broker_url
+
+_log = get_logger("api")
 
 
 class HomeAutomationSystemConnection:
@@ -18,20 +26,38 @@ class HomeAutomationSystemConnection:
     - Port açma/kapama
     - Byte gönderme/okuma
     - Bağlantı yönetimi
+    - Kanal başına TTL'li okuma önbelleği (api.read_cache)
     """
     
+    # Alt sınıfta protokol şemasındaki board ("1" / "2")
+    BOARD = None
+    
     def __init__(self):
         """Constructor - Başlangıç değerleri"""
         self.comPort = None
         self.baudRate = 9600
         self.ser = None
+        self.commandTimeout = 0.3  # Komut başına cevap süresi üst sınırı (s)
+        self.pipelined = True      # update(): GET komutlarını tek seferde gönder
+        self.batchFallback = True  # Toplu okuma eksikse byte byte tekrar dene
+        self.dtrReset = True       # Port açılınca DTR kartı resetler (False: DTR düşük, bekleme yok)
+        self.readyTimeout = READY_TIMEOUT  # Reset sonrası hazır olma yoklaması üst sınırı (s)
+        self.intWindow = False     # 1 byte'lık tam kısmı şemadaki pencereye aç (basınç)
+        self.history = None        # TelemetryHistory (setHistory ile bağlanır)
+        # Aynı kanalı kısa aralıkla isteyenler porta tekrar gitmez (TTL: şemadan)
+        self.readCache = ReadCache.for_channels(BOARDS[self.BOARD]) if self.BOARD else ReadCache()
+        # Port üzerindeki her işlem (GET, toplu GET, SET çifti) bölünmeden sıralanır.
+        # Yeniden girilebilir: _fetch_channels kilidi tutarken _query/_query_batch çağırır
+        self._wireLock = threading.RLock()
     
     def setComPort(self, port):
         """
         COM port numarasını ayarla
         
         Args:
-            port (str): COM port adı (örn: "COM14", "COM1")
+            port (str): COM port adı (örn: "COM14", "COM1") ya da
+                paylaşımlı port aracısı ("broker:/tmp/eem-board1.sock",
+                bkz. api.serial_broker)
         """
         self.comPort = port
         print(f"✓ COM Port ayarlandı: {port}")
@@ -46,6 +72,145 @@ class HomeAutomationSystemConnection:
         self.baudRate = baudrate
         print(f"✓ Baud rate ayarlandı: {baudrate}")
     
+    def setCommandTimeout(self, seconds):
+        """
+        Komut başına cevap bekleme süresini (deadline) ayarla
+        
+        Her GET komutu cevap byte'ı gelir gelmez tamamlanır; bu süre
+        yalnızca cevap hiç gelmezse ne kadar bekleneceğini belirler.
+        
+        Args:
+            seconds (float): Üst sınır (varsayılan: 0.3 s)
+        """
+        self.commandTimeout = seconds
+        if self.ser and self.ser.is_open:
+            self.ser.timeout = seconds
+        print(f"✓ Komut zaman aşımı ayarlandı: {seconds} s")
+    
+    def setPipelined(self, enabled):
+        """
+        Toplu (pipelined) okuma modunu aç/kapat
+        
+        Açıkken update() tüm GET komutlarını tek bir write ile
+        gönderir ve cevapları tek bir read ile toplar. Kapalıyken
+        her komut ayrı bir istek/cevap işlemi olarak yapılır.
+        
+        Args:
+            enabled (bool): True = toplu mod, False = byte byte mod
+        """
+        self.pipelined = bool(enabled)
+        print(f"✓ Toplu okuma modu: {'AÇIK' if self.pipelined else 'KAPALI'}")
+    
+    def setBatchFallback(self, enabled):
+        """
+        Toplu okumada cevap eksikse byte byte moda geri dönüşü aç/kapat
+        
+        Args:
+            enabled (bool): True = eksik turda komutları tek tek tekrarla,
+                False = o turu atla (son bilinen değerler korunur)
+        """
+        self.batchFallback = bool(enabled)
+        print(f"✓ Byte byte geri dönüş: {'AÇIK' if self.batchFallback else 'KAPALI'}")
+    
+    def setDtrReset(self, enabled):
+        """
+        Port açılışında DTR reseti aç/kapat
+        
+        Args:
+            enabled (bool): True = DTR kalkar, kart resetlenir ve hazır
+                olana kadar yoklanır; False = DTR düşük tutulur, kart
+                resetlenmez ve hiç beklenmez
+        """
+        self.dtrReset = bool(enabled)
+        print(f"✓ DTR reseti: {'AÇIK' if self.dtrReset else 'KAPALI'}")
+    
+    def setIntWindow(self, enabled):
+        """
+        1 byte'lık tam kısmın şemadaki pencereye açılmasını aç/kapat
+        
+        Args:
+            enabled (bool): True = int_window tanımlı kanallar (basınç)
+                pencereye açılır (245 → 1013 hPa); False = ham byte
+        """
+        self.intWindow = bool(enabled)
+        print(f"✓ Tam kısım penceresi: {'AÇIK' if self.intWindow else 'KAPALI'}")
+    
+    def setReadyTimeout(self, seconds):
+        """
+        Reset sonrası hazır olma yoklamasının üst sınırını ayarla
+        
+        Args:
+            seconds (float): Kart bu sürede cevap vermezse bağlantı
+                yine de kurulur (uyarı yazılır)
+        """
+        self.readyTimeout = float(seconds)
+        print(f"✓ Hazır olma bekleme sınırı: {self.readyTimeout} s")
+    
+    def setHistory(self, history):
+        """
+        update() sonuçlarının kaydedileceği geçmiş deposunu bağla
+        
+        Args:
+            history (TelemetryHistory): Ortak depo (None = kaydetme)
+        """
+        self.history = history
+    
+    def setChannelTTL(self, name, seconds):
+        """
+        Kanalın okuma önbelleği süresini ayarla
+        
+        Args:
+            name (str): Kanal adı (örn: "fan_speed", "curtain")
+            seconds (float): TTL (0 = her okuma porta gider)
+        """
+        self.readCache.setTTL(name, seconds)
+        print(f"✓ {name} önbellek süresi: {seconds} s")
+    
+    def setReadCache(self, cache):
+        """
+        Okuma önbelleğini değiştir (aynı porta bağlı nesneler ortak
+        bir ReadCache paylaşabilir)
+        
+        Args:
+            cache (ReadCache): Önbellek
+        """
+        self.readCache = cache
+    
+    def readChannels(self, names=None, fetched=None):
+        """
+        Kanalları oku: TTL'i dolmamış değerler önbellekten gelir,
+        kalanlar tek bir toplu GET ile okunur
+        
+        Aynı kanalı okumakta olan başka bir iş parçacığı varsa onun
+        sonucu beklenir (istek birleştirme).
+        
+        Args:
+            names (tuple): Kanal adları (None = board'un tüm kanalları)
+            fetched (set): Verilirse porttan (önbellek dışı) okunanların
+                adları eklenir
+        
+        Returns:
+            dict: Kanal adı → değer veya None (okunamadı)
+        
+        Example:
+            >>> ac.readChannels(("ambient_temp",))
+            {'ambient_temp': 22.3}
+        """
+        if names is None:
+            names = tuple(ch.name for ch in BOARDS[self.BOARD])
+        return self.readCache.read(tuple(names), self._fetch_channels, fetched)
+    
+    def _fetch_channels(self, names):
+        """Önbellekte olmayan kanalları porttan oku (internal method)"""
+        plan = read_plan(self.BOARD, names)
+        with self._wireLock:
+            return plan.decode(self._query_many(plan.commands), self.intWindow)
+    
+    def _record(self, values):
+        """Okunan değerleri (varsa) geçmiş deposuna yaz (internal method)"""
+        if self.history is not None:
+            self.history.record(values)
+    
     def open(self):
         """
         Seri portu aç ve bağlantı kur
@@ -57,18 +222,23 @@ class HomeAutomationSystemConnection:
             print("✗ Hata: COM port ayarlanmamış!")
             return False
         
+        self.readCache.invalidate()  # Önceki bağlantıdan kalan değerler
         try:
-            self.ser = serial.Serial(
-                port=self.comPort,
-                baudrate=self.baudRate,
-                bytesize=8,
-                parity='N',
-                stopbits=1,
-                timeout=1
-            )
-            time.sleep(2)  # PIC reset bekleme
+            if is_broker_url(self.comPort):
+                # Port aracıda zaten açık: reset beklemesi yok
+                self.ser = BrokerSerial(self.comPort, timeout=self.commandTimeout)
+                print(f"✓ Aracıya bağlanıldı: {self.comPort}")
+                return True
+            self.ser = open_port(self.comPort, self.baudRate, self.commandTimeout, self.dtrReset)
             self.ser.reset_input_buffer()
             self.ser.reset_output_buffer()
+            if self.dtrReset:
+                # Sabit 2 s yerine: kart ilk yoklamaya cevap verince devam
+                waited = wait_ready(self.ser, self.readyTimeout)
+                if waited is None:
+                    _log.warning("⚠ Kart %s s içinde cevap vermedi: %s", self.readyTimeout, self.comPort)
+                else:
+                    _log.info("✓ Kart hazır (%.2f s)", waited)
             print(f"✓ Port açıldı: {self.comPort} @ {self.baudRate} baud")
             return True
         except serial.SerialException as e:
@@ -95,6 +265,10 @@ class HomeAutomationSystemConnection:
         """
         Tek byte gönder (internal method)
         
+        Sabit bir bekleme yapılmaz: byte hatta tamamen çıkınca
+        (flush) komut tamamlanmış sayılır. Cevabı olmayan SET
+        komutları bu yüzden iletim süresi kadar sürer.
+        
         Args:
             byte_val (int): Gönderilecek byte değeri (0-255)
         
@@ -102,15 +276,15 @@ class HomeAutomationSystemConnection:
             bool: Başarılı ise True
         """
         if not self.ser or not self.ser.is_open:
-            print("✗ Hata: Port açık değil!")
+            _log.error("✗ Hata: Port açık değil!")
             return False
         
         try:
             self.ser.write(bytes([byte_val]))
-            time.sleep(0.05)  # PIC işleme zamanı
+            self.ser.flush()  # Byte'ın UART'tan çıkmasını bekle
             return True
         except Exception as e:
-            print(f"✗ Byte gönderme hatası: {e}")
+            _log.error("✗ Byte gönderme hatası: %s", e)
             return False
     
     def _read_byte(self):
@@ -121,7 +295,7 @@ class HomeAutomationSystemConnection:
             int or None: Okunan byte değeri veya None (timeout/error)
         """
         if not self.ser or not self.ser.is_open:
-            print("✗ Hata: Port açık değil!")
+            _log.error("✗ Hata: Port açık değil!")
             return None
         
         try:
@@ -131,8 +305,96 @@ class HomeAutomationSystemConnection:
             else:
                 return None  # Timeout
         except Exception as e:
-            print(f"✗ Byte okuma hatası: {e}")
+            _log.error("✗ Byte okuma hatası: %s", e)
+            return None
+    
+    def _query(self, cmd):
+        """
+        GET komutu gönder ve cevabını bekle (internal method)
+        
+        İstek/cevap işlemi cevap byte'ı geldiği anda biter; cevap
+        gelmezse en fazla commandTimeout kadar beklenir. Önceki bir
+        zaman aşımından kalan geç cevaplar, yanlış komutla
+        eşleşmemesi için gönderimden önce atılır.
+        
+        Args:
+            cmd (int): GET komut byte'ı (örn: 0x04)
+        
+        Returns:
+            int or None: Cevap byte'ı veya None (timeout/error)
+        """
+        if not self.ser or not self.ser.is_open:
+            _log.error("✗ Hata: Port açık değil!")
             return None
+        
+        with self._wireLock:
+            try:
+                self.ser.reset_input_buffer()
+                self.ser.write(bytes([cmd]))
+            except Exception as e:
+                _log.error("✗ Byte gönderme hatası: %s", e)
+                return None
+            return self._read_byte()
+    
+    def _query_batch(self, cmds):
+        """
+        GET komut listesini tek seferde gönder, cevapları sırayla oku
+        (internal method)
+        
+        Firmware (UART_ProcessByte) her byte'ı geliş sırasıyla
+        cevapladığı için i. cevap i. komuta aittir. Tüm cevaplar için
+        toplam süre sınırı commandTimeout'tur.
+        
+        Eksik cevap durumunda hangi byte'ın kaybolduğu bilinemez
+        (sonraki cevaplar kayar), bu yüzden sıra eşlemesine
+        güvenilmez ve tüm liste None döner. Geç gelen byte'lar bir
+        sonraki işlemden önce giriş tamponundan atılır.
+        
+        Args:
+            cmds (list[int]): GET komut byte'ları (örn: [0x04, 0x03])
+        
+        Returns:
+            list: Her komut için cevap byte'ı; eksik cevapta tümü None
+        """
+        missing = [None] * len(cmds)
+        if not self.ser or not self.ser.is_open:
+            _log.error("✗ Hata: Port açık değil!")
+            return missing
+        
+        try:
+            with self._wireLock:
+                self.ser.reset_input_buffer()
+                self.ser.write(bytes(cmds))
+                data = self.ser.read(len(cmds))
+        except Exception as e:
+            _log.error("✗ Toplu okuma hatası: %s", e)
+            return missing
+        
+        if len(data) != len(cmds):
+            _log.warning("✗ Toplu okuma eksik: %s/%s cevap (timeout)", len(data), len(cmds), extra=TIMEOUT)
+            return missing
+        return list(data)
+    
+    def _query_many(self, cmds):
+        """
+        GET komut listesini mevcut moda göre çalıştır (internal method)
+        
+        Toplu modda _query_batch() kullanılır; cevap eksikse ve
+        batchFallback açıksa komutlar byte byte (_query) tekrarlanır.
+        Toplu mod kapalıysa doğrudan byte byte çalışır.
+        
+        Args:
+            cmds (list[int]): GET komut byte'ları
+        
+        Returns:
+            list: Her komut için cevap byte'ı veya None
+        """
+        if self.pipelined:
+            replies = self._query_batch(cmds)
+            if None not in replies or not self.batchFallback:
+                return replies
+            _log.warning("  → Byte byte moda geçiliyor...")
+        return [self._query(cmd) for cmd in cmds]
     
     def is_open(self):
         """
@@ -0,0 +1,144 @@
+"""
+Günlük (Logging) Altyapısı
+EEM Projesi - Seviyeli / Yapılandırılmış Günlük
+
+api/ ve uart_tools/ içindeki sıcak yollar (byte gönderme/okuma,
+update()) print() yerine "eem.*" logger'larına yazar:
+
+- Seviyeler: DEBUG (byte izleri), INFO (okunan değerler),
+  WARNING (timeout, eksik cevap), ERROR (port hataları)
+- Biçimlendirme tembeldir: mesaj yalnızca seviye açıksa üretilir;
+  DEBUG kapalıyken byte başına maliyet tek bir seviye kontrolüdür
+- Konsol isteğe bağlıdır: configure() çağrılmadıkça hiçbir şey
+  yazılmaz (kütüphane varsayılanı NullHandler)
+- Yapılandırılmış mod: her kayıt tek satırlık JSON (ts, level,
+  logger, event, msg, args + alanlar) olarak yazılır
+
+Kullanım:
+    from api.log import configure
+    configure("debug")                      # konsola okunabilir metin
+    configure("info", structured=True)      # konsola JSON satırları
+    configure("debug", file="uart.jsonl", structured=True, console=False)
+
+    EEM_LOG=debug python uart_tools/uart_board1.py      # ortam değişkeniyle
+    EEM_LOG=info:json python pc_app/gui_app.py
+"""
+
+import json
+import logging
+import os
+import sys
+
+ROOT_NAME = "eem"
+ENV_VAR = "EEM_LOG"
+DEBUG = logging.DEBUG   # Sıcak yollarda pahalı argümanlar için: if log.isEnabledFor(DEBUG)
+LEVELS = {"debug": logging.DEBUG, "info": logging.INFO, "warning": logging.WARNING,
+          "warn": logging.WARNING, "error": logging.ERROR, "critical": logging.CRITICAL}
+
+# Sıcak yollarda her çağrıda yeni sözlük oluşturmamak için hazır "extra"lar
+TX = {"event": "tx"}
+RX = {"event": "rx"}
+TIMEOUT = {"event": "timeout"}
+
+logging.getLogger(ROOT_NAME).addHandler(logging.NullHandler())
+
+
+def get_logger(name):
+    """'eem.<name>' logger'ı (örn: get_logger("uart.board1"))"""
+    return logging.getLogger(f"{ROOT_NAME}.{name}")
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Kaydı tek satırlık JSON'a çevir
+
+    Çıktı örneği:
+        {"ts": 1734000000.12, "level": "DEBUG", "logger": "eem.uart.board1",
+         "event": "tx", "msg": "→ Gönderildi: 0x04", "args": [4]}
+    """
+
+    def format(self, record):
+        data = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        event = getattr(record, "event", None)
+        if event is not None:
+            data["event"] = event
+        data["msg"] = record.getMessage()
+        if record.args and isinstance(record.args, tuple):
+            data["args"] = list(record.args)
+        fields = getattr(record, "fields", None)
+        if fields:
+            data.update(fields)
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def configure(level="info", console=True, structured=False, file=None, stream=None):
+    """
+    'eem' logger'ını yapılandır (önceki configure() ayarlarının yerine geçer)
+
+    Args:
+        level (str|int): "debug", "info", "warning", "error" veya logging sabiti
+            (bilinmeyen ad: INFO + uyarı)
+        console (bool): stderr'e (ya da stream'e) yaz
+        structured (bool): JSON satırları (False = okunabilir metin)
+        file (str): Ayrıca bu dosyaya ekle
+        stream: Konsol yerine kullanılacak akış (örn: sys.stdout)
+
+    Returns:
+        logging.Logger: 'eem' kök logger'ı
+    """
+    root = logging.getLogger(ROOT_NAME)
+    for handler in list(root.handlers):
+        if getattr(handler, "_eem", False):
+            root.removeHandler(handler)
+            handler.close()
+
+    unknown = None
+    if isinstance(level, str):
+        unknown = None if level.lower() in LEVELS else level
+        level = LEVELS.get(level.lower(), logging.INFO)
+    root.setLevel(level)
+
+    formatter = StructuredFormatter() if structured else logging.Formatter("%(message)s")
+    handlers = []
+    if console:
+        handlers.append(logging.StreamHandler(stream or sys.stderr))
+    if file:
+        handlers.append(logging.FileHandler(file, encoding="utf-8"))
+    for handler in handlers:
+        handler._eem = True
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    root.propagate = False
+    if unknown is not None:
+        root.warning("⚠ Bilinmeyen log seviyesi '%s', INFO kullanılıyor", unknown)
+    return root
+
+
+def configure_from_env(default=None, stream=None, file=None, console=True):
+    """
+    EEM_LOG ortam değişkenine göre yapılandır ("debug", "info:json", "off")
+
+    Args:
+        default (str): Değişken yoksa kullanılacak ayar (None = dokunma)
+        stream: Konsol akışı (interaktif araçlar için sys.stdout)
+        file (str): Ayrıca bu dosyaya yaz
+        console (bool): Konsola da yaz
+
+    Returns:
+        bool: Yapılandırma yapıldıysa True
+    """
+    spec = os.environ.get(ENV_VAR) or default
+    if not spec:
+        return False
+    level, _, fmt = spec.lower().partition(":")
+    if level == "off":
+        configure("critical", console=False)
+        return True
+    configure(level, console=console, structured=(fmt == "json"), file=file, stream=stream)
+    return True
@@ -0,0 +1,317 @@
+"""
+UART Protokol Tanımı
+EEM Projesi - Ortak Protokol Şeması
+
+Board #1 ve Board #2'nin UART protokolü tek bir bildirimsel
+şemada (kanallar) tanımlanır. Komut tabloları, çözücü tabloları,
+toplu okuma planları ve SET kodlayıcıları bu şemadan üretilir;
+api/ istemcileri, async API, uart_tools ve izleyici hep aynı
+tanımı kullanır. Yeni bir kanal eklemek tek satırlık bir
+şema değişikliğidir.
+
+Byte biçimi:
+    00000xxx : GET komutu (board'a göre 0x01-0x05 / 0x01-0x08)
+    11xxxxxx : SET tam kısım    (0xC0 | değer, 6 bit)
+    10xxxxxx : SET ondalık kısım (0x80 | değer, 6 bit)
+
+Değer ölçekleme: tam + ondalık / 10 (ondalık cevabı 0-9).
+GET cevapları 1 byte'tır ve varsayılan olarak olduğu gibi çözülür.
+decode(..., windowed=True) ile int_window tanımlı kanallarda tam
+kısım 256'lık pencereye açılır (basınç: 245 → 1013 hPa); pencerede
+maximum'u aşan değerler sarılmaz, okunamadı (None) sayılır.
+"""
+
+import math
+from collections import namedtuple
+
+SET_INT = 0xC0        # 11xxxxxx
+SET_FRAC = 0x80       # 10xxxxxx
+PAYLOAD_MASK = 0x3F   # 6 bit SET yükü
+
+# ═════════════════════════════════════════════════════════
+# ŞEMA
+# ═════════════════════════════════════════════════════════
+
+Channel = namedtuple("Channel", "name label unit int_code frac_code minimum maximum settable int_window ttl",
+                     defaults=(None, None, None, False, None, 0.1))
+Channel.__doc__ = """
+Tek bir ölçüm/ayar kanalı
+
+    name       : Kanal adı (telemetri anahtarı)
+    label      : Türkçe etiket (komut açıklamaları bundan üretilir)
+    int_code   : Tam kısım GET komutu
+    frac_code  : Ondalık kısım GET komutu (None = yalnızca tam sayı)
+    minimum,
+    maximum    : Geçerli aralık (SET doğrulaması; int_window'da okuma sınırı)
+    settable   : 0xC0/0x80 SET çifti bu kanalı ayarlar
+    int_window : Tam kısım 1 byte'a sığmıyorsa 256'lık pencerenin alt sınırı
+                 (yalnızca decode(windowed=True) ile uygulanır)
+    ttl        : Okuma önbelleğinde değerin geçerli kalma süresi (s, api.read_cache)
+"""
+
+BOARD1_CHANNELS = (
+    Channel("desired_temp", "İstenen sıcaklık", "°C", 0x02, 0x01, 10.0, 50.0, settable=True, ttl=0.5),
+    Channel("ambient_temp", "Ortam sıcaklığı", "°C", 0x04, 0x03, 0.0, 125.0, ttl=0.5),
+    # fan_rps yalnızca Temp_TMR1_ISR'de (saniyede bir) güncellenir
+    Channel("fan_speed", "Fan hızı", "rps", 0x05, None, 0, 255, ttl=1.0),
+)
+
+BOARD2_CHANNELS = (
+    # Hareket sırasında step motor konumu hızla değişir. Firmware %0-100 kabul eder;
+    # bilinen protokol sınırı: 6 bitlik SET yükü tek çiftte en fazla %63.9 taşır,
+    # SetEncoder üstünü reddeder (wire_maximum)
+    Channel("curtain", "Perde", "%", 0x02, 0x01, 0.0, 100.0, settable=True, ttl=0.1),
+    Channel("outdoor_temp", "Dış sıcaklık", "°C", 0x04, 0x03, 0.0, 85.0, ttl=1.0),
+    # Board #2 firmware'i depoda yok; kaynak kodu (baseline) ham byte'ı hPa olarak
+    # okur. simulator/board2 ise tam kısmın düşük byte'ını (hPa & 0xFF) gönderen bir
+    # firmware modeller. Bu kodlama doğrulanmadığından pencere isteğe bağlıdır
+    # (windowed=True / setIntWindow): 245 → 1013 hPa, 850-1100 hPa dışı None.
+    Channel("outdoor_press", "Dış basınç", "hPa", 0x06, 0x05, 850.0, 1100.0, int_window=850, ttl=1.0),
+    Channel("light", "Işık", "Lux", 0x08, 0x07, 0.0, 255.9, ttl=0.2),
+)
+
+BOARDS = {"1": BOARD1_CHANNELS, "2": BOARD2_CHANNELS}
+
+
+def channel(board, name):
+    """Board ve ada göre kanal tanımı (KeyError: tanımsız kanal)"""
+    for ch in BOARDS[board]:
+        if ch.name == name:
+            return ch
+    raise KeyError(f"Board #{board}: tanımsız kanal '{name}'")
+
+
+# ═════════════════════════════════════════════════════════
+# KOMUT TABLOLARI (şemadan üretilir)
+# ═════════════════════════════════════════════════════════
+
+Command = namedtuple("Command", "code channel part description")
+
+
+def _commands(channels):
+    commands = []
+    for ch in channels:
+        if ch.frac_code is None:
+            commands.append(Command(ch.int_code, ch.name, "int", f"{ch.label} AL"))
+        else:
+            commands.append(Command(ch.frac_code, ch.name, "frac", f"{ch.label} (ondalık) AL"))
+            commands.append(Command(ch.int_code, ch.name, "int", f"{ch.label} (tam) AL"))
+    return tuple(sorted(commands))
+
+
+BOARD1_COMMANDS = _commands(BOARD1_CHANNELS)
+BOARD2_COMMANDS = _commands(BOARD2_CHANNELS)
+
+# Profil adı → [(etiket, komutlar)], önce gelen kazanır.
+# "both": hat üzerindeki board bilinmiyorsa 0x01-0x05 Board #1 sayılır.
+PROFILES = {
+    "1": (("B1", BOARD1_COMMANDS),),
+    "2": (("B2", BOARD2_COMMANDS),),
+    "both": (("B1", BOARD1_COMMANDS), ("B2", BOARD2_COMMANDS)),
+}
+
+
+def describe(byte_val, profile="both"):
+    """
+    Tek byte'ın açıklaması (tablo üretimi için; sıcak döngüde
+    decode_table() kullanın)
+    """
+    if byte_val & SET_INT == SET_INT:
+        return f"SET (tam) = {byte_val & PAYLOAD_MASK}"
+    if byte_val & SET_FRAC:
+        return f"SET (ondalık) = {byte_val & PAYLOAD_MASK}"
+    for label, commands in PROFILES[profile]:
+        for cmd in commands:
+            if cmd.code == byte_val:
+                return f"[{label}] {cmd.description}"
+    return "Bilinmeyen komut"
+
+
+_TABLES = {}
+
+
+def decode_table(profile="both"):
+    """
+    256 elemanlı 'byte → açıklama' tablosu (profil başına bir kez üretilir)
+
+    Örnek Kullanım:
+        >>> table = decode_table("1")
+        >>> table[0x04]
+        '[B1] Ortam sıcaklığı (tam) AL'
+        >>> list(map(table.__getitem__, b"\\x01\\xDE"))   # bütün parça tek geçişte
+        ['[B1] İstenen sıcaklık (ondalık) AL', 'SET (tam) = 30']
+    """
+    table = _TABLES.get(profile)
+    if table is None:
+        table = _TABLES[profile] = tuple(describe(b, profile) for b in range(256))
+    return table
+
+
+def line_table(profile="both"):
+    """256 elemanlı 'byte → "0x04 (  4) | açıklama"' tablosu (log satırları için)"""
+    key = ("line", profile)
+    table = _TABLES.get(key)
+    if table is None:
+        names = decode_table(profile)
+        table = _TABLES[key] = tuple(f"0x{b:02X} ({b:3d}) | {names[b]}" for b in range(256))
+    return table
+
+
+# ═════════════════════════════════════════════════════════
+# TOPLU OKUMA PLANI (GET vektörü + cevap çözücü)
+# ═════════════════════════════════════════════════════════
+
+class ReadPlan:
+    """
+    Kanal listesi için önceden derlenmiş toplu GET planı
+
+    commands tek write ile gönderilir; decode() cevap listesini
+    kanal değerlerine çevirir. Eksik (None) ya da geçersiz cevap
+    (ondalık > 9; windowed=True iken pencere kanalında aralık dışı tam
+    kısım) olan kanal None olur, diğerleri etkilenmez.
+
+    Örnek Kullanım:
+        >>> plan = read_plan("1")
+        >>> plan.commands
+        (2, 1, 4, 3, 5)
+        >>> plan.decode([25, 0, 22, 3, 8])
+        {'desired_temp': 25.0, 'ambient_temp': 22.3, 'fan_speed': 8}
+    """
+
+    def __init__(self, channels):
+        commands = []
+        fields = []
+        for ch in channels:
+            high = len(commands)
+            commands.append(ch.int_code)
+            low = None
+            if ch.frac_code is not None:
+                low = len(commands)
+                commands.append(ch.frac_code)
+            limit = int(ch.maximum) if ch.int_window is not None else None
+            fields.append((ch.name, high, low, ch.int_window, limit))
+        self.channels = tuple(channels)
+        self.commands = tuple(commands)
+        self._fields = tuple(fields)
+
+    def decode(self, replies, windowed=False):
+        """
+        Args:
+            replies (list): commands sırasıyla cevap byte'ları (eksikler None)
+            windowed (bool): int_window tanımlı kanalları pencereye aç
+                (False = baseline gibi ham byte)
+
+        Returns:
+            dict: kanal adı → değer (float; ondalıksız kanallarda int) veya None
+        """
+        values = {}
+        for name, high, low, window, limit in self._fields:
+            value = replies[high]
+            if value is not None and window is not None and windowed:
+                value = window + (value - window) % 256
+                if value > limit:
+                    value = None        # pencerede ama aralık dışında: sarma
+            if low is not None:
+                frac = replies[low]
+                value = None if value is None or frac is None or frac > 9 else value + frac / 10.0
+            values[name] = value
+        return values
+
+
+def read_plan(board, names=None):
+    """
+    Board'un (ya da seçilen kanallarının) toplu okuma planı (önbellekli)
+
+    Args:
+        board (str): "1" veya "2"
+        names (tuple): Kanal adları (None = tümü, şema sırasıyla)
+    """
+    key = ("plan", board, names)
+    plan = _TABLES.get(key)
+    if plan is None:
+        channels = BOARDS[board] if names is None else tuple(channel(board, n) for n in names)
+        plan = _TABLES[key] = ReadPlan(channels)
+    return plan
+
+
+# ═════════════════════════════════════════════════════════
+# SET KODLAYICI
+# ═════════════════════════════════════════════════════════
+
+class SetEncoder:
+    """
+    Ayarlanabilir kanal için önceden hesaplanmış SET çifti tablosu
+
+    Değer 0.1'e yuvarlanır (44.4 → 0xEC 0x84; kesme hatası yok).
+    Aralık dışı değerler ve 6 bitlik yüke sığmayan tam kısımlar
+    (> 63) ValueError ile reddedilir; sessizce sarılmaz. İkincisi
+    bilinen bir protokol sınırıdır: perde şemada %0-100 ayarlanabilir,
+    ancak hatta en fazla wire_maximum (%63.9) gönderilebilir.
+
+    Örnek Kullanım:
+        >>> enc = set_encoder("1")
+        >>> enc.encode(30.5).hex()
+        'de85'
+        >>> enc.encode(55.0)
+        ValueError: İstenen sıcaklık 10-50 °C arası olmalı (girilen: 55.0)
+    """
+
+    def __init__(self, ch):
+        if not ch.settable:
+            raise ValueError(f"'{ch.name}' kanalı ayarlanamaz")
+        self.channel = ch
+        self._low = round(ch.minimum * 10)
+        self._high = round(ch.maximum * 10)
+        wire_high = min(self._high, PAYLOAD_MASK * 10 + 9)
+        self._table = tuple(bytes((SET_INT | t // 10, SET_FRAC | t % 10))
+                            for t in range(self._low, wire_high + 1))
+
+    @property
+    def wire_maximum(self):
+        """Tek SET çiftiyle gönderilebilen en büyük değer"""
+        return (self._low + len(self._table) - 1) / 10.0
+
+    def encode(self, value):
+        """
+        Returns:
+            bytes: [0xC0|tam, 0x80|ondalık]
+
+        Raises:
+            ValueError: Aralık dışı ya da protokole sığmayan değer
+        """
+        ch = self.channel
+        if not math.isfinite(value):
+            raise ValueError(f"{ch.label}: geçersiz değer ({value})")
+        tenths = round(value * 10)
+        if not self._low <= tenths <= self._high:
+            raise ValueError(f"{ch.label} {ch.minimum:g}-{ch.maximum:g} {ch.unit} arası olmalı (girilen: {value})")
+        index = tenths - self._low
+        if index >= len(self._table):
+            raise ValueError(f"{ch.label} en fazla {self.wire_maximum:.1f} {ch.unit} gönderilebilir: "
+                             f"SET yükü 6 bit (girilen: {value})")
+        return self._table[index]
+
+
+def set_encoder(board):
+    """Board'un ayarlanabilir kanalı için SET kodlayıcı (önbellekli)"""
+    key = ("set", board)
+    encoder = _TABLES.get(key)
+    if encoder is None:
+        settable = [ch for ch in BOARDS[board] if ch.settable]
+        encoder = _TABLES[key] = SetEncoder(settable[0])
+    return encoder
+
+
+def decode_set(int_payload, frac_payload, board=None):
+    """
+    SET çiftini (6 bit yükler) değere çevir
+
+    Returns:
+        tuple: (değer, geçerli_mi) - board verilirse aralık da denetlenir
+    """
+    value = int_payload + frac_payload / 10.0
+    valid = frac_payload <= 9
+    if valid and board is not None:
+        ch = set_encoder(board).channel
+        valid = ch.minimum <= value <= ch.maximum
+    return value, valid
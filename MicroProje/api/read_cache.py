@@ -0,0 +1,141 @@
+"""
+Kanal Okuma Önbelleği
+EEM Projesi - TTL Önbellek + İstek Birleştirme
+
+Aynı kanalı kısa aralıklarla isteyen tüketiciler (GUI paneli,
+klima sekmesi, otomasyon kuralı) her seferinde ayrı bir seri
+port işlemi başlatmasın diye kanal başına son okunan değer
+saklanır:
+
+- Her kanalın kendi TTL'i vardır (api.protocol şemasındaki
+  Channel.ttl; örn. fan hızı Temp_TMR1_ISR'de saniyede bir
+  değişir, perde konumu hareket sırasında hızla değişir)
+- TTL dolmamış değer porta gitmeden döner; TTL'den eski değer
+  asla döndürülmez
+- Aynı kanal zaten okunuyorsa (in-flight) yeni okuma başlatılmaz,
+  o okumanın sonucu beklenir
+- SET sonrası kanal geçersiz kılınır (invalidate); SET'ten önce
+  başlamış bir okumanın sonucu önbelleğe yazılmaz
+
+TTL 0 olan kanal önbelleğe alınmaz (her istek porta gider, yine de
+eşzamanlı istekler birleştirilir).
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+
+class ReadCache:
+    """
+    Kanal adı → (değer, okunma zamanı) önbelleği
+
+    Örnek Kullanım:
+        >>> cache = ReadCache({"fan_speed": 1.0, "ambient_temp": 0.5})
+        >>> cache.read(("ambient_temp", "fan_speed"), fetch)   # fetch(names) → dict
+        {'ambient_temp': 22.3, 'fan_speed': 8}
+        >>> cache.invalidate("ambient_temp")
+    """
+
+    def __init__(self, ttl=None, default_ttl=0.0, clock=time.monotonic):
+        """
+        Args:
+            ttl (dict): Kanal adı → TTL (s)
+            default_ttl (float): ttl'de olmayan kanalların TTL'i
+            clock: Zaman kaynağı (test için değiştirilebilir)
+        """
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+        self._values = {}       # ad → (değer, zaman)
+        self._inflight = {}     # ad → Future (okunuyor)
+        self._generation = {}   # ad → invalidate sayacı
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_channels(cls, channels):
+        """Şema kanallarının TTL'leriyle önbellek oluştur"""
+        return cls({ch.name: ch.ttl for ch in channels})
+
+    def setTTL(self, name, seconds):
+        """Tek kanalın TTL'ini değiştir (0 = önbellekleme yok)"""
+        with self._lock:
+            self.ttl[name] = max(0.0, float(seconds))
+            self._values.pop(name, None)
+
+    def lookup(self, name):
+        """TTL'i dolmamış değer veya None (porta gitmez)"""
+        with self._lock:
+            return self._fresh(name, self.clock())
+
+    def invalidate(self, name=None):
+        """Kanalı (None = tümü) geçersiz kıl; süren okumaların sonucu saklanmaz"""
+        with self._lock:
+            names = list(set(self._values) | set(self._inflight)) if name is None else [name]
+            for key in names:
+                self._values.pop(key, None)
+                self._generation[key] = self._generation.get(key, 0) + 1
+
+    def read(self, names, fetch, fetched=None):
+        """
+        Kanalları önbellekten ya da tek bir fetch çağrısıyla oku
+
+        Args:
+            names (tuple): Kanal adları (fetch'e bu sırayla iletilir)
+            fetch: fetch(adlar) → {ad: değer veya None}; yalnızca
+                taze olmayan ve başka bir okumada olmayan kanallar için
+                çağrılır
+            fetched (set): Verilirse bu çağrıda porttan okunan kanal
+                adları eklenir (geçmişe yalnızca yeni örnekleri yazmak için)
+
+        Returns:
+            dict: ad → değer (okunamayan kanal None)
+        """
+        values = {}
+        claimed = []
+        waiting = {}
+        with self._lock:
+            now = self.clock()
+            for name in names:
+                value = self._fresh(name, now)
+                if value is not None:
+                    self.stats["hits"] += 1
+                    values[name] = value
+                elif name in self._inflight:
+                    self.stats["coalesced"] += 1
+                    waiting[name] = self._inflight[name]
+                else:
+                    self.stats["misses"] += 1
+                    claimed.append(name)
+                    self._inflight[name] = Future()
+            generations = {name: self._generation.get(name, 0) for name in claimed}
+            started = now   # Değerin yaşı isteğin gönderildiği andan sayılır
+
+        if claimed:
+            result = {}
+            try:
+                result = fetch(tuple(claimed))
+            finally:
+                with self._lock:
+                    for name in claimed:
+                        value = result.get(name)
+                        if value is not None and self._generation.get(name, 0) == generations[name]:
+                            self._values[name] = (value, started)
+                        self._inflight.pop(name).set_result(value)
+                        values[name] = value
+            if fetched is not None:
+                fetched.update(name for name in claimed if values[name] is not None)
+
+        for name, future in waiting.items():
+            values[name] = future.result()
+        return {name: values.get(name) for name in names}
+
+    def _fresh(self, name, now):
+        entry = self._values.get(name)
+        if entry is None:
+            return None
+        value, stamp = entry
+        if now - stamp < self.ttl.get(name, self.default_ttl):
+            return value
+        return None
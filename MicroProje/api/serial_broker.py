@@ -0,0 +1,421 @@
+"""
+Seri Port Aracısı (Broker)
+EEM Projesi - Paylaşımlı Board Bağlantısı
+
+Her board'un seri portunu tek bir süreç bir kez açar (PIC reset
+beklemesi yalnızca aracı başlarken ödenir) ve yerel bir soket
+üzerinden birçok istemciye paylaştırır:
+
+- İşlemler port başına tek iş parçacığında, sırayla hatta çıkar
+- Aynı anda bekleyen özdeş GET vektörleri tek hat işleminde
+  birleştirilir (coalescing); cevap hepsine dağıtılır
+- Bir SET'ten sonra gelen GET, SET'ten önceki bir işleme eklenmez
+
+İstemci tarafı BrokerSerial, pyserial'ın istemcilerin kullandığı
+alt kümesini (write/read/flush/reset_input_buffer/close) taklit
+eder. Port adı "broker:<yol>" (Unix soket) ya da
+"broker:<host>:<port>" (TCP; AF_UNIX olmayan sistemler için)
+verildiğinde api/ ve uart_tools/ istemcileri beklemeden bağlanır.
+
+Çerçeve biçimi (little-endian):
+    istek : işlem u8 (1=GET, 2=SET, 3=PING) | uzunluk u16 | byte'lar
+    cevap : durum u8 (0=tamam, 1=eksik cevap, 2=hata) | uzunluk u16 | byte'lar
+
+Kullanım:
+    python -m api.serial_broker --port COM14 --socket /tmp/eem-board1.sock
+    (istemci) ac.setComPort("broker:/tmp/eem-board1.sock")
+"""
+
+import argparse
+import os
+import queue
+import socket
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import Future
+
+import serial
+
+from .board_ready import READY_TIMEOUT, open_port, wait_ready
+from .protocol import SET_INT
+
+URL_PREFIX = "broker:"
+
+OP_GET = 1
+OP_SET = 2
+OP_PING = 3
+
+STATUS_OK = 0
+STATUS_PARTIAL = 1   # Board cevaplarının bir kısmı timeout içinde gelmedi
+STATUS_ERROR = 2
+
+_FRAME = struct.Struct("<BH")
+STOPPED = (STATUS_ERROR, "Aracı durduruldu".encode("utf-8"))
+
+
+def is_broker_url(port):
+    """Port adı bir aracı adresi mi ("broker:...")"""
+    return isinstance(port, str) and port.startswith(URL_PREFIX)
+
+
+def _address(url):
+    """"broker:/tmp/x.sock" → (AF_UNIX, yol); "broker:host:port" → (AF_INET, (host, port))"""
+    target = url[len(URL_PREFIX):] if is_broker_url(url) else url
+    host, sep, port = target.rpartition(":")
+    if sep and port.isdigit() and "/" not in target and "\\" not in target:
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    return socket.AF_UNIX, target
+
+
+def _recv_exact(sock, count):
+    buf = bytearray()
+    while len(buf) < count:
+        chunk = sock.recv(count - len(buf))
+        if not chunk:
+            raise ConnectionError("Aracı bağlantısı kapandı")
+        buf += chunk
+    return bytes(buf)
+
+
+def _send_frame(sock, code, payload=b""):
+    sock.sendall(_FRAME.pack(code, len(payload)) + payload)
+
+
+def _recv_frame(sock):
+    code, length = _FRAME.unpack(_recv_exact(sock, _FRAME.size))
+    return code, _recv_exact(sock, length) if length else b""
+
+
+# ═════════════════════════════════════════════════════════
+# ARACI (SUNUCU)
+# ═════════════════════════════════════════════════════════
+
+class BoardBroker:
+    """
+    Tek board portunun sahibi olan aracı
+
+    Örnek Kullanım:
+        >>> broker = BoardBroker("COM14", "/tmp/eem-board1.sock").start()
+        >>> # istemciler: setComPort("broker:/tmp/eem-board1.sock")
+        >>> broker.stop()
+    """
+
+    def __init__(self, port, address, baudrate=9600, timeout=0.3, ready_timeout=READY_TIMEOUT, dtr_reset=True):
+        """
+        Args:
+            port (str): Board'un seri portu
+            address (str): Dinlenecek soket ("/tmp/x.sock" ya da "127.0.0.1:8765")
+            timeout (float): GET işlemi başına cevap bekleme üst sınırı (s)
+            ready_timeout (float): Port açılınca hazır olma yoklaması üst sınırı (s)
+            dtr_reset (bool): False = DTR düşük tutulur, kart resetlenmez, beklenmez
+        """
+        self.port = port
+        self.address = address
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.ready_timeout = ready_timeout
+        self.dtr_reset = dtr_reset
+        self.ser = None
+        self.stats = {"clients": 0, "requests": 0, "transactions": 0, "coalesced": 0, "errors": 0}
+
+        self._queue = queue.Queue()
+        self._joinable = {}          # GET vektörü → henüz tamamlanmamış Future
+        self._lock = threading.Lock()
+        self._server = None
+        self._running = False
+        self._threads = []
+
+    def start(self):
+        """Portu aç, soketi dinlemeye başla"""
+        self.ser = open_port(self.port, self.baudrate, self.timeout, self.dtr_reset)
+        if self.dtr_reset:
+            wait_ready(self.ser, self.ready_timeout)  # PIC reset (aracı başına bir kez)
+        self.ser.reset_input_buffer()
+
+        family, addr = _address(self.address)
+        try:
+            if family == socket.AF_UNIX and os.path.exists(addr):
+                os.remove(addr)      # Önceki çalıştırmadan kalan soket dosyası
+            self._server = socket.socket(family, socket.SOCK_STREAM)
+            if family == socket.AF_INET:
+                self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._server.bind(addr)
+            self._server.listen(16)
+            self._server.settimeout(0.2)
+        except OSError:
+            # Dinlenemiyorsa port da açık kalmasın (yeniden denemede "port meşgul" olmasın)
+            if self._server is not None:
+                self._server.close()
+                self._server = None
+            self.ser.close()
+            raise
+
+        self._running = True
+        for target, name in ((self._port_loop, "broker-port"), (self._accept_loop, "broker-accept")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        """Dinlemeyi bırak, kuyruktakileri bitir, portu kapat"""
+        with self._lock:
+            self._running = False    # Bundan sonraki submit() kuyruğa eklemez
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(2)
+        self._threads = []
+        # Port iş parçacığının işlemediği her istek hata ile sonuçlanır (bekleyen istemci kalmaz)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[2].set_result(STOPPED)
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            family, addr = _address(self.address)
+            if family == socket.AF_UNIX and os.path.exists(addr):
+                os.remove(addr)
+        if self.ser is not None and self.ser.is_open:
+            self.ser.close()
+
+    def submit(self, op, payload):
+        """
+        İşlemi port kuyruğuna ekle
+
+        Özdeş bir GET vektörü zaten bekliyor ya da hattaysa yeni işlem
+        açılmaz, onun sonucu paylaşılır.
+
+        Returns:
+            Future: (durum, cevap byte'ları)
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            if not self._running:
+                future = Future()
+                future.set_result(STOPPED)
+                return future
+            if op == OP_GET:
+                future = self._joinable.get(payload)
+                if future is not None:
+                    self.stats["coalesced"] += 1
+                    return future
+                future = self._joinable[payload] = Future()
+            else:
+                # SET'ten sonraki GET'ler eski (SET öncesi) işlemlere eklenmez
+                self._joinable.clear()
+                future = Future()
+            self._queue.put((op, payload, future))
+        return future
+
+    # ─────────────────────────────────────────────────────
+    # İŞ PARÇACIKLARI
+    # ─────────────────────────────────────────────────────
+
+    def _port_loop(self):
+        """Port kuyruğunu sırayla hatta çıkar (porta dokunan tek iş parçacığı)"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            op, payload, future = item
+            try:
+                if op == OP_GET:
+                    self.ser.reset_input_buffer()
+                    self.ser.write(payload)
+                    data = self.ser.read(len(payload))
+                    result = (STATUS_OK if len(data) == len(payload) else STATUS_PARTIAL, data)
+                else:
+                    self.ser.write(payload)
+                    self.ser.flush()
+                    result = (STATUS_OK, b"")
+                counter = "transactions"
+            except Exception as e:
+                counter = "errors"
+                result = (STATUS_ERROR, str(e).encode("utf-8", "replace")[:1024])
+            with self._lock:
+                self.stats[counter] += 1
+                if self._joinable.get(payload) is future:
+                    del self._joinable[payload]
+            future.set_result(result)
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            conn.settimeout(None)
+            with self._lock:
+                self.stats["clients"] += 1
+            threading.Thread(target=self._serve_client, args=(conn,), name="broker-client", daemon=True).start()
+
+    def _serve_client(self, conn):
+        """Tek istemcinin isteklerini sırayla yanıtla"""
+        with conn:
+            try:
+                while self._running:
+                    op, payload = _recv_frame(conn)
+                    if op == OP_PING:
+                        _send_frame(conn, STATUS_OK, self.port.encode("utf-8"))
+                    elif op in (OP_GET, OP_SET) and payload:
+                        _send_frame(conn, *self.submit(op, payload).result())
+                    else:
+                        _send_frame(conn, STATUS_ERROR, "Geçersiz istek".encode("utf-8"))
+            except (ConnectionError, OSError):
+                pass
+
+
+# ═════════════════════════════════════════════════════════
+# İSTEMCİ (pyserial benzeri)
+# ═════════════════════════════════════════════════════════
+
+class BrokerSerial:
+    """
+    Aracıya bağlı, serial.Serial yerine kullanılabilen port nesnesi
+
+    GET byte'ları (bit7 = 0) biriktirilir ve ilk read() çağrısında
+    tek GET işlemi olarak gönderilir. Böylece istemcilerin
+    write(komutlar) + read(n) kalıbı tek bir aracı işlemine dönüşür.
+
+    SET tam kısmı (0xC0|x) ondalık kısmı (0x80|y) gelene kadar
+    tutulur ve çift tek SET işlemi olarak gönderilir: istemciler
+    byte'ları ayrı write() çağrılarıyla yazsa da başka istemcinin
+    SET'i hatta araya giremez. Ondalığı gelmeden kapatılan tam kısım
+    gönderilmez (firmware de onu tek başına uygulamazdı).
+
+    Örnek Kullanım:
+        >>> ser = BrokerSerial("broker:/tmp/eem-board1.sock")
+        >>> ser.write(bytes([0x04, 0x03]))
+        >>> ser.read(2)
+        b'\\x16\\x03'
+    """
+
+    def __init__(self, url, timeout=0.3, connect_timeout=2.0):
+        family, addr = _address(url)
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.settimeout(connect_timeout)
+        try:
+            self._sock.connect(addr)
+        except OSError as e:
+            self._sock.close()
+            raise serial.SerialException(f"Aracıya bağlanılamadı ({url}): {e}")
+        self._sock.settimeout(None)
+        self.port = url
+        self.timeout = timeout       # Uyumluluk için; cevap süresini aracı sınırlar
+        self.is_open = True
+        self._pending = bytearray()  # Henüz gönderilmemiş GET byte'ları
+        self._set_int = None         # Ondalık kısmını bekleyen SET tam kısmı
+        self._rx = bytearray()       # Alınmış, okunmamış cevaplar
+
+    @property
+    def in_waiting(self):
+        return len(self._rx)
+
+    def _request(self, op, payload):
+        if not self.is_open:
+            raise serial.SerialException("Port kapalı")
+        try:
+            _send_frame(self._sock, op, payload)
+            code, data = _recv_frame(self._sock)
+        except (ConnectionError, OSError) as e:
+            raise serial.SerialException(f"Aracı bağlantı hatası: {e}")
+        if code == STATUS_ERROR:
+            raise serial.SerialException(data.decode("utf-8", "replace"))
+        return data
+
+    def _send_pending(self):
+        payload = bytes(self._pending)
+        self._pending.clear()
+        self._rx += self._request(OP_GET, payload)
+
+    def write(self, data):
+        data = bytes(data)
+        for byte_val in data:
+            if not byte_val & 0x80:
+                self._pending.append(byte_val)
+                continue
+            if self._pending:
+                self._send_pending()
+            if byte_val & SET_INT == SET_INT:
+                if self._set_int is not None:
+                    self._request(OP_SET, bytes((self._set_int,)))  # önceki tam kısım yerini korur
+                self._set_int = byte_val
+            elif self._set_int is not None:
+                # Tam + ondalık tek aracı işleminde: çift hatta bölünmez
+                self._request(OP_SET, bytes((self._set_int, byte_val)))
+                self._set_int = None
+            else:
+                self._request(OP_SET, bytes((byte_val,)))
+        return len(data)
+
+    def read(self, size=1):
+        if self._pending:
+            self._send_pending()
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        return data
+
+    def ping(self):
+        """Aracının sahip olduğu port adı"""
+        return self._request(OP_PING, b"").decode("utf-8")
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        self._pending.clear()
+        self._rx.clear()
+
+    def reset_output_buffer(self):
+        self._set_int = None
+
+    def close(self):
+        if self.is_open:
+            self.is_open = False
+            self._set_int = None
+            self._sock.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Board seri port aracısı")
+    parser.add_argument("--port", required=True, help="Board'un seri portu (örn: COM14, /dev/ttyUSB0)")
+    parser.add_argument("--socket", required=True,
+                        help="Dinlenecek adres: Unix soket yolu ya da host:port")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("--timeout", type=float, default=0.3, help="GET cevap zaman aşımı (s)")
+    parser.add_argument("--ready-timeout", type=float, default=READY_TIMEOUT,
+                        help="Açılışta kartın hazır olmasını bekleme üst sınırı (s)")
+    parser.add_argument("--no-dtr-reset", action="store_true", help="DTR'yi düşük tut (kart resetlenmez)")
+    args = parser.parse_args(argv)
+
+    broker = BoardBroker(args.port, args.socket, baudrate=args.baud, timeout=args.timeout,
+                         ready_timeout=args.ready_timeout, dtr_reset=not args.no_dtr_reset)
+    try:
+        broker.start()
+    except (serial.SerialException, OSError) as e:
+        print(f"✗ Aracı başlatılamadı: {e}")
+        return 1
+    print(f"✓ Aracı hazır: {args.port} → broker:{args.socket}")
+    sys.stdout.flush()
+    started = time.monotonic()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        broker.stop()
+        print(f"\n📊 {time.monotonic() - started:.0f} s: {broker.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
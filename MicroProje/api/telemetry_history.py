@@ -0,0 +1,212 @@
+"""
+Telemetry History - Sensör Geçmişi
+EEM Projesi - Zaman Serisi Deposu
+
+Her update() sonrası okunan değerler kanal başına sabit kapasiteli
+bir halka tamponda (ring buffer) saklanır. Grafik ve eğilim analizi
+için kartları tekrar sorgulamaya gerek kalmaz.
+
+- Zaman damgaları: time.monotonic() (float64, 'd')
+- Değerler: float32 ('f'); örnek başına 12 byte
+- Kapasite dolunca en eski örneğin üzerine yazılır; bellek sabit
+  kalır (varsayılan 100000 örnek ≈ 1.2 MB / kanal, 2 Hz'de ~14 saat)
+- Zaman penceresi sorguları bisect ile O(log n) bulunur; özetler
+  (min/max/ortalama) memoryview dilimleri üzerinden kopyasız hesaplanır
+"""
+
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class TelemetryChannel:
+    """
+    Tek bir sensör için halka tampon
+
+    Örnek Kullanım:
+        >>> ch = TelemetryChannel("ambient_temp", capacity=3)
+        >>> for t, v in ((1.0, 22.0), (2.0, 22.5), (3.0, 23.0), (4.0, 23.5)):
+        ...     ch.append(v, t)
+        >>> ch.window(2.5)
+        ([3.0, 4.0], [23.0, 23.5])
+    """
+
+    def __init__(self, name, capacity=100000):
+        if capacity < 1:
+            raise ValueError("Kapasite en az 1 olmalı")
+        self.name = name
+        self.capacity = capacity
+        self._t = array('d', bytes(8 * capacity))
+        self._v = array('f', bytes(4 * capacity))
+        self._values = memoryview(self._v)
+        self._head = 0    # Bir sonraki yazma konumu
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value, t=None):
+        """
+        Yeni örnek ekle
+
+        Args:
+            value (float): Okunan değer
+            t (float): Zaman damgası (varsayılan: time.monotonic());
+                öncekinden küçükse öncekine eşitlenir
+        """
+        if t is None:
+            t = time.monotonic()
+        with self._lock:
+            if self._count:
+                t = max(t, self._t[self._head - 1])
+            self._t[self._head] = t
+            self._v[self._head] = value
+            self._head = (self._head + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def latest(self):
+        """
+        Returns:
+            tuple or None: (zaman, değer) ya da kanal boşsa None
+        """
+        with self._lock:
+            if not self._count:
+                return None
+            return self._t[self._head - 1], self._v[self._head - 1]
+
+    # ─────────────────────────────────────────────────────
+    # SORGULAR
+    # ─────────────────────────────────────────────────────
+
+    def _segments(self):
+        """Fiziksel tampon üzerinde zaman sıralı (başlangıç, bitiş) aralıkları"""
+        if self._count < self.capacity:
+            return ((0, self._count),)
+        return ((self._head, self.capacity), (0, self._head))
+
+    def _ranges(self, start, end, closed=True):
+        """[start, end] (closed=False ise [start, end)) penceresindeki fiziksel aralıklar"""
+        ranges = []
+        for lo, hi in self._segments():
+            i = bisect_left(self._t, start, lo, hi)
+            j = (bisect_right if closed else bisect_left)(self._t, end, lo, hi)
+            if j > i:
+                ranges.append((i, j))
+        return ranges
+
+    def window(self, start=None, end=None):
+        """
+        Zaman penceresindeki örnekler
+
+        Args:
+            start (float): Başlangıç (dahil, varsayılan: en eski)
+            end (float): Bitiş (dahil, varsayılan: en yeni)
+
+        Returns:
+            tuple: (zamanlar, değerler) listeleri, eskiden yeniye
+        """
+        start = -float("inf") if start is None else start
+        end = float("inf") if end is None else end
+        times, values = [], []
+        with self._lock:
+            for i, j in self._ranges(start, end):
+                times.extend(self._t[i:j])
+                values.extend(self._values[i:j])
+        return times, values
+
+    def downsample(self, start, end, buckets):
+        """
+        Pencereyi eşit süreli kovalara böl ve özetle
+
+        Args:
+            start (float): Başlangıç zamanı
+            end (float): Bitiş zamanı (son kovaya dahil)
+            buckets (int): Kova sayısı
+
+        Returns:
+            list: Boş olmayan her kova için
+                (kova_başlangıcı, min, max, ortalama, örnek_sayısı)
+        """
+        if buckets < 1 or end <= start:
+            return []
+        width = (end - start) / buckets
+        result = []
+        with self._lock:
+            for k in range(buckets):
+                b_start = start + k * width
+                last = k == buckets - 1
+                b_end = end if last else b_start + width
+                lo = hi = None
+                total = 0.0
+                count = 0
+                for i, j in self._ranges(b_start, b_end, closed=last):
+                    view = self._values[i:j]
+                    seg_lo, seg_hi = min(view), max(view)
+                    lo = seg_lo if lo is None else min(lo, seg_lo)
+                    hi = seg_hi if hi is None else max(hi, seg_hi)
+                    total += sum(view)
+                    count += j - i
+                if count:
+                    result.append((b_start, lo, hi, total / count, count))
+        return result
+
+
+class TelemetryHistory:
+    """
+    Kanal adı → TelemetryChannel deposu
+
+    Kanallar ilk kayıtta otomatik oluşturulur.
+
+    Örnek Kullanım:
+        >>> history = TelemetryHistory(capacity=86400)
+        >>> ac.setHistory(history)
+        >>> ac.update()
+        >>> history.window("ambient_temp", time.monotonic() - 60)
+    """
+
+    def __init__(self, capacity=100000):
+        self.capacity = capacity
+        self._channels = {}
+        self._lock = threading.Lock()
+
+    def channel(self, name):
+        """Kanalı döndür (yoksa oluştur)"""
+        ch = self._channels.get(name)
+        if ch is None:
+            with self._lock:
+                ch = self._channels.setdefault(name, TelemetryChannel(name, self.capacity))
+        return ch
+
+    def names(self):
+        return sorted(self._channels)
+
+    def record(self, values, t=None):
+        """
+        Bir update() turunun değerlerini kaydet
+
+        Args:
+            values (dict): Kanal adı → değer (None olanlar atlanır)
+            t (float): Ortak zaman damgası (varsayılan: time.monotonic())
+        """
+        if t is None:
+            t = time.monotonic()
+        for name, value in values.items():
+            if value is not None:
+                self.channel(name).append(value, t)
+
+    def window(self, name, start=None, end=None):
+        """Bkz. TelemetryChannel.window (kanal yoksa boş)"""
+        ch = self._channels.get(name)
+        return ch.window(start, end) if ch else ([], [])
+
+    def downsample(self, name, start, end, buckets):
+        """Bkz. TelemetryChannel.downsample (kanal yoksa boş)"""
+        ch = self._channels.get(name)
+        return ch.downsample(start, end, buckets) if ch else []
+
+    def memory_bytes(self):
+        """Ayrılmış toplam tampon boyutu (byte)"""
+        return sum(12 * ch.capacity for ch in self._channels.values())
@@ -0,0 +1,392 @@
+"""
+Telemetry Log - Kalıcı Sütunlu Kayıt
+EEM Projesi - Uzun Süreli Telemetri Arşivi
+
+update() ile okunan değerler aylarca saklanabilsin diye ikili,
+yalnızca eklemeli (append-only), sütunlu bir disk biçimi:
+
+- Her gün için bir segment dosyası: telemetry-YYYYMMDD.tlog
+  (kapasite dolarsa telemetry-YYYYMMDD.1.tlog, .2, ...)
+- Dosya boyutu baştan ayrılır; kayıtlar sabit genişliklidir:
+  zaman float64 (epoch s) + kanal başına float32 (okunamayan = NaN)
+- Sütunlar ardışıktır: [başlık][t × kapasite][kanal0 × kapasite]...
+- Başlık (indeks): kayıt sayısı, ilk/son zaman, kanal adları.
+  Okuyucu önce başlığa bakar, aralık dışındaki segmentleri atlar
+
+Yazma: append() yalnızca kuyruğa ekler; arka plandaki yazıcı iş
+parçacığı kayıtları toplu olarak mmap'e yazar ve flush_interval'da
+bir diske senkronlar. Poll döngüsü hiçbir zaman fsync beklemez.
+
+Okuma: TelemetryLogReader segmentleri mmap ile açar; zaman aralığı
+t sütunu üzerinde bisect ile bulunur, yalnızca gereken dilimler
+okunur (memoryview, kopyasız).
+"""
+
+import glob
+import math
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from bisect import bisect_left, bisect_right
+
+from .log import get_logger
+
+_log = get_logger("telemetry_log")
+
+MAGIC = b"EEMTLOG1"
+VERSION = 1
+HEADER_SIZE = 512
+NAME_SIZE = 16
+_HEADER = struct.Struct("<8sIIII")   # magic, sürüm, başlık boyutu, kapasite, kanal sayısı
+_INDEX = struct.Struct("<Qdd")       # kayıt sayısı, ilk zaman, son zaman
+_INDEX_OFFSET = _HEADER.size
+_NAMES_OFFSET = _INDEX_OFFSET + _INDEX.size
+MAX_COLUMNS = (HEADER_SIZE - _NAMES_OFFSET) // NAME_SIZE
+
+DEFAULT_COLUMNS = (
+    "desired_temp", "ambient_temp", "fan_speed",
+    "current_curtain", "outdoor_temp", "outdoor_press", "light_intensity",
+)
+
+
+def _segment_size(capacity, n_columns):
+    return HEADER_SIZE + 8 * capacity + 4 * capacity * n_columns
+
+
+def _day(t):
+    return time.strftime("%Y%m%d", time.localtime(t))
+
+
+class _Segment:
+    """Tek bir segment dosyası (mmap ile)"""
+
+    def __init__(self, path, capacity=None, columns=None, writable=False):
+        self.path = path
+        create = capacity is not None
+        if create:
+            if len(columns) > MAX_COLUMNS:
+                raise ValueError(f"En fazla {MAX_COLUMNS} kanal desteklenir")
+            with open(path, "wb") as f:
+                f.truncate(_segment_size(capacity, len(columns)))
+        writable = writable or create
+
+        self._file = open(path, "r+b" if writable else "rb")
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+
+        if create:
+            _HEADER.pack_into(self._mm, 0, MAGIC, VERSION, HEADER_SIZE, capacity, len(columns))
+            for i, name in enumerate(columns):
+                struct.pack_into(f"{NAME_SIZE}s", self._mm, _NAMES_OFFSET + i * NAME_SIZE, name.encode("ascii"))
+            _INDEX.pack_into(self._mm, _INDEX_OFFSET, 0, 0.0, 0.0)
+
+        magic, version, header_size, self.capacity, n_columns = _HEADER.unpack_from(self._mm, 0)
+        if (magic != MAGIC or version != VERSION or header_size != HEADER_SIZE
+                or len(self._mm) < _segment_size(self.capacity, n_columns)):
+            self._mm.close()
+            self._file.close()
+            raise ValueError(f"Geçersiz telemetri segmenti: {path}")
+        self.columns = tuple(
+            struct.unpack_from(f"{NAME_SIZE}s", self._mm, _NAMES_OFFSET + i * NAME_SIZE)[0].rstrip(b"\0").decode("ascii")
+            for i in range(n_columns)
+        )
+
+        view = memoryview(self._mm)
+        self._t = view[HEADER_SIZE:HEADER_SIZE + 8 * self.capacity].cast("d")
+        base = HEADER_SIZE + 8 * self.capacity
+        self._cols = {
+            name: view[base + 4 * self.capacity * i:base + 4 * self.capacity * (i + 1)].cast("f")
+            for i, name in enumerate(self.columns)
+        }
+
+    def index(self):
+        """(kayıt sayısı, ilk zaman, son zaman)"""
+        return _INDEX.unpack_from(self._mm, _INDEX_OFFSET)
+
+    def write(self, rows):
+        """rows: [(t, değer listesi)] - kapasiteye sığanlar yazılır, yazılan sayısı döner"""
+        count, t_first, _ = self.index()
+        n = min(len(rows), self.capacity - count)
+        for k in range(n):
+            t, values = rows[k]
+            self._t[count + k] = t
+            for name, value in zip(self.columns, values):
+                self._cols[name][count + k] = value
+        if n:
+            if count == 0:
+                t_first = rows[0][0]
+            # Sayaç en son güncellenir: okuyucu hiçbir zaman yarım kayıt görmez
+            _INDEX.pack_into(self._mm, _INDEX_OFFSET, count + n, t_first, rows[n - 1][0])
+        return n
+
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        self._t = None
+        self._cols = {}
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+
+class TelemetryLogWriter:
+    """
+    Arka planda toplu yazan telemetri kaydedici
+
+    Örnek Kullanım:
+        >>> log = TelemetryLogWriter("logs/telemetry")
+        >>> log.append({"ambient_temp": 22.5, "fan_speed": 3.0})
+        >>> log.close()
+    """
+
+    def __init__(self, directory, columns=DEFAULT_COLUMNS, capacity=65536,
+                 flush_interval=1.0, max_pending=10000):
+        self.directory = directory
+        self.columns = tuple(columns)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.dropped = 0          # Kuyruk doluyken atılan kayıtlar
+        self.written = 0
+        self.errors = 0           # Yazma/flush hataları (o turun kayıtları atılır)
+        self._last_t = -math.inf
+
+        os.makedirs(directory, exist_ok=True)
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._segment = None
+        self._segment_day = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="telemetry-log", daemon=True)
+        self._thread.start()
+
+    def append(self, values, t=None):
+        """
+        Bir update() turunu kuyruğa ekle (beklemez)
+
+        Args:
+            values (dict): Kanal adı → değer (eksik/None = NaN)
+            t (float): Zaman damgası (varsayılan: time.time()); saat
+                geri giderse öncekine eşitlenir (t sütunu sıralı kalır)
+        """
+        if self._closed:
+            return
+        t = max(time.time() if t is None else t, self._last_t)
+        self._last_t = t
+        row = (t, [math.nan if values.get(name) is None else float(values[name]) for name in self.columns])
+        try:
+            self._pending.put_nowait(row)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout=5.0):
+        """
+        Kuyruktakileri yaz, diske senkronla ve kapat
+
+        Args:
+            timeout (float): Yazıcıyı bekleme üst sınırı (s); kapanış
+                hiçbir durumda süresiz beklemez
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            try:
+                self._pending.put(None, timeout=timeout)
+            except queue.Full:
+                _log.warning("⚠ Telemetri kuyruğu boşalmadı, kapanış beklenmiyor")
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            _log.warning("⚠ Telemetri yazıcısı %s s içinde kapanmadı", timeout)
+
+    # ─────────────────────────────────────────────────────
+    # YAZICI İŞ PARÇACIĞI
+    # ─────────────────────────────────────────────────────
+
+    def _run(self):
+        next_flush = time.monotonic() + self.flush_interval
+        stop = False
+        while not stop:
+            batch = []
+            try:
+                item = self._pending.get(timeout=max(0.0, next_flush - time.monotonic()))
+                while True:
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                    item = self._pending.get_nowait()
+            except queue.Empty:
+                pass
+
+            try:
+                if batch:
+                    self._write(batch)
+                if (stop or time.monotonic() >= next_flush) and self._segment is not None:
+                    self._segment.flush()
+            except Exception as e:
+                # Disk dolu, mmap hatası...: iş parçacığı ölmez, segment sonraki turda yeniden açılır
+                self.errors += 1
+                _log.error("✗ Telemetri yazma hatası (%s kayıt atıldı): %s", len(batch), e)
+                self._drop_segment()
+            if stop or time.monotonic() >= next_flush:
+                next_flush = time.monotonic() + self.flush_interval
+
+        self._drop_segment()
+
+    def _drop_segment(self):
+        segment, self._segment = self._segment, None
+        if segment is not None:
+            try:
+                segment.close()
+            except Exception as e:
+                _log.error("✗ Telemetri segmenti kapatılamadı: %s", e)
+
+    def _write(self, rows):
+        while rows:
+            day = _day(rows[0][0])
+            same_day = 1
+            while same_day < len(rows) and _day(rows[same_day][0]) == day:
+                same_day += 1
+            chunk, rows = rows[:same_day], rows[same_day:]
+            while chunk:
+                segment = self._segment_for(day)
+                n = segment.write(chunk)
+                self.written += n
+                chunk = chunk[n:]
+
+    def _segment_for(self, day):
+        segment = self._segment
+        if segment is not None and self._segment_day == day and segment.index()[0] < segment.capacity:
+            return segment
+        if segment is not None:
+            segment.flush()
+            segment.close()
+
+        # O günün son dolmamış parçasını sürdür, yoksa yenisini aç
+        part = 0
+        while True:
+            suffix = f".{part}" if part else ""
+            path = os.path.join(self.directory, f"telemetry-{day}{suffix}.tlog")
+            if not os.path.exists(path):
+                segment = _Segment(path, self.capacity, self.columns)
+                break
+            try:
+                segment = _Segment(path, writable=True)
+            except ValueError:
+                segment = None
+            if segment is not None:
+                if segment.columns == self.columns and segment.index()[0] < segment.capacity:
+                    break
+                segment.close()
+            part += 1
+
+        self._segment = segment
+        self._segment_day = day
+        return segment
+
+
+class TelemetryLogReader:
+    """
+    Segmentleri mmap ile açan okuyucu
+
+    Örnek Kullanım:
+        >>> reader = TelemetryLogReader("logs/telemetry")
+        >>> t, cols = reader.query(time.time() - 3600, columns=["ambient_temp"])
+        >>> reader.aggregate("ambient_temp", time.time() - 86400)
+        {'count': 86212, 'min': 21.4, 'max': 24.9, 'mean': 23.1}
+        >>> reader.close()
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._segments = {}   # yol → _Segment (açık mmap'ler)
+
+    def paths(self):
+        """Segment dosyaları, zaman sırasıyla"""
+        def key(path):
+            name = os.path.basename(path)[len("telemetry-"):-len(".tlog")]
+            day, _, part = name.partition(".")
+            return day, int(part or 0)
+        return sorted(glob.glob(os.path.join(self.directory, "telemetry-*.tlog")), key=key)
+
+    def _open(self, path):
+        segment = self._segments.get(path)
+        if segment is None:
+            segment = self._segments[path] = _Segment(path)
+        return segment
+
+    def _ranges(self, start, end):
+        """[start, end] aralığına düşen (segment, i, j) dilimleri"""
+        for path in self.paths():
+            try:
+                segment = self._open(path)
+            except ValueError:
+                continue
+            count, t_first, t_last = segment.index()
+            if not count or t_last < start or t_first > end:
+                continue   # Başlık indeksine göre atla
+            i = bisect_left(segment._t, start, 0, count)
+            j = bisect_right(segment._t, end, 0, count)
+            if j > i:
+                yield segment, i, j
+
+    def query(self, start=None, end=None, columns=None):
+        """
+        Zaman aralığındaki kayıtlar
+
+        Args:
+            start (float): Başlangıç (epoch s, dahil; varsayılan: en eski)
+            end (float): Bitiş (epoch s, dahil; varsayılan: en yeni)
+            columns (list): İstenen kanallar (varsayılan: hepsi)
+
+        Returns:
+            tuple: (zamanlar, {kanal: değerler}) - okunamayan değer NaN
+        """
+        start = -math.inf if start is None else start
+        end = math.inf if end is None else end
+        times = []
+        result = {}
+        for segment, i, j in self._ranges(start, end):
+            names = segment.columns if columns is None else columns
+            for name in names:
+                result.setdefault(name, [math.nan] * len(times))
+            for name, values in result.items():
+                col = segment._cols.get(name)
+                values.extend(col[i:j] if col is not None else [math.nan] * (j - i))
+            times.extend(segment._t[i:j])
+        return times, result
+
+    def aggregate(self, column, start=None, end=None):
+        """
+        Bir kanalın aralık özeti (NaN değerler sayılmaz)
+
+        Returns:
+            dict: count, min, max, mean (kayıt yoksa count=0, diğerleri None)
+        """
+        start = -math.inf if start is None else start
+        end = math.inf if end is None else end
+        count = 0
+        total = 0.0
+        lo = hi = None
+        for segment, i, j in self._ranges(start, end):
+            col = segment._cols.get(column)
+            if col is None:
+                continue
+            for value in col[i:j]:
+                if value != value:   # NaN
+                    continue
+                count += 1
+                total += value
+                if lo is None or value < lo:
+                    lo = value
+                if hi is None or value > hi:
+                    hi = value
+        return {"count": count, "min": lo, "max": hi, "mean": total / count if count else None}
+
+    def close(self):
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
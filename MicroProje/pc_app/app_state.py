@@ -8,6 +8,15 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "baudrate": 9600,
     "refresh_interval_ms": 500,
     "use_mock": False,  # Default: gerçek sistem (mock test için manuel açılabilir)
+    "telemetry_log_dir": "",  # Non-empty: archive every update() there (api/telemetry_log)
+    "adaptive_polling": True,  # Per-channel poll rates (pc_app/poll_scheduler) instead of one fixed interval
+    "port_byte_budget": 240,  # Max polling bytes/s per board port (9600 baud carries ~960)
+    "dtr_reset": True,  # Opening a port resets the PIC; False keeps DTR low and skips the ready probe
+    "ready_timeout": 2.0,  # Upper bound (s) for a board to answer the ready probe after reset
+    "int_window": False,  # True: read the 1-byte pressure as its low byte in the 850-1100 hPa window
+    "log": "",  # "" = quiet; "debug" / "info" / "warning", add ":json" for structured lines (api/log)
+    "log_file": "",  # Non-empty: write log records there instead of the console
+    "daemon_listen": "127.0.0.1:8780",  # pc_app/daemon.py query API: host:port or a Unix socket path
 }
 
 
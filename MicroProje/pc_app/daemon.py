@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import math
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Make sure project root is importable even if script is run from pc_app
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from api.log import get_logger
+from api.telemetry_history import TelemetryHistory
+from app_state import load_config
+from snapshot import FIELDS, SystemSnapshot
+from system_factory import MAX_FAILURES, build_system
+
+_log = get_logger("daemon")
+
+DEFAULT_LISTEN = "127.0.0.1:8780"
+RECONNECT_MIN = 1.0  # s, first retry after a failed connect; doubles up to RECONNECT_MAX
+RECONNECT_MAX = 30.0
+MAX_BUCKETS = 10000  # /range ...&buckets=<n> upper bound
+# Snapshot fields recorded into the history when the connection keeps none itself (mock)
+HISTORY_FIELDS = tuple(name for name in FIELDS if name not in ("connected", "last_error", "desired_curtain"))
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 503: "Service Unavailable"}
+
+
+def parse_listen(listen: str) -> Tuple[int, Any]:
+    # "host:port" -> TCP, anything else is a Unix socket path
+    host, sep, port = listen.rpartition(":")
+    if sep and port.isdigit() and "/" not in listen:
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    return socket.AF_UNIX, listen
+
+
+def _json(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _finite(query: Dict[str, list], name: str) -> float:
+    # inf/nan would turn the window bounds into NaN JSON
+    value = float(query[name][0])
+    if not math.isfinite(value):
+        raise ValueError(f"{name} must be a finite number")
+    return value
+
+
+class TelemetryDaemon:
+    # Unattended service: one thread polls the boards through build_system(), HTTP clients
+    # only ever read the latest snapshot and the in-memory history - never the COM ports.
+
+    def __init__(self, cfg: dict, listen: Optional[str] = None, system: Optional[dict] = None):
+        self.cfg = cfg
+        self.listen = listen or cfg.get("daemon_listen") or DEFAULT_LISTEN
+        self.interval = max(0.02, int(cfg.get("refresh_interval_ms", 500)) / 1000.0)
+
+        self.system = system if system is not None else build_system(cfg)
+        self.conn = self.system["conn"]
+        # RealConnection records every reading itself; the mock gets one here
+        self.history = getattr(self.conn, "history", None)
+        self._own_history = self.history is None
+        if self._own_history:
+            self.history = TelemetryHistory()
+
+        self.snapshot: Optional[SystemSnapshot] = None
+        self.polled_at = 0.0
+        self.stats = {"polls": 0, "poll_errors": 0, "connects": 0, "requests": 0}
+        self._stats_lock = threading.Lock()  # handle() runs on one thread per client
+        self.failures = 0  # consecutive failed polls
+        self.started = time.monotonic()
+
+        self._latest_body: Tuple[int, bytes] = (0, b"")  # (snapshot seq, encoded /latest)
+        self._stop = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+        self._server: Optional[socketserver.BaseServer] = None
+        self._serve_thread: Optional[threading.Thread] = None
+
+    # -------- lifecycle --------
+
+    def start(self) -> "TelemetryDaemon":
+        self._server = self._make_server()
+        self._poll_thread = threading.Thread(target=self._poll_loop, name="daemon-poll", daemon=True)
+        self._serve_thread = threading.Thread(target=self._server.serve_forever, name="daemon-http", daemon=True)
+        self._poll_thread.start()
+        self._serve_thread.start()
+        _log.info("✓ Daemon listening on %s", self.address)
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            if isinstance(self._server.server_address, str) and os.path.exists(self._server.server_address):
+                os.remove(self._server.server_address)
+        if self._poll_thread is not None:
+            self._poll_thread.join(timeout=5)
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+    @property
+    def address(self) -> str:
+        # Where clients connect: "host:port" (real port when listening on :0) or the socket path
+        if self._server is None:
+            return self.listen
+        addr = self._server.server_address
+        return addr if isinstance(addr, str) else f"{addr[0]}:{addr[1]}"
+
+    def _make_server(self) -> socketserver.BaseServer:
+        family, addr = parse_listen(self.listen)
+        if family == socket.AF_UNIX:
+            if os.path.exists(addr):
+                os.remove(addr)  # stale socket from a previous run
+            server: socketserver.BaseServer = _UnixHTTPServer(addr, _Handler)
+        else:
+            server = _TCPHTTPServer(addr, _Handler)
+        server.telemetry = self
+        return server
+
+    # -------- acquisition --------
+
+    def _poll_loop(self) -> None:
+        retry = RECONNECT_MIN
+        while not self._stop.is_set():
+            if not getattr(self.conn, "connected", False):
+                try:
+                    self.conn.connect()
+                    self._count("connects")
+                    retry = RECONNECT_MIN
+                except Exception as e:
+                    self.conn.last_error = str(e)
+                    self._take_snapshot()
+                    _log.warning("⚠ Connect failed (retry in %.0f s): %s", retry, e)
+                    self._stop.wait(retry)
+                    retry = min(RECONNECT_MAX, retry * 2)
+                    continue
+            self.poll_once()
+            self._stop.wait(self._next_wait())
+
+    def poll_once(self) -> Optional[SystemSnapshot]:
+        try:
+            snap = self.conn.update()
+            self._count("polls")
+            error = getattr(self.conn, "last_error", "")
+        except Exception as e:
+            self.conn.last_error = error = str(e)
+            self._count("poll_errors")
+            snap = None
+        self.polled_at = time.monotonic()
+        self._track_failures(error)
+        snap = snap if isinstance(snap, SystemSnapshot) else self._take_snapshot()
+        if self._own_history and snap is not self.snapshot:
+            self.history.record({name: getattr(snap, name) for name in HISTORY_FIELDS}, self.polled_at)
+        self.snapshot = snap
+        return snap
+
+    def _track_failures(self, error: str) -> None:
+        if not error:
+            if self.failures:
+                _log.info("✓ Polling recovered after %d failed rounds", self.failures)
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.failures >= MAX_FAILURES and getattr(self.conn, "connected", False):
+            # Persistent read errors: _poll_loop reopens the ports with its backoff
+            _log.warning("⚠ %d failed polls in a row, reconnecting: %s", self.failures, error)
+            self.failures = 0
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _take_snapshot(self) -> SystemSnapshot:
+        self.snapshot = self.conn.take_snapshot()
+        return self.snapshot
+
+    def _next_wait(self) -> float:
+        # Adaptive connections name their next due channel; the interval is the longest gap
+        due = getattr(self.conn, "next_poll_time", None)
+        when = due() if due is not None else None
+        now = time.monotonic()
+        if when is None:
+            return self.interval
+        return max(0.005, min(when - now, self.interval))
+
+    # -------- query API --------
+
+    def handle(self, path: str) -> Tuple[int, bytes]:
+        # GET routes; returns (status, JSON body)
+        self._count("requests")
+        url = urlsplit(path)
+        route = url.path.rstrip("/") or "/"
+        if route == "/latest":
+            return 200, self._latest()
+        if route.startswith("/range/"):
+            return self._range(route[len("/range/"):], parse_qs(url.query))
+        if route == "/channels":
+            return 200, _json(self.history.names())
+        if route == "/stats":
+            return 200, _json(self._stats())
+        if route == "/health":
+            ok = bool(self.snapshot is not None and self.snapshot.connected)
+            return (200 if ok else 503), _json({"ok": ok})
+        return 404, _json({"error": f"unknown route {url.path}"})
+
+    def _latest(self) -> bytes:
+        # Encoded once per snapshot: repeated reads of unchanged state cost no JSON work
+        snap = self.snapshot
+        if snap is None:
+            return _json({"seq": 0, "connected": False})
+        seq, body = self._latest_body
+        if seq != snap.seq:
+            data = snap.as_dict()
+            data["polled_at"] = self._wall(self.polled_at)
+            body = _json(data)
+            self._latest_body = (snap.seq, body)
+        return body
+
+    def _range(self, channel: str, query: Dict[str, list]) -> Tuple[int, bytes]:
+        # ?last=<s> or ?since=<unix>&until=<unix>, optional &buckets=<n> for min/max/mean
+        try:
+            now = time.monotonic()
+            if "last" in query:
+                start, end = now - _finite(query, "last"), None
+            else:
+                start = self._mono(_finite(query, "since")) if "since" in query else None
+                end = self._mono(_finite(query, "until")) if "until" in query else None
+            buckets = int(query["buckets"][0]) if "buckets" in query else 0
+            if "buckets" in query and not 1 <= buckets <= MAX_BUCKETS:
+                raise ValueError(f"buckets must be 1..{MAX_BUCKETS}")
+        except ValueError as e:
+            return 400, _json({"error": str(e)})
+        if channel not in self.history.names():
+            return 404, _json({"error": f"unknown channel {channel}"})
+
+        if buckets:
+            rows = self.history.downsample(channel, now - 3600 if start is None else start,
+                                           now if end is None else end, buckets)
+            data = {"channel": channel, "buckets": [[self._wall(b[0])] + list(b[1:]) for b in rows]}
+        else:
+            times, values = self.history.window(channel, start, end)
+            data = {"channel": channel, "t": [self._wall(t) for t in times], "v": values}
+        return 200, _json(data)
+
+    def _stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["uptime"] = round(time.monotonic() - self.started, 3)
+        stats["seq"] = self.snapshot.seq if self.snapshot is not None else 0
+        stats["last_error"] = getattr(self.conn, "last_error", "")
+        poll_stats = getattr(self.conn, "poll_stats", None)
+        if poll_stats is not None:
+            stats["ports"] = poll_stats()
+        return stats
+
+    @staticmethod
+    def _wall(mono: float) -> float:
+        # History timestamps are monotonic; clients get unix time
+        return round(time.time() - (time.monotonic() - mono), 3)
+
+    @staticmethod
+    def _mono(wall: float) -> float:
+        return time.monotonic() - (time.time() - wall)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: one connection serves many reads
+
+    def do_GET(self) -> None:
+        status, body = self.server.telemetry.handle(self.path)
+        # Status line, headers and body in a single write (no Nagle / delayed-ACK stall)
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        self.wfile.write(head.encode() + body)
+
+    def log_message(self, format: str, *args) -> None:
+        _log.debug(format, *args)
+
+
+class _TCPHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class DaemonClient:
+    # Keep-alive client for scripts, exporters and GUIs: DaemonClient("127.0.0.1:8780").get("/latest")
+
+    def __init__(self, address: str, timeout: float = 2.0):
+        family, addr = parse_listen(address)
+        if family == socket.AF_UNIX:
+            self._conn: http.client.HTTPConnection = _UnixHTTPConnection(addr, timeout)
+        else:
+            self._conn = http.client.HTTPConnection(addr[0], addr[1], timeout=timeout)
+
+    def get(self, path: str) -> Any:
+        self._conn.request("GET", path)
+        resp = self._conn.getresponse()
+        body = resp.read()
+        if resp.status != 200:
+            raise RuntimeError(f"{path}: HTTP {resp.status} {body.decode(errors='replace')}")
+        return json.loads(body)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless polling daemon with a local query API")
+    parser.add_argument("--config", default="config.json", help="pc_app config file")
+    parser.add_argument("--listen", default=None, help=f"host:port or Unix socket path (default {DEFAULT_LISTEN})")
+    args = parser.parse_args(argv)
+
+    cfg = load_config(args.config)
+    daemon = TelemetryDaemon(cfg, listen=args.listen)
+    try:
+        daemon.start()
+    except OSError as e:
+        print(f"✗ Cannot listen on {daemon.listen}: {e}")
+        return 1
+    print(f"✓ Daemon ready: {daemon.address}  (GET /latest, /range/<channel>?last=60, /channels, /stats, /health)")
+    sys.stdout.flush()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+        print(f"\n📊 {daemon.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
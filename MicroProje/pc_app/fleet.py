@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Make sure project root is importable even if script is run from pc_app
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from api.log import get_logger
+from app_state import DEFAULT_CONFIG
+from mock_api import build_mock_fleet
+from snapshot import SystemSnapshot
+from system_factory import MAX_FAILURES, build_system, setup_logging
+
+_log = get_logger("fleet")
+
+MAX_WORKERS = 32  # bound on concurrent homes (each RealConnection adds its own two port threads)
+BACKOFF_MIN = 1.0  # s, first pause after a failed round; doubles per failure
+BACKOFF_MAX = 60.0
+
+# fleet.json:
+# {
+#   "defaults": {"baudrate": 9600, "refresh_interval_ms": 500},
+#   "max_workers": 16,
+#   "homes": [
+#     {"name": "living-room", "port_board1": "COM3", "port_board2": "COM4"},
+#     {"name": "bedroom", "port_board1": "/dev/ttyUSB2", "port_board2": "/dev/ttyUSB3"}
+#   ]
+# }
+
+
+def load_fleet(path: str = "fleet.json") -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def home_configs(fleet: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # Per-home cfg: DEFAULT_CONFIG < fleet "defaults" < the home's own entry
+    base = {**DEFAULT_CONFIG, **fleet.get("defaults", {})}
+    configs = []
+    for i, home in enumerate(fleet.get("homes", [])):
+        cfg = {**base, **home}
+        cfg.setdefault("name", f"home-{i + 1}")
+        configs.append(cfg)
+    names = [cfg["name"] for cfg in configs]
+    if len(set(names)) != len(names):
+        raise ValueError("Fleet home names must be unique")
+    return configs
+
+
+class HomeState:
+    def __init__(self, name: str, system: dict):
+        self.name = name
+        self.system = system
+        self.conn = system["conn"]
+        self.snapshot: Optional[SystemSnapshot] = None
+        self.failures = 0  # consecutive failed rounds
+        self.retry_at = 0.0  # monotonic; the home is skipped until then
+        self.last_ok = None  # monotonic time of the last good round
+        self.last_error = ""
+        self.polls = 0
+
+
+class FleetManager:
+    # Polls every home of a fleet concurrently on one bounded pool.
+    # A failing home backs off on its own; the others keep their rate.
+
+    def __init__(self, fleet: Dict[str, Any], systems: Optional[List[dict]] = None):
+        configs = home_configs(fleet)
+        if systems is None:
+            systems = self._build_systems(configs)
+        self.homes = [HomeState(cfg["name"], system) for cfg, system in zip(configs, systems)]
+        # Mock engines are stepped once per round on the fleet thread; the pool only reads rows
+        engines = {}
+        for home in self.homes:
+            engine = getattr(home.conn, "engine", None)
+            if engine is not None:
+                home.conn.auto_step = False
+                engines[id(engine)] = engine
+        self._engines = list(engines.values())
+        self.interval = max(0.02, int(configs[0]["refresh_interval_ms"]) / 1000.0) if configs else 0.5
+
+        workers = int(fleet.get("max_workers", MAX_WORKERS))
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(self.homes) or 1)),
+                                        thread_name_prefix="fleet-poll")
+        self.rounds = 0
+        self.round_time = 0.0  # s, duration of the last round
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _build_systems(configs: List[Dict[str, Any]]) -> List[dict]:
+        if not configs:
+            return []
+        setup_logging(configs[0])
+        if all(cfg.get("use_mock", False) for cfg in configs):
+            # One vectorised MockFleetEngine for every simulated home
+            return build_mock_fleet(configs[0], len(configs))
+        return [build_system(cfg) for cfg in configs]
+
+    # -------- polling --------
+
+    def poll_round(self) -> float:
+        # One concurrent pass over every home that is not backing off; returns its duration
+        started = time.monotonic()
+        due = [home for home in self.homes if home.retry_at <= started]
+        for engine in self._engines:
+            engine.step()  # one vectorised tick for every simulated home
+        wait([self._pool.submit(self._poll_home, home) for home in due])
+        self.rounds += 1
+        self.round_time = time.monotonic() - started
+        return self.round_time
+
+    def _poll_home(self, home: HomeState) -> None:
+        conn = home.conn
+        try:
+            if not conn.connected:
+                conn.connect()
+            snap = conn.update()
+            error = conn.last_error
+        except Exception as e:
+            error = str(e)
+            snap = None
+        home.polls += 1
+        home.snapshot = snap if snap is not None else conn.take_snapshot()
+        home.last_error = error
+
+        now = time.monotonic()
+        if not error:
+            if home.failures:
+                _log.info("✓ %s recovered after %d failed rounds", home.name, home.failures)
+            home.failures = 0
+            home.retry_at = 0.0
+            home.last_ok = now
+            return
+        home.failures += 1
+        delay = min(BACKOFF_MAX, BACKOFF_MIN * 2 ** (home.failures - 1))
+        home.retry_at = now + delay
+        _log.warning("⚠ %s failed (%d in a row, retry in %.0f s): %s", home.name, home.failures, delay, error)
+        if home.failures >= MAX_FAILURES and getattr(conn, "connected", False):
+            # Persistent read errors: reopen the ports on the next attempt
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def start(self) -> "FleetManager":
+        self._thread = threading.Thread(target=self._run, name="fleet", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            took = self.poll_round()
+            self._stop.wait(max(0.0, self.interval - took))
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._pool.shutdown(wait=True)
+        for home in self.homes:
+            try:
+                home.conn.close()
+            except Exception:
+                pass
+
+    # -------- status --------
+
+    def status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        homes = {}
+        counts = {"ok": 0, "backoff": 0, "offline": 0}
+        for home in self.homes:
+            if home.failures and home.retry_at > now:
+                state = "backoff"
+            elif home.snapshot is not None and home.snapshot.connected and not home.failures:
+                state = "ok"
+            else:
+                state = "offline"
+            counts[state] += 1
+            homes[home.name] = {
+                "state": state,
+                "failures": home.failures,
+                "retry_in": round(max(0.0, home.retry_at - now), 1),
+                "age": None if home.last_ok is None else round(now - home.last_ok, 3),
+                "last_error": home.last_error,
+                "polls": home.polls,
+                "values": home.snapshot.as_dict() if home.snapshot is not None else None,
+            }
+        return {"homes": len(self.homes), **counts, "rounds": self.rounds,
+                "round_ms": round(self.round_time * 1000.0, 1), "per_home": homes}
+
+
+def _print_status(status: Dict[str, Any]) -> None:
+    print(f"{status['homes']} homes | ok={status['ok']} backoff={status['backoff']} "
+          f"offline={status['offline']} | round {status['rounds']}: {status['round_ms']} ms")
+    for name, home in status["per_home"].items():
+        values = home["values"] or {}
+        if home["state"] == "ok":
+            print(f"  {name:<20} ok       T={values.get('ambient_temp')} C  curtain={values.get('current_curtain')} %")
+        else:
+            print(f"  {name:<20} {home['state']:<8} retry in {home['retry_in']} s: {home['last_error']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Poll every home of a fleet from one process")
+    parser.add_argument("--fleet", default="fleet.json", help="fleet config (homes + defaults)")
+    parser.add_argument("--status-every", type=float, default=5.0, help="print the aggregated status every N s")
+    args = parser.parse_args(argv)
+
+    try:
+        manager = FleetManager(load_fleet(args.fleet))
+    except (OSError, ValueError) as e:
+        print(f"✗ Fleet config: {e}")
+        return 1
+    manager.start()
+    try:
+        while True:
+            time.sleep(args.status_every)
+            _print_status(manager.status())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        manager.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 
 from app_state import load_config, save_config
+from poller import BackgroundPoller
+from snapshot import BIT
 from system_factory import build_system
 
+from api.protocol import set_encoder
+
+CURTAIN = set_encoder("2").channel  # settable range from the protocol schema
+
 
 def fmt_float(x, nd=1):
     try:
@@ -46,8 +52,30 @@ class App(tk.Tk):
         self.var_light = tk.StringVar(value="-")
         self.var_autoclose = tk.StringVar(value="-")
 
+        # Snapshot field -> widget variable; a variable is only set when its field changed
+        self._shown = None
+        self._bindings = [(BIT[field], field, var, fmt) for field, var, fmt in [
+            ("connected", self.var_status, lambda v: "CONNECTED" if v else "DISCONNECTED"),
+            ("last_error", self.var_error, lambda v: v or ""),
+            ("desired_temp", self.var_desired_t, fmt_float),
+            ("ambient_temp", self.var_ambient_t, fmt_float),
+            ("fan_speed", self.var_fan, fmt_float),
+            ("desired_curtain", self.var_desired_c, fmt_float),
+            ("current_curtain", self.var_current_c, fmt_float),
+            ("outdoor_temp", self.var_out_t, fmt_float),
+            ("outdoor_press", self.var_out_p, fmt_float),
+            ("light_intensity", self.var_light, lambda v: str(v) if v is not None else "-"),
+            ("light_intensity", self.var_autoclose, lambda v: "ACTIVE" if (v is not None and int(v) < 25) else "OFF"),
+        ]]
+
         self._build_ui()
 
+        # Serial I/O runs on the acquisition thread; the Tk thread only applies snapshots
+        self.poller = BackgroundPoller(self.conn, self.aircon, self.curtain, self.refresh_ms.get())
+        self.poller.start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._drain_poller()
+
     def _ports_text(self) -> str:
         return f"B1={self.cfg['port_board1']}  B2={self.cfg['port_board2']}  Baud={self.cfg['baudrate']}"
 
@@ -166,7 +194,7 @@ class App(tk.Tk):
             ttk.Label(left, text=label + ":").grid(row=i, column=0, sticky="w")
             ttk.Label(left, textvariable=var).grid(row=i, column=1, sticky="w")
 
-        ttk.Label(right, text="Set Desired Curtain (0 - 100)").pack(anchor="w")
+        ttk.Label(right, text=f"Set Desired Curtain ({CURTAIN.minimum:g} - {CURTAIN.maximum:g})").pack(anchor="w")
         self.entry_curtain = ttk.Entry(right)
         self.entry_curtain.pack(fill="x", pady=5)
         ttk.Button(right, text="Set", command=self.set_desired_curtain).pack(fill="x")
@@ -230,73 +258,71 @@ class App(tk.Tk):
         messagebox.showinfo("Saved", "Settings saved to config.json")
 
     def connect(self):
-        try:
-            # Mock connect
-            self.conn.port_board1 = self.cfg["port_board1"]
-            self.conn.port_board2 = self.cfg["port_board2"]
-            self.conn.baudrate = int(self.cfg["baudrate"])
+        def do_connect(b1, b2, baud):
+            self.conn.port_board1 = b1
+            self.conn.port_board2 = b2
+            self.conn.baudrate = baud
             self.conn.connect()
+
+        def done(_result, error):
+            if error is not None:
+                self.var_status.set("DISCONNECTED")
+                self.var_error.set(str(error))
+                messagebox.showerror("Connect failed", str(error))
+                return
             self.var_status.set("CONNECTED")
             self.var_error.set("")
-            self.refresh()
-        except Exception as e:
-            self.var_error.set(str(e))
-            messagebox.showerror("Connect failed", str(e))
+
+        self.var_status.set("CONNECTING...")
+        self.poller.submit(do_connect, self.cfg["port_board1"], self.cfg["port_board2"],
+                           int(self.cfg["baudrate"]), on_done=done, refresh=True)
 
     def disconnect(self):
-        try:
-            self.conn.close()
+        def done(_result, error):
+            if error is not None:
+                self.var_error.set(str(error))
+                messagebox.showerror("Disconnect failed", str(error))
+                return
             self.var_status.set("DISCONNECTED")
             self.var_error.set("")
-        except Exception as e:
-            self.var_error.set(str(e))
-            messagebox.showerror("Disconnect failed", str(e))
+
+        self.poller.submit(self.conn.close, on_done=done)
 
     def refresh(self):
         if not getattr(self.conn, "connected", False):
             self.var_status.set("DISCONNECTED")
             return
-
+        self.poller.request_refresh()
+
+    def _drain_poller(self):
+        snap = self.poller.poll_events()
+        if snap is not None:
+            self._apply_snapshot(snap)
+        self.after(50, self._drain_poller)
+
+    def _apply_snapshot(self, snap):
+        # Redraw cost follows changes, not polls: untouched StringVars cause no Tk work
+        mask = snap.changes_since(self._shown)
+        self._shown = snap
         try:
-            self.conn.update()
-
-            # Air (None kontrolü ile)
-            desired_t = self.aircon.getDesiredTemp()
-            ambient_t = self.aircon.getAmbientTemp()
-            fan_speed = self.aircon.getFanSpeed()
-            
-            # Debug: değerleri kontrol et
-            if desired_t is None:
-                print(f"WARNING: desired_t is None")
-            if ambient_t is None:
-                print(f"WARNING: ambient_t is None")
-            if fan_speed is None:
-                print(f"WARNING: fan_speed is None")
-            
-            self.var_desired_t.set(fmt_float(desired_t, 1) if desired_t is not None else "-")
-            self.var_ambient_t.set(fmt_float(ambient_t, 1) if ambient_t is not None else "-")
-            self.var_fan.set(fmt_float(fan_speed, 1) if fan_speed is not None else "-")
-
-            # Curtain (None kontrolü ile)
-            desired_c = self.curtain.getDesiredCurtain()
-            current_c = self.curtain.getCurrentCurtain()
-            self.var_desired_c.set(str(desired_c) if desired_c is not None else "-")
-            self.var_current_c.set(str(current_c) if current_c is not None else "-")
-            self.var_out_t.set(fmt_float(self.curtain.getOutdoorTemp(), 1))
-            self.var_out_p.set(fmt_float(self.curtain.getOutdoorPress(), 1))
-            li = self.curtain.getLightIntensity()
-            self.var_light.set(str(li) if li is not None else "-")
-            self.var_autoclose.set("ACTIVE" if (li is not None and int(li) < 25) else "OFF")
-
-            self.var_status.set("CONNECTED")
-            self.var_error.set("")
+            for bit, field, var, fmt in self._bindings:
+                if mask & bit:
+                    var.set(fmt(getattr(snap, field)))
         except Exception as e:
             import traceback
             error_msg = str(e)
             print(f"ERROR in refresh(): {error_msg}")
             traceback.print_exc()
             self.var_error.set(error_msg)
-            self.var_status.set("CONNECTED")  # still connected but last op failed
+
+    def _command_done(self, _result, error):
+        if error is not None:
+            messagebox.showerror("Command failed", str(error))
+
+    def _apply(self, setter, value):
+        # Runs on the acquisition thread, before the refresh can overwrite last_error
+        if setter(value) is False:
+            raise ValueError(getattr(self.conn, "last_error", "") or f"{value} was rejected")
 
     def set_desired_temp(self):
         if not getattr(self.conn, "connected", False):
@@ -308,48 +334,57 @@ class App(tk.Tk):
             val = round(float(raw), 1)
             if not (10.0 <= val <= 50.0):
                 raise ValueError("Temperature must be between 10.0 and 50.0")
-            self.aircon.setDesiredTemp(val)
-            self.refresh()
         except Exception as e:
             messagebox.showerror("Invalid input", str(e))
+            return
+        self.poller.submit(self._apply, self.aircon.setDesiredTemp, val, on_done=self._command_done, refresh=True)
 
     def set_desired_curtain(self):
         if not getattr(self.conn, "connected", False):
             messagebox.showwarning("Not connected", "Connect first.")
             return
 
-        raw = self.entry_curtain.get().strip()
+        raw = self.entry_curtain.get().strip().replace(",", ".")
         try:
-            val = int(raw)
-            if not (0 <= val <= 100):
-                raise ValueError("Curtain must be between 0 and 100")
-            self.curtain.setDesiredCurtain(val)
-            self.refresh()
+            val = round(float(raw), 1)
+            if not (CURTAIN.minimum <= val <= CURTAIN.maximum):
+                raise ValueError(f"Curtain must be between {CURTAIN.minimum:g} and {CURTAIN.maximum:g}")
         except Exception as e:
             messagebox.showerror("Invalid input", str(e))
+            return
+        self.poller.submit(self._apply, self.curtain.setDesiredCurtain, val, on_done=self._command_done, refresh=True)
 
     def toggle_low_light(self):
         # Mock-only demo: force light intensity low/high
         if not getattr(self.conn, "connected", False):
             messagebox.showwarning("Not connected", "Connect first.")
             return
-        if hasattr(self.conn, "light_intensity"):
-            li = int(getattr(self.conn, "light_intensity"))
-            new_li = 10 if li >= 25 else 64
-            self.conn.light_intensity = new_li
-            if new_li < 25 and hasattr(self.conn, "desired_curtain"):
-                self.conn.desired_curtain = 100
-            self.refresh()
+
+        def do_toggle():
+            if hasattr(self.conn, "light_intensity"):
+                li = int(getattr(self.conn, "light_intensity"))
+                new_li = 10 if li >= 25 else 64
+                self.conn.light_intensity = new_li
+                if new_li < 25 and hasattr(self.conn, "desired_curtain"):
+                    self.conn.desired_curtain = 100
+
+        self.poller.submit(do_toggle, on_done=self._command_done, refresh=True)
 
     def _auto_refresh_loop(self):
-        if self.auto_refresh.get():
-            try:
-                interval = int(self.refresh_ms.get())
-                interval = max(100, interval)
-            except Exception:
-                interval = 500
-            self.refresh()
-            self.after(interval, self._auto_refresh_loop)
+        # Polling cadence lives on the acquisition thread; this only toggles it
+        try:
+            interval = int(self.refresh_ms.get())
+            interval = max(100, interval)
+        except Exception:
+            interval = 500
+        self.poller.set_auto(self.auto_refresh.get(), interval)
+
+    def _on_close(self):
+        # The ports belong to the acquisition thread: close them there, never from Tk.
+        # If stop() times out mid-read, the queued close still runs once that read ends.
+        self.poller.submit(self.conn.close)
+        self.poller.stop()
+        self.destroy()
 
 
 if __name__ == "__main__":
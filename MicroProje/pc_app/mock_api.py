@@ -1,16 +1,30 @@
-import random
-import time
-from typing import Dict
+from typing import Dict, List, Optional
+
+from mock_engine import MockFleetEngine
+from snapshot import SnapshotTracker, SystemSnapshot
 
 
 def clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
+def _row_property(column: str, cast):
+    # Attribute backed by this home's row in the shared MockFleetEngine
+    def fget(self):
+        return cast(getattr(self.engine, column)[self.index])
+
+    def fset(self, value):
+        getattr(self.engine, column)[self.index] = value
+
+    return property(fget, fset)
+
+
 class HomeAutomationSystemConnectionMock:
-    # Mock connection that simulates two boards (Board#1 + Board#2)
+    # Mock connection that simulates two boards (Board#1 + Board#2).
+    # State lives in one row of a MockFleetEngine, so many homes can share one engine.
 
-    def __init__(self, port_board1: str, port_board2: str, baudrate: int):
+    def __init__(self, port_board1: str, port_board2: str, baudrate: int,
+                 engine: Optional[MockFleetEngine] = None, index: int = 0):
         self.port_board1 = port_board1
         self.port_board2 = port_board2
         self.baudrate = baudrate
@@ -18,19 +32,22 @@ class HomeAutomationSystemConnectionMock:
         self.connected = False
         self.last_error = ""
 
-        # Board #1 (air conditioner)
-        self.desired_temp = 24.0
-        self.ambient_temp = 23.4
-        self.fan_speed = 8.0  # rps
+        self.engine = engine if engine is not None else MockFleetEngine(1)
+        self.index = index
+        self.auto_step = True  # False when the owner steps the whole engine (FleetManager does, once per round)
+        self._snapshots = SnapshotTracker()
 
-        # Board #2 (curtain + outdoor)
-        self.desired_curtain = 50  # %
-        self.current_curtain = 40  # %
-        self.outdoor_temp = 12.7
-        self.outdoor_press = 1013.2  # hPa
-        self.light_intensity = 65  # 0..100 %
+    # Board #1 (air conditioner)
+    desired_temp = _row_property("desired_temp", float)
+    ambient_temp = _row_property("ambient_temp", float)
+    fan_speed = _row_property("fan_speed", float)  # rps
 
-        self._last_update = time.time()
+    # Board #2 (curtain + outdoor)
+    desired_curtain = _row_property("desired_curtain", float)  # %
+    current_curtain = _row_property("current_curtain", float)  # %, tenths
+    outdoor_temp = _row_property("outdoor_temp", float)
+    outdoor_press = _row_property("outdoor_press", float)  # hPa
+    light_intensity = _row_property("light_intensity", int)  # 0..100 %
 
     def connect(self) -> None:
         self.connected = True
@@ -39,47 +56,20 @@ class HomeAutomationSystemConnectionMock:
     def close(self) -> None:
         self.connected = False
 
-    def update(self) -> None:
+    def update(self) -> SystemSnapshot:
         if not self.connected:
             self.last_error = "Not connected"
             raise RuntimeError("Not connected")
 
-        now = time.time()
-        dt = now - self._last_update
-        self._last_update = now
-
-        # Ambient temperature slowly approaches desired temperature
-        diff = self.desired_temp - self.ambient_temp
-        self.ambient_temp += clamp(diff * 0.05, -0.2, 0.2)
-        self.ambient_temp += random.uniform(-0.05, 0.05)
-        self.ambient_temp = clamp(self.ambient_temp, 5.0, 60.0)
-
-        # Fan speed increases when temperature difference is larger
-        self.fan_speed = clamp(5.0 + abs(diff) * 2.0 + random.uniform(-0.3, 0.3), 0.0, 40.0)
-
-        # Outdoor values drift slowly
-        self.outdoor_temp += random.uniform(-0.03, 0.03)
-        self.outdoor_press += random.uniform(-0.2, 0.2)
-
-        # Light intensity random walk
-        self.light_intensity += random.randint(-2, 2)
-        self.light_intensity = int(clamp(self.light_intensity, 0, 100))
-
-        # Auto-close if it's dark
-        if self.light_intensity < 25:
-            self.desired_curtain = 100
-
-        # Curtain position moves gradually toward desired
-        if self.desired_curtain != self.current_curtain:
-            step = 1 if self.desired_curtain > self.current_curtain else -1
-            moves = max(1, int(dt * 10))
-            for _ in range(moves):
-                if self.desired_curtain == self.current_curtain:
-                    break
-                self.current_curtain += step
-                self.current_curtain = int(clamp(self.current_curtain, 0, 100))
-
+        if self.auto_step:
+            # Advance only this home's row (fleet dashboards call engine.step() for all)
+            self.engine.step(rows=self.index)
         self.last_error = ""
+        return self.take_snapshot()
+
+    def take_snapshot(self) -> SystemSnapshot:
+        # Same object as last time unless a value (or the connection state) changed
+        return self._snapshots.capture(self)
 
 
 class AirConditionerSystemConnectionMock:
@@ -107,14 +97,14 @@ class CurtainControlSystemConnectionMock:
     def __init__(self, conn: HomeAutomationSystemConnectionMock):
         self.conn = conn
 
-    def getDesiredCurtain(self) -> int:
-        return int(self.conn.desired_curtain)
+    def getDesiredCurtain(self) -> float:
+        return float(self.conn.desired_curtain)
 
-    def setDesiredCurtain(self, value: int) -> None:
-        self.conn.desired_curtain = int(clamp(value, 0, 100))
+    def setDesiredCurtain(self, value: float) -> None:
+        self.conn.desired_curtain = round(clamp(float(value), 0.0, 100.0), 1)
 
-    def getCurrentCurtain(self) -> int:
-        return int(self.conn.current_curtain)
+    def getCurrentCurtain(self) -> float:
+        return float(self.conn.current_curtain)
 
     def getOutdoorTemp(self) -> float:
         return float(self.conn.outdoor_temp)
@@ -131,3 +121,15 @@ def build_mock_system(cfg: Dict) -> Dict:
     aircon = AirConditionerSystemConnectionMock(conn)
     curtain = CurtainControlSystemConnectionMock(conn)
     return {"conn": conn, "aircon": aircon, "curtain": curtain}
+
+
+def build_mock_fleet(cfg: Dict, count: int, seed: Optional[int] = None) -> List[Dict]:
+    # `count` mock systems backed by one engine; tick them all with systems[0]["conn"].engine.step()
+    engine = MockFleetEngine(count, seed=seed)
+    systems = []
+    for i in range(count):
+        conn = HomeAutomationSystemConnectionMock(cfg["port_board1"], cfg["port_board2"], int(cfg["baudrate"]),
+                                                  engine=engine, index=i)
+        systems.append({"conn": conn, "aircon": AirConditionerSystemConnectionMock(conn),
+                        "curtain": CurtainControlSystemConnectionMock(conn)})
+    return systems
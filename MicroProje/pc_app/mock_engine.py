@@ -0,0 +1,130 @@
+import time
+from typing import Optional, Union
+
+import numpy as np
+
+Rows = Union[int, slice, np.ndarray]
+
+
+class CurtainMotorProfile:
+    # Stepper speed profile for the curtain (R2.2.1: 1 % = 10 steps).
+    # accel <= 0 means the motor runs at step_rate from the first step;
+    # otherwise moves follow a trapezoid (or triangle for short moves).
+
+    def __init__(self, steps_per_percent: int = 10, step_rate: float = 100.0, accel: float = 0.0):
+        self.steps_per_percent = int(steps_per_percent)
+        self.step_rate = float(step_rate)  # steps/s at cruise
+        self.accel = float(accel)          # steps/s^2
+
+    def distance(self, elapsed: np.ndarray, total: np.ndarray) -> np.ndarray:
+        # Steps covered `elapsed` seconds into a move of `total` steps that started at rest
+        elapsed = np.maximum(elapsed, 0.0)
+        v = self.step_rate
+        if self.accel <= 0:
+            return np.minimum(total, v * elapsed)
+
+        a = self.accel
+        t_ramp = np.minimum(v / a, np.sqrt(total / a))  # short moves never reach step_rate
+        v_peak = a * t_ramp
+        d_ramp = 0.5 * a * t_ramp ** 2
+        t_cruise = (total - 2.0 * d_ramp) / np.maximum(v_peak, 1e-12)
+        t_end = 2.0 * t_ramp + t_cruise
+
+        ramp_up = 0.5 * a * elapsed ** 2
+        cruise = d_ramp + v_peak * (elapsed - t_ramp)
+        ramp_down = total - 0.5 * a * (t_end - elapsed) ** 2
+        covered = np.where(elapsed < t_ramp, ramp_up, np.where(elapsed < t_ramp + t_cruise, cruise, ramp_down))
+        return np.where(elapsed >= t_end, total, covered)
+
+
+class MockFleetEngine:
+    # N simulated homes held as column arrays; one step() advances them all.
+    # Row i is what HomeAutomationSystemConnectionMock #i reads and writes.
+
+    def __init__(self, size: int = 1, seed: Optional[int] = None,
+                 motor: Optional[CurtainMotorProfile] = None):
+        self.size = int(size)
+        self.rng = np.random.default_rng(seed)
+        self.motor = motor if motor is not None else CurtainMotorProfile()
+
+        # Board #1 (air conditioner)
+        self.desired_temp = np.full(self.size, 24.0)
+        self.ambient_temp = np.full(self.size, 23.4)
+        self.fan_speed = np.full(self.size, 8.0)  # rps
+
+        # Board #2 (curtain + outdoor)
+        self.desired_curtain = np.full(self.size, 50.0)  # %
+        self.current_curtain = np.full(self.size, 40.0)  # %, 0.1 % resolution like the board
+        self.outdoor_temp = np.full(self.size, 12.7)
+        self.outdoor_press = np.full(self.size, 1013.2)  # hPa
+        self.light_intensity = np.full(self.size, 65, dtype=np.int64)  # 0..100 %
+
+        self.last_update = np.full(self.size, time.time())
+
+        # Current curtain move: position(t) = from + dir * motor.distance(t - t0, |to - from|)
+        spp = self.motor.steps_per_percent
+        self._move_from = self.current_curtain * spp   # steps
+        self._move_to = self._move_from.copy()          # steps
+        self._move_t0 = self.last_update.copy()
+
+    def step(self, now: Optional[float] = None, rows: Optional[Rows] = None) -> None:
+        # Advance the selected rows (default: every home) to `now`
+        if now is None:
+            now = time.time()
+        if rows is None:
+            rows = slice(None)
+        elif isinstance(rows, (int, np.integer)):
+            rows = slice(int(rows), int(rows) + 1)
+        n = len(self.last_update[rows])
+        if n == 0:
+            return
+        rng = self.rng
+
+        started = self.last_update[rows].copy()
+        self.last_update[rows] = now
+
+        # Ambient temperature slowly approaches desired temperature
+        diff = self.desired_temp[rows] - self.ambient_temp[rows]
+        ambient = self.ambient_temp[rows] + np.clip(diff * 0.05, -0.2, 0.2)
+        ambient += rng.uniform(-0.05, 0.05, n)
+        self.ambient_temp[rows] = np.clip(ambient, 5.0, 60.0)
+
+        # Fan speed increases when temperature difference is larger
+        fan = 5.0 + np.abs(diff) * 2.0 + rng.uniform(-0.3, 0.3, n)
+        self.fan_speed[rows] = np.clip(fan, 0.0, 40.0)
+
+        # Outdoor values drift slowly
+        self.outdoor_temp[rows] += rng.uniform(-0.03, 0.03, n)
+        self.outdoor_press[rows] += rng.uniform(-0.2, 0.2, n)
+
+        # Light intensity random walk
+        light = np.clip(self.light_intensity[rows] + rng.integers(-2, 3, n), 0, 100)
+        self.light_intensity[rows] = light
+
+        # Auto-close if it's dark
+        desired = np.where(light < 25, 100, self.desired_curtain[rows])
+        self.desired_curtain[rows] = desired
+
+        # Curtain follows the motor profile; cost is the same however long the pause was
+        self.current_curtain[rows] = self._curtain_position(rows, desired, started, now)
+
+    def _curtain_position(self, rows: Rows, desired: np.ndarray, started: np.ndarray, now: float) -> np.ndarray:
+        spp = self.motor.steps_per_percent
+        target = np.round(np.clip(desired, 0.0, 100.0) * spp)
+
+        # A new setpoint restarts the move from where the curtain is, at the start of this tick
+        move_from = self._move_from[rows]
+        move_to = self._move_to[rows]
+        move_t0 = self._move_t0[rows]
+        retarget = target != move_to
+        if retarget.any():
+            move_from = np.where(retarget, self.current_curtain[rows] * spp, move_from)
+            move_t0 = np.where(retarget, started, move_t0)
+            move_to = target
+            self._move_from[rows] = move_from
+            self._move_to[rows] = move_to
+            self._move_t0[rows] = move_t0
+
+        span = move_to - move_from
+        covered = self.motor.distance(now - move_t0, np.abs(span))
+        return np.round(move_from + np.sign(span) * covered) / spp
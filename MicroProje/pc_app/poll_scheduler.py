@@ -0,0 +1,111 @@
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# channel -> (fast, slow) poll interval in seconds.
+# fast: right after a SET or a detected change; slow: ceiling the back-off grows to.
+DEFAULT_RATES: Dict[str, Tuple[float, float]] = {
+    # Board #1
+    "desired_temp": (0.5, 5.0),
+    "ambient_temp": (0.5, 5.0),
+    "fan_speed": (1.0, 5.0),  # only changes in Temp_TMR1_ISR (once per second)
+    # Board #2
+    "curtain": (0.1, 2.0),  # fast while the stepper moves
+    "outdoor_temp": (1.0, 10.0),
+    "outdoor_press": (1.0, 10.0),
+    "light": (0.25, 5.0),
+}
+
+BACKOFF = 1.5  # interval growth per unchanged reading
+DEADBAND = 0.15  # a one-tenth flicker (sensor noise) does not count as a change
+
+
+class _ChannelState:
+    def __init__(self, name: str, cost: int, fast: float, slow: float):
+        self.name = name
+        self.cost = cost  # wire bytes per read (GET bytes + reply bytes)
+        self.fast = fast
+        self.slow = slow
+        self.interval = fast
+        self.next_due = 0.0
+        self.value = None
+        self.reads = 0
+
+
+class PortScheduler:
+    # Decides which channels of one board are due, within that port's byte budget.
+    # The caller reads the due channels in one pipelined GET and reports back with observe().
+
+    def __init__(self, channels: Iterable, budget_bps: float = 240.0,
+                 rates: Optional[Dict[str, Tuple[float, float]]] = None, clock=time.monotonic):
+        rates = {**DEFAULT_RATES, **(rates or {})}
+        self._clock = clock
+        self._channels: Dict[str, _ChannelState] = {}
+        for ch in channels:
+            fast, slow = rates.get(ch.name, (0.5, 5.0))
+            cost = 2 if ch.frac_code is None else 4
+            self._channels[ch.name] = _ChannelState(ch.name, cost, fast, slow)
+
+        # Token bucket: refills at budget_bps, holds at most one second of budget
+        self.budget_bps = float(budget_bps)
+        self._tokens = self.budget_bps
+        self._refilled = clock()
+        self.bytes_used = 0
+        self._started = self._refilled
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.budget_bps, self._tokens + (now - self._refilled) * self.budget_bps)
+        self._refilled = now
+
+    def due(self, now: Optional[float] = None) -> Tuple[str, ...]:
+        # Channels to read now, most overdue first, limited by the remaining byte budget
+        now = self._clock() if now is None else now
+        self._refill(now)
+        ready = sorted((st for st in self._channels.values() if st.next_due <= now), key=lambda st: st.next_due)
+        names: List[str] = []
+        for st in ready:
+            if st.cost > self._tokens:
+                break  # keep priority order: later channels wait for the next refill
+            self._tokens -= st.cost
+            self.bytes_used += st.cost
+            st.next_due = now + st.interval  # provisional, until observe() reports the reading
+            names.append(st.name)
+        return tuple(names)
+
+    def observe(self, values: Dict[str, object], now: Optional[float] = None) -> None:
+        # Feed back one round: changed values go fast, stable ones back off, failures retry
+        now = self._clock() if now is None else now
+        for name, value in values.items():
+            st = self._channels.get(name)
+            if st is None:
+                continue
+            st.reads += 1
+            if value is not None:
+                if st.value is None or abs(value - st.value) > DEADBAND:
+                    st.interval = st.fast
+                else:
+                    st.interval = min(st.slow, st.interval * BACKOFF)
+                st.value = value
+            st.next_due = now + st.interval
+
+    def boost(self, name: str, now: Optional[float] = None) -> None:
+        # After a SET: read the channel right away and keep it fast until it settles
+        st = self._channels.get(name)
+        if st is not None:
+            st.interval = st.fast
+            st.next_due = self._clock() if now is None else now
+
+    def next_due(self) -> float:
+        # Earliest time anything can be read (schedule and budget permitting)
+        st = min(self._channels.values(), key=lambda s: (s.next_due, s.cost))
+        deficit = st.cost - self._tokens
+        budget_at = self._refilled + deficit / self.budget_bps if deficit > 0 else 0.0
+        return max(st.next_due, budget_at)
+
+    def intervals(self) -> Dict[str, float]:
+        return {name: st.interval for name, st in self._channels.items()}
+
+    def utilisation(self, baudrate: int, now: Optional[float] = None) -> float:
+        # Share of the line (8N1: baudrate / 10 bytes/s) spent on polling so far
+        now = self._clock() if now is None else now
+        elapsed = max(now - self._started, 1e-9)
+        return self.bytes_used / elapsed / (baudrate / 10.0)
@@ -0,0 +1,167 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from snapshot import SnapshotTracker, SystemSnapshot
+
+MIN_POLL_GAP = 0.02  # s, floor between two adaptive polls
+
+def read_snapshot(conn, aircon, curtain) -> Dict[str, Any]:
+    # Copy every telemetry value the UI shows into a plain dict
+    return {
+        "connected": bool(getattr(conn, "connected", False)),
+        "last_error": getattr(conn, "last_error", ""),
+        "desired_temp": aircon.getDesiredTemp(),
+        "ambient_temp": aircon.getAmbientTemp(),
+        "fan_speed": aircon.getFanSpeed(),
+        "desired_curtain": curtain.getDesiredCurtain(),
+        "current_curtain": curtain.getCurrentCurtain(),
+        "outdoor_temp": curtain.getOutdoorTemp(),
+        "outdoor_press": curtain.getOutdoorPress(),
+        "light_intensity": curtain.getLightIntensity(),
+    }
+
+
+class BackgroundPoller:
+    # Acquisition thread: the only thread that touches the serial ports.
+    # The GUI queues commands here and picks up snapshots with poll_events().
+
+    def __init__(self, conn, aircon, curtain, interval_ms: int = 500):
+        self.conn = conn
+        self.aircon = aircon
+        self.curtain = curtain
+        self.interval_ms = interval_ms
+        self.auto = False
+
+        self._commands: "queue.Queue[tuple]" = queue.Queue()
+        self._results: "queue.Queue[tuple]" = queue.Queue()
+        # Latest-wins: a slow GUI never makes the poller block or pile up old data
+        self._snapshots: "queue.Queue[SystemSnapshot]" = queue.Queue(maxsize=1)
+        # Connections without take_snapshot() are read through their getters
+        self._tracker = SnapshotTracker()
+        self._published: Optional[SystemSnapshot] = None
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._refresh_requested = False
+        self._full_refresh = False
+        self._thread = threading.Thread(target=self._run, name="acquisition", daemon=True)
+
+    # -------- GUI side --------
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def submit(self, fn: Callable, *args, on_done: Optional[Callable] = None, refresh: bool = False) -> None:
+        # Run fn(*args) on the acquisition thread; on_done(result, error) runs on the GUI thread
+        self._commands.put((fn, args, on_done, refresh))
+        self._wake.set()
+
+    def request_refresh(self) -> None:
+        # Explicit refresh: read every channel, not just the ones the scheduler has due
+        self._refresh_requested = True
+        self._full_refresh = True
+        self._wake.set()
+
+    def set_auto(self, enabled: bool, interval_ms: Optional[int] = None) -> None:
+        if interval_ms is not None:
+            self.interval_ms = max(100, int(interval_ms))
+        self.auto = bool(enabled)
+        self._wake.set()
+
+    def poll_events(self) -> Optional[SystemSnapshot]:
+        # Deliver finished command callbacks, then return the newest changed snapshot (or None)
+        while True:
+            try:
+                on_done, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            on_done(result, error)
+        try:
+            return self._snapshots.get_nowait()
+        except queue.Empty:
+            return None
+
+    # -------- Acquisition thread --------
+
+    def _run(self) -> None:
+        next_poll = time.monotonic()
+        while not self._stop.is_set():
+            self._run_commands()
+
+            now = time.monotonic()
+            if self._refresh_requested or (self.auto and now >= next_poll):
+                full, self._full_refresh = self._full_refresh, False
+                self._refresh_requested = False
+                self._poll(full)
+                next_poll = self._next_poll_time()
+
+            timeout = max(0.0, next_poll - time.monotonic()) if self.auto else None
+            self._wake.wait(timeout)
+            self._wake.clear()
+        # Commands queued before stop() (e.g. conn.close) still run on this thread
+        self._run_commands()
+
+    def _run_commands(self) -> None:
+        while True:
+            try:
+                fn, args, on_done, refresh = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            result, error = None, None
+            try:
+                result = fn(*args)
+            except Exception as e:
+                error = e
+            if on_done is not None:
+                self._results.put((on_done, result, error))
+            if refresh:
+                self._refresh_requested = True
+
+    def _next_poll_time(self) -> float:
+        # Adaptive connections say when their next channel is due; interval_ms stays the
+        # longest gap between snapshots so connection state still reaches the GUI
+        now = time.monotonic()
+        fixed = now + self.interval_ms / 1000.0
+        due = getattr(self.conn, "next_poll_time", None)
+        when = due() if due is not None and getattr(self.conn, "connected", False) else None
+        if when is None:
+            return fixed
+        return max(now + MIN_POLL_GAP, min(when, fixed))
+
+    def _poll(self, full: bool = False) -> None:
+        if getattr(self.conn, "connected", False):
+            try:
+                if full and getattr(self.conn, "adaptive", False):
+                    self.conn.update(full=True)
+                else:
+                    self.conn.update()
+            except Exception as e:
+                self.conn.last_error = str(e)
+        snap = self._snapshot()
+        if snap is not self._published:  # unchanged state is not handed to the GUI again
+            self._published = snap
+            self._publish(snap)
+
+    def _snapshot(self) -> SystemSnapshot:
+        take = getattr(self.conn, "take_snapshot", None)
+        if take is not None:
+            return take()
+        try:
+            values = read_snapshot(self.conn, self.aircon, self.curtain)
+        except Exception as e:
+            values = {"connected": bool(getattr(self.conn, "connected", False)), "last_error": str(e)}
+        return self._tracker.publish(values)
+
+    def _publish(self, snap: SystemSnapshot) -> None:
+        try:
+            self._snapshots.get_nowait()
+        except queue.Empty:
+            pass
+        self._snapshots.put_nowait(snap)
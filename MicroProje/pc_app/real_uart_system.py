@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Make sure project root is importable even if script is run from pc_app
@@ -8,6 +11,11 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from api.protocol import BOARD1_CHANNELS, BOARD2_CHANNELS
+from api.telemetry_history import TelemetryHistory
+from api.telemetry_log import TelemetryLogWriter
+from poll_scheduler import PortScheduler
+from snapshot import SnapshotTracker, SystemSnapshot
 from uart_tools.uart_board1 import UARTBoard1
 from uart_tools.uart_board2 import UARTBoard2
 
@@ -17,6 +25,15 @@ class RealConnection:
         self.port_board1 = cfg.get("port_board1", "COM3")
         self.port_board2 = cfg.get("port_board2", "COM4")
         self.baudrate = int(cfg.get("baudrate", 9600))
+        self.telemetry_log_dir = cfg.get("telemetry_log_dir", "")
+        # Adaptive: every channel has its own poll rate; otherwise each update() reads everything
+        self.adaptive = bool(cfg.get("adaptive_polling", True))
+        self.port_byte_budget = float(cfg.get("port_byte_budget", 240))
+        # Opening a port pulses DTR and resets the PIC; connect() probes until it answers
+        self.dtr_reset = bool(cfg.get("dtr_reset", True))
+        self.ready_timeout = float(cfg.get("ready_timeout", 2.0))
+        # Board #2 pressure byte: raw (baseline) or unwrapped into the 850-1100 hPa window
+        self.int_window = bool(cfg.get("int_window", False))
 
         self.connected = False
         self.last_error = ""
@@ -24,6 +41,13 @@ class RealConnection:
         self._b1: UARTBoard1 | None = None
         self._b2: UARTBoard2 | None = None
 
+        # One worker per port so both boards are polled at the same time
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # One scheduler (and byte budget) per port
+        self._sched1: PortScheduler | None = None
+        self._sched2: PortScheduler | None = None
+
         # Cached telemetry
         self.desired_temp = None
         self.ambient_temp = None
@@ -37,13 +61,33 @@ class RealConnection:
         # “Desired curtain” is not separately provided by board2, keep last set value here
         self.desired_curtain = None
 
+        # Bounded per-channel history of every successful reading (for charts/trends)
+        self.history = TelemetryHistory()
+        # Optional on-disk archive (api/telemetry_log); writes happen on its own thread
+        self.telemetry_log: TelemetryLogWriter | None = None
+        # Immutable views of the values above, cached until one of them changes
+        self._snapshots = SnapshotTracker()
+
     def connect(self) -> None:
         try:
-            self._b1 = UARTBoard1(self.port_board1, self.baudrate)
-            self._b2 = UARTBoard2(self.port_board2, self.baudrate)
-
-            self._b1.connect()
-            self._b2.connect()
+            self._b1 = UARTBoard1(self.port_board1, self.baudrate,
+                                  dtr_reset=self.dtr_reset, ready_timeout=self.ready_timeout)
+            self._b2 = UARTBoard2(self.port_board2, self.baudrate, dtr_reset=self.dtr_reset,
+                                  ready_timeout=self.ready_timeout, int_window=self.int_window)
+
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="board-poll")
+            # Both boards boot in parallel: connecting costs max(B1, B2)
+            opened = [self._pool.submit(self._b1.connect), self._pool.submit(self._b2.connect)]
+            failed = [port for port, fut in zip((self.port_board1, self.port_board2), opened) if not fut.result()]
+            if failed:
+                self._b1.disconnect()
+                self._b2.disconnect()
+                raise RuntimeError(f"Cannot open {', '.join(failed)}")
+            self._sched1 = PortScheduler(BOARD1_CHANNELS, self.port_byte_budget)
+            self._sched2 = PortScheduler(BOARD2_CHANNELS, self.port_byte_budget)
+            if self.telemetry_log_dir and self.telemetry_log is None:
+                self.telemetry_log = TelemetryLogWriter(self.telemetry_log_dir)
 
             self.connected = True
             self.last_error = ""
@@ -60,47 +104,121 @@ class RealConnection:
                 self._b2.disconnect()
         finally:
             self.connected = False
-
-    def update(self) -> None:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+            if self.telemetry_log is not None:
+                self.telemetry_log.close()
+                self.telemetry_log = None
+
+    def update(self, full: bool = False) -> SystemSnapshot:
+        # full=True (or adaptive polling off) reads every channel; otherwise only the due ones
         if not self.connected:
-            return
-
+            return self.take_snapshot()
+
+        if full or not self.adaptive:
+            names1 = names2 = None
+        else:
+            now = time.monotonic()
+            names1 = self._sched1.due(now)
+            names2 = self._sched2.due(now)
+
+        # Both ports are polled concurrently: a refresh costs max(B1, B2), not B1 + B2
+        futures = []
+        if names1 != ():
+            futures.append(self._pool.submit(self._poll_board1, names1))
+        if names2 != ():
+            futures.append(self._pool.submit(self._poll_board2, names2))
+
+        values = {}
+        errors = []
+        for fut in futures:
+            try:
+                values.update(fut.result())
+            except Exception as e:
+                # A failing board only loses this round; its last known values are kept
+                errors.append(str(e))
+
+        with self._lock:
+            for name, value in values.items():
+                setattr(self, name, value)
+            if self.desired_curtain is None and self.current_curtain is not None:
+                self.desired_curtain = self.current_curtain
+            self.last_error = "; ".join(errors)
+            snap = self._snapshots.capture(self)
+        self.history.record(values)
+        if self.telemetry_log is not None and values:
+            self.telemetry_log.append(values)
+        return snap
+
+    def take_snapshot(self) -> SystemSnapshot:
+        # Same object as last time unless a value (or the connection state) changed
+        with self._lock:
+            return self._snapshots.capture(self)
+
+    def next_poll_time(self) -> float | None:
+        # Monotonic time the next channel is due (None: not adaptive, poll on the fixed interval)
+        if not self.adaptive or self._sched1 is None:
+            return None
+        return min(self._sched1.next_due(), self._sched2.next_due())
+
+    def boost(self, name: str) -> None:
+        # A SET makes the channel due now and keeps it on its fast rate until it settles
+        for sched in (self._sched1, self._sched2):
+            if sched is not None:
+                sched.boost(name)
+
+    def reject(self, board, value: float) -> bool:
+        # A refused SET sends nothing; the encoder's reason goes to last_error (the UI error line)
         try:
-            # Board1 temps come as integral + fractional (tenths)
-            d_i = self._b1.get_desired_temp_integral()
-            d_f = self._b1.get_desired_temp_fractional()
-            a_i = self._b1.get_ambient_temp_integral()
-            a_f = self._b1.get_ambient_temp_fractional()
-            fan = self._b1.get_fan_speed()
-
-            if None not in (d_i, d_f):
-                self.desired_temp = float(d_i) + float(d_f) / 10.0
-            if None not in (a_i, a_f):
-                self.ambient_temp = float(a_i) + float(a_f) / 10.0
-            if fan is not None:
-                self.fan_speed = float(fan)
-
-            # Board2
-            cur = self._b2.get_curtain_status()
-            ot = self._b2.get_outdoor_temp()
-            op = self._b2.get_outdoor_pressure()
-            li = self._b2.get_light_intensity()
-
-            if cur is not None:
-                self.current_curtain = float(cur)
-                if self.desired_curtain is None:
-                    self.desired_curtain = float(cur)
-            if ot is not None:
-                self.outdoor_temp = float(ot)
-            if op is not None:
-                self.outdoor_press = float(op)
-            if li is not None:
-                self.light_intensity = int(li)
-
-            self.last_error = ""
-        except Exception as e:
+            board.SET_ENCODER.encode(value)
+            self.last_error = f"SET {value:g} was not sent"
+        except ValueError as e:
             self.last_error = str(e)
-            # Do not crash UI; keep last known values
+        return False
+
+    def poll_stats(self) -> dict:
+        # Per-port line utilisation (0..1) and current poll interval of each channel
+        stats = {}
+        for label, sched in (("board1", self._sched1), ("board2", self._sched2)):
+            if sched is not None:
+                stats[label] = {"utilisation": sched.utilisation(self.baudrate), "intervals": sched.intervals()}
+        return stats
+
+    def _poll_board1(self, names: tuple | None = None) -> dict:
+        # One pipelined GET vector per board, decoded by the shared protocol schema
+        data = self._b1.read_all_data() if names is None else self._b1.read_channels(names)
+        if self._sched1 is not None:
+            self._sched1.observe(data)
+        if data and all(v is None for v in data.values()):
+            raise RuntimeError(f"Board#1 ({self.port_board1}) not answering")
+
+        values = {}
+        if data.get("desired_temp") is not None:
+            values["desired_temp"] = data["desired_temp"]
+        if data.get("ambient_temp") is not None:
+            values["ambient_temp"] = data["ambient_temp"]
+        if data.get("fan_speed") is not None:
+            values["fan_speed"] = float(data["fan_speed"])
+        return values
+
+    def _poll_board2(self, names: tuple | None = None) -> dict:
+        data = self._b2.read_all_data() if names is None else self._b2.read_channels(names)
+        if self._sched2 is not None:
+            self._sched2.observe(data)
+        if data and all(v is None for v in data.values()):
+            raise RuntimeError(f"Board#2 ({self.port_board2}) not answering")
+
+        values = {}
+        if data.get("curtain") is not None:
+            values["current_curtain"] = float(data["curtain"])
+        if data.get("outdoor_temp") is not None:
+            values["outdoor_temp"] = float(data["outdoor_temp"])
+        if data.get("outdoor_press") is not None:
+            values["outdoor_press"] = float(data["outdoor_press"])
+        if data.get("light") is not None:
+            values["light_intensity"] = int(data["light"])
+        return values
 
 
 class RealAircon:
@@ -120,7 +238,12 @@ class RealAircon:
         if not self._c.connected or self._c._b1 is None:
             raise RuntimeError("Not connected (Board1).")
         ok = self._c._b1.set_desired_temp(float(temp))
-        self._c.desired_temp = float(temp) if ok else self._c.desired_temp
+        if not ok:
+            return self._c.reject(self._c._b1, float(temp))
+        self._c.desired_temp = float(temp)
+        # The setpoint may switch the cooler, so the fan follows within a tick
+        self._c.boost("desired_temp")
+        self._c.boost("fan_speed")
         return ok
 
 
@@ -148,8 +271,11 @@ class RealCurtain:
             raise RuntimeError("Not connected (Board2).")
         v = float(val)
         ok = self._c._b2.set_curtain_status(v)
-        if ok:
-            self._c.desired_curtain = v
+        if not ok:
+            # Out of range or past the 6-bit SET payload (> 63.9 %): nothing was sent
+            return self._c.reject(self._c._b2, v)
+        self._c.desired_curtain = v
+        self._c.boost("curtain")  # the stepper starts moving
         return ok
 
 
@@ -0,0 +1,98 @@
+from typing import Any, Dict, Optional, Tuple
+
+# Every value a dashboard shows, in dirty-mask bit order
+FIELDS: Tuple[str, ...] = (
+    "connected",
+    "last_error",
+    # Board #1
+    "desired_temp",
+    "ambient_temp",
+    "fan_speed",
+    # Board #2
+    "desired_curtain",
+    "current_curtain",
+    "outdoor_temp",
+    "outdoor_press",
+    "light_intensity",
+)
+BIT: Dict[str, int] = {name: 1 << i for i, name in enumerate(FIELDS)}
+ALL_DIRTY = (1 << len(FIELDS)) - 1
+
+
+def _diff(old: Tuple[Any, ...], new: Tuple[Any, ...]) -> int:
+    mask = 0
+    for i, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            mask |= 1 << i
+    return mask
+
+
+class SystemSnapshot:
+    # Immutable state of one connection. seq only grows when some value changed;
+    # dirty has BIT[name] set for each field that differs from snapshot seq - 1.
+
+    __slots__ = FIELDS + ("seq", "dirty")
+
+    def __init__(self, seq: int, dirty: int, values: Tuple[Any, ...]):
+        init = object.__setattr__
+        init(self, "seq", seq)
+        init(self, "dirty", dirty)
+        for name, value in zip(FIELDS, values):
+            init(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("SystemSnapshot is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("SystemSnapshot is immutable")
+
+    def values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in FIELDS)
+
+    def changed(self, name: str, mask: Optional[int] = None) -> bool:
+        return bool((self.dirty if mask is None else mask) & BIT[name])
+
+    def changes_since(self, other: Optional["SystemSnapshot"]) -> int:
+        # Dirty mask relative to the snapshot a consumer last rendered; it may have
+        # skipped some (latest-wins queues), then the fields are compared directly
+        if other is None:
+            return ALL_DIRTY
+        if other.seq == self.seq:
+            return 0
+        if other.seq == self.seq - 1:
+            return self.dirty
+        return _diff(other.values(), self.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in FIELDS}
+        data["seq"] = self.seq
+        return data
+
+    def __repr__(self) -> str:
+        return f"SystemSnapshot(seq={self.seq}, dirty={self.dirty:#x})"
+
+
+class SnapshotTracker:
+    # Builds a connection's snapshots; while nothing changes the cached one is handed back
+
+    def __init__(self):
+        self.latest: Optional[SystemSnapshot] = None
+
+    def capture(self, source) -> SystemSnapshot:
+        # Read the FIELDS attributes of a connection (RealConnection, mock)
+        return self._publish(tuple(getattr(source, name, None) for name in FIELDS))
+
+    def publish(self, values: Dict[str, Any]) -> SystemSnapshot:
+        return self._publish(tuple(values.get(name) for name in FIELDS))
+
+    def _publish(self, values: Tuple[Any, ...]) -> SystemSnapshot:
+        last = self.latest
+        if last is None:
+            snap = SystemSnapshot(1, ALL_DIRTY, values)
+        else:
+            dirty = _diff(last.values(), values)
+            if not dirty:
+                return last
+            snap = SystemSnapshot(last.seq + 1, dirty, values)
+        self.latest = snap
+        return snap
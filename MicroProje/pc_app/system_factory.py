@@ -1,8 +1,20 @@
 from mock_api import build_mock_system
 from real_uart_system import build_real_system
 
+from api.log import configure_from_env
+
+MAX_FAILURES = 3  # consecutive failed polls before the ports are closed and reopened (daemon + fleet)
+
+
+def setup_logging(cfg: dict) -> None:
+    # Quiet unless asked: EEM_LOG wins, then config "log" ("debug", "info:json", ...).
+    # With "log_file" set, records go to that file instead of the console.
+    log_file = cfg.get("log_file") or None
+    configure_from_env(default=cfg.get("log") or None, file=log_file, console=log_file is None)
+
 
 def build_system(cfg: dict) -> dict:
     # default: gerçek sistem (mock test için manuel açılabilir)
+    setup_logging(cfg)
     use_mock = cfg.get("use_mock", False)
     return build_mock_system(cfg) if use_mock else build_real_system(cfg)
@@ -57,8 +57,10 @@ def aircon_screen(cfg: dict, conn, aircon) -> None:
             raw = input("Enter desired temp (10.0 - 50.0): ")
             try:
                 val = parse_temp(raw)
-                aircon.setDesiredTemp(val)
-                input(f"Set to {val:.1f} C. Press Enter to continue...")
+                if aircon.setDesiredTemp(val) is False:
+                    input(f"Rejected: {conn.last_error}. Press Enter to continue...")
+                else:
+                    input(f"Set to {val:.1f} C. Press Enter to continue...")
             except Exception as e:
                 input(f"Invalid input: {e}. Press Enter to continue...")
             continue
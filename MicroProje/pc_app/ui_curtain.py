@@ -1,14 +1,18 @@
 import os
 
+from api.protocol import set_encoder
+
+CURTAIN = set_encoder("2").channel  # settable range from the protocol schema
+
 
 def clear_screen() -> None:
     os.system("cls" if os.name == "nt" else "clear")
 
 
-def parse_percent(s: str) -> int:
-    val = int(s.strip())
-    if not (0 <= val <= 100):
-        raise ValueError("Curtain must be between 0 and 100")
+def parse_percent(s: str) -> float:
+    val = round(float(s.strip().replace(",", ".")), 1)
+    if not (CURTAIN.minimum <= val <= CURTAIN.maximum):
+        raise ValueError(f"Curtain must be between {CURTAIN.minimum:g} and {CURTAIN.maximum:g}")
     return val
 
 
@@ -60,11 +64,13 @@ def curtain_screen(cfg: dict, conn, curtain) -> None:
             if not conn.connected:
                 input("Not connected. Press Enter to continue...")
                 continue
-            raw = input("Enter desired curtain (0-100): ")
+            raw = input(f"Enter desired curtain ({CURTAIN.minimum:g}-{CURTAIN.maximum:g}): ")
             try:
                 val = parse_percent(raw)
-                curtain.setDesiredCurtain(val)
-                input(f"Set to {val}%. Press Enter to continue...")
+                if curtain.setDesiredCurtain(val) is False:
+                    input(f"Rejected: {conn.last_error}. Press Enter to continue...")
+                else:
+                    input(f"Set to {val}%. Press Enter to continue...")
             except Exception as e:
                 input(f"Invalid input: {e}. Press Enter to continue...")
             continue
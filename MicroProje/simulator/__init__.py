@@ -0,0 +1 @@
+"""Board simulators (pty) for hardware-free testing."""
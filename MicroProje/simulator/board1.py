@@ -0,0 +1,216 @@
+"""
+Board #1 (Klima) Simülatörü
+EEM Projesi - Donanımsız Test Altyapısı
+
+Board1.X/uart.asm içindeki UART_ProcessByte davranışının byte
+byte modelidir; pty üzerinden gerçek api/ ve uart_tools/
+istemcileriyle konuşur.
+
+Modellenen davranış:
+- GET 0x01-0x05: desired_frac, desired_int, ambient_frac,
+  ambient_int, fan_rps (tek byte cevap)
+- bit7=0 diğer byte'lar: yok sayılır (cevap yok)
+- SET: 0xC0|tam ve 0x80|ondalık, sıradan bağımsız çift olarak
+  tamamlanınca UART_TRY_COMMIT çalışır; 10.0-50.0 dışı veya
+  ondalık > 9 ise reddedilir (error_timer = 2)
+- 1 saniyelik tick (Temp_TMR1_ISR): fan_rps, error_timer,
+  ısıtıcı/soğutucu kontrolü (Temp_ControlUpdate)
+- Overrun ve servis gecikmesi: bkz. simulator.pic_uart
+
+Kullanım:
+    python -m simulator.board1 [--latency-us 200] [--baud 9600]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from .pic_uart import PicUartSimulator
+
+
+class Board1Firmware:
+    """
+    Board #1 firmware durum makinesi (saatten bağımsız)
+
+    Örnek Kullanım:
+        >>> fw = Board1Firmware(ambient=22.3)
+        >>> fw.process_byte(0x04)
+        22
+        >>> fw.process_byte(0xDE), fw.process_byte(0x85)   # 30.5 ayarla
+        (None, None)
+    """
+
+    def __init__(self, ambient=22.0, fan_rps_on=8, thermal_rate=0.0):
+        # main.asm başlangıç değerleri: desired = 25.0, fan = 0
+        self.desired_int = 25
+        self.desired_frac = 0
+        self.ambient = ambient            # LM35 ile ölçülen ortam (°C)
+        self.fan_rps = 0
+        self.fan_rps_on = fan_rps_on      # Soğutucu açıkken fan hızı (rps)
+        self.thermal_rate = thermal_rate  # Isıtıcı/soğutucu etkisi (°C/s)
+        self.heater = False
+        self.cooler = False
+
+        self.uart_new_int = 0
+        self.uart_new_frac = 0
+        self.got_int = False              # F_UART_GOT_IN
+        self.got_frac = False             # F_UART_GOT_FR
+        self.error_timer = 0
+        self.accepted = 0
+        self.rejected = 0
+
+        self._next_second = None
+
+    # ─────────────────────────────────────────────────────
+    # ORTAM SICAKLIĞI (ambient_int / ambient_frac)
+    # ─────────────────────────────────────────────────────
+
+    @property
+    def ambient_tenths(self):
+        return max(0, int(round(self.ambient * 10)))
+
+    @property
+    def ambient_int(self):
+        return self.ambient_tenths // 10
+
+    @property
+    def ambient_frac(self):
+        return self.ambient_tenths % 10
+
+    @property
+    def desired(self):
+        return self.desired_int + self.desired_frac / 10.0
+
+    # ─────────────────────────────────────────────────────
+    # UART_ProcessByte
+    # ─────────────────────────────────────────────────────
+
+    def process_byte(self, byte_val):
+        """
+        Tek byte işle
+
+        Returns:
+            int or None: GET cevabı, diğer byte'larda None
+        """
+        if byte_val == 0x01:
+            return self.desired_frac
+        if byte_val == 0x02:
+            return self.desired_int
+        if byte_val == 0x03:
+            return self.ambient_frac
+        if byte_val == 0x04:
+            return self.ambient_int
+        if byte_val == 0x05:
+            return self.fan_rps & 0xFF
+
+        if not byte_val & 0x80:
+            return None
+
+        payload = byte_val & 0x3F
+        if byte_val & 0x40:
+            self.uart_new_int = payload
+            self.got_int = True
+        else:
+            self.uart_new_frac = payload
+            self.got_frac = True
+        self._try_commit()
+        return None
+
+    def _try_commit(self):
+        """UART_TRY_COMMIT: çift tamamlandıysa doğrula ve uygula"""
+        if not (self.got_frac and self.got_int):
+            return
+        self.got_frac = False
+        self.got_int = False
+
+        new_int, new_frac = self.uart_new_int, self.uart_new_frac
+        valid = new_frac <= 9 and new_int >= 10 and (new_int < 50 or (new_int == 50 and new_frac == 0))
+        if valid:
+            self.desired_int = new_int
+            self.desired_frac = new_frac
+            self.accepted += 1
+        else:
+            self.error_timer = 2
+            self.rejected += 1
+
+    # ─────────────────────────────────────────────────────
+    # Temp_TMR1_ISR (1 saniye) + Temp_ControlUpdate
+    # ─────────────────────────────────────────────────────
+
+    def advance(self, now):
+        if self._next_second is None:
+            self._next_second = now + 1.0
+        while now >= self._next_second:
+            self._next_second += 1.0
+            self.tick_1s()
+
+    def tick_1s(self):
+        self.fan_rps = self.fan_rps_on if self.cooler else 0
+        if self.error_timer:
+            self.error_timer -= 1
+
+        if self.heater:
+            self.ambient += self.thermal_rate
+        elif self.cooler:
+            self.ambient -= self.thermal_rate
+
+        desired = self.desired_int * 10 + self.desired_frac
+        self.heater = desired > self.ambient_tenths
+        self.cooler = desired < self.ambient_tenths
+
+
+class Board1Simulator(PicUartSimulator):
+    """
+    pty üzerinden hizmet veren Board #1
+
+    Örnek Kullanım:
+        >>> sim = Board1Simulator(ambient=22.3, baud=9600).start()
+        >>> ac = AirConditionerSystemConnection()
+        >>> ac.setComPort(sim.port)
+        >>> sim.stop()
+    """
+
+    def __init__(self, ambient=22.0, fan_rps_on=8, thermal_rate=0.0,
+                 service_latency=0.0, baud=None, link=None, boot_delay=0.0):
+        super().__init__(Board1Firmware(ambient, fan_rps_on, thermal_rate),
+                         service_latency=service_latency, baud=baud, link=link, boot_delay=boot_delay)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Board #1 (klima) pty simülatörü")
+    parser.add_argument("--ambient", type=float, default=22.0, help="Başlangıç ortam sıcaklığı (°C)")
+    parser.add_argument("--fan", type=int, default=8, help="Soğutucu açıkken fan hızı (rps)")
+    parser.add_argument("--thermal-rate", type=float, default=0.1, help="Isıtma/soğutma hızı (°C/s)")
+    parser.add_argument("--latency-us", type=float, default=0.0, help="Byte başına servis gecikmesi (µs)")
+    parser.add_argument("--baud", type=int, default=None, help="Hat hızını taklit et (örn: 9600)")
+    parser.add_argument("--boot-ms", type=float, default=0.0, help="Başlangıçta cevapsız açılış süresi (ms)")
+    parser.add_argument("--link", default=None, help="pty yoluna sabit bir symlink oluştur")
+    args = parser.parse_args(argv)
+
+    sim = Board1Simulator(ambient=args.ambient, fan_rps_on=args.fan, thermal_rate=args.thermal_rate,
+                          service_latency=args.latency_us / 1e6, baud=args.baud,
+                          boot_delay=args.boot_ms / 1e3)
+    if args.link:
+        if os.path.lexists(args.link):
+            os.remove(args.link)
+        os.symlink(sim.port, args.link)
+
+    print(f"✓ Board #1 simülatörü: {args.link or sim.port}")
+    sys.stdout.flush()
+    started = time.monotonic()
+    try:
+        sim.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.link.close()
+        if args.link and os.path.islink(args.link):
+            os.remove(args.link)
+        fw = sim.firmware
+        print(f"\n📊 {time.monotonic() - started:.0f} s: {sim.stats} | "
+              f"SET kabul={fw.accepted} ret={fw.rejected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Board #2 (Perde) Simülatörü
+EEM Projesi - Donanımsız Test Altyapısı
+
+CurtainControlSystemConnection'da belgelenen UART protokolünün
+byte byte modelidir; pty üzerinden gerçek istemcilerle konuşur.
+
+Modellenen davranış:
+- GET 0x01-0x08: perde, dış sıcaklık, dış basınç ve ışık için
+  (ondalık, tam) byte çiftleri
+- SET: 0xC0|tam ve 0x80|ondalık çifti hedef perde konumunu
+  ayarlar (0.0-100.0, ondalık <= 9; aksi halde reddedilir)
+- Step motor: %1 = 10 step (R2.2.1), sabit step hızıyla hedefe
+  ilerler; konum her zaman 0.1% (1 step) çözünürlüktedir
+- BMP180 benzeri sıcaklık/basınç ve LDR benzeri ışık sinyalleri
+  (yavaş sinüs + gürültü), 100 ms'de bir örneklenir
+
+Protokol sınırları (firmware ile aynı):
+- SET yükü 6 bittir (0-63); %63.9 üzeri hedefler tek çiftle
+  gönderilemez, istemci (api.protocol.SetEncoder) bunları reddeder
+- GET cevapları 1 byte'tır; 255 üzeri basınç değerinin yalnızca
+  düşük byte'ı gönderilir (1013 hPa → 245). Bu, gerçek Board #2
+  firmware'i depoda olmadığından bir varsayımdır; istemciler ham
+  byte'ı okur, pencere setIntWindow(True) / int_window ile açılır
+
+Hız: GET cevapları 256 elemanlı bir tabloda hazır tutulur; yalnızca
+GET içeren bloklar tek bytes.translate() çağrısıyla cevaplanır.
+
+Kullanım:
+    python -m simulator.board2 [--step-rate 100] [--baud 9600]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+from api.protocol import BOARD2_CHANNELS
+
+from .pic_uart import PicUartSimulator
+
+STEPS_PER_PERCENT = 10  # R2.2.1: step motor %1 = 10 step
+
+
+class Board2Firmware:
+    """
+    Board #2 firmware durum makinesi
+
+    Örnek Kullanım:
+        >>> fw = Board2Firmware(curtain=40.0)
+        >>> fw.process_byte(0x02)
+        40
+        >>> fw.process_byte(0xC0 | 50), fw.process_byte(0x80 | 0)  # hedef %50
+        (None, None)
+    """
+
+    SENSOR_PERIOD = 0.1  # Sensör örnekleme aralığı (s)
+
+    def __init__(self, curtain=0.0, outdoor_temp=12.5, outdoor_press=1013.2, light=65.0,
+                 step_rate=100.0, noise=True, seed=None):
+        self.position = int(round(curtain * STEPS_PER_PERCENT))  # Motor konumu (step)
+        self.target = self.position                               # Hedef konum (step)
+        self.step_rate = step_rate                                # step/s
+
+        self.base_temp = outdoor_temp
+        self.base_press = outdoor_press
+        self.base_light = light
+        self.outdoor_temp = outdoor_temp
+        self.outdoor_press = outdoor_press
+        self.light = light
+        self.noise = noise
+        self._rng = random.Random(seed)
+
+        self.new_int = 0
+        self.new_frac = 0
+        self.got_int = False
+        self.got_frac = False
+        self.accepted = 0
+        self.rejected = 0
+
+        self._t0 = None
+        self._last_motor = None
+        self._next_sample = None
+        self._table = bytearray(256)  # GET komutu → cevap byte'ı
+        self._rebuild_table()
+
+    # ─────────────────────────────────────────────────────
+    # DURUM
+    # ─────────────────────────────────────────────────────
+
+    @property
+    def curtain(self):
+        """Mevcut perde konumu (%)"""
+        return self.position / STEPS_PER_PERCENT
+
+    @property
+    def moving(self):
+        return self.position != self.target
+
+    def _rebuild_table(self):
+        table = self._table
+        for ch in BOARD2_CHANNELS:   # firmware alanları şemadaki kanal adlarıyla aynı
+            tenths = max(0, int(round(getattr(self, ch.name) * 10)))
+            table[ch.frac_code] = tenths % 10               # ondalık
+            table[ch.int_code] = (tenths // 10) & 0xFF      # tam (1 byte)
+
+    # ─────────────────────────────────────────────────────
+    # UART
+    # ─────────────────────────────────────────────────────
+
+    def process_byte(self, byte_val):
+        """
+        Tek byte işle
+
+        Returns:
+            int or None: GET cevabı, diğer byte'larda None
+        """
+        if 0x01 <= byte_val <= 0x08:
+            return self._table[byte_val]
+        if not byte_val & 0x80:
+            return None
+
+        if byte_val & 0x40:
+            self.new_int = byte_val & 0x3F
+            self.got_int = True
+        else:
+            self.new_frac = byte_val & 0x3F
+            self.got_frac = True
+        self._try_commit()
+        return None
+
+    def process_block(self, data):
+        """
+        Zamanlamasız hızlı yol: bloktaki byte'ları sırayla işle
+
+        Returns:
+            bytes: Gönderilecek cevaplar
+        """
+        if data and min(data) >= 0x01 and max(data) <= 0x08:
+            return data.translate(self._table)
+        replies = bytearray()
+        for byte_val in data:
+            reply = self.process_byte(byte_val)
+            if reply is not None:
+                replies.append(reply)
+        return bytes(replies)
+
+    def _try_commit(self):
+        if not (self.got_int and self.got_frac):
+            return
+        self.got_int = False
+        self.got_frac = False
+
+        if self.new_frac <= 9 and (self.new_int < 100 or (self.new_int == 100 and self.new_frac == 0)):
+            self.target = self.new_int * STEPS_PER_PERCENT + self.new_frac
+            self.accepted += 1
+        else:
+            self.rejected += 1
+
+    # ─────────────────────────────────────────────────────
+    # ZAMAN: STEP MOTOR + SENSÖRLER
+    # ─────────────────────────────────────────────────────
+
+    def advance(self, now):
+        if self._t0 is None:
+            self._t0 = now
+            self._last_motor = now
+            self._next_sample = now
+
+        changed = False
+        if self.position != self.target:
+            steps = int((now - self._last_motor) * self.step_rate)
+            if steps:
+                remaining = self.target - self.position
+                move = min(steps, abs(remaining))
+                self.position += move if remaining > 0 else -move
+                self._last_motor += steps / self.step_rate
+                changed = True
+        else:
+            self._last_motor = now
+
+        if now >= self._next_sample:
+            self._next_sample = now + self.SENSOR_PERIOD
+            self._sample(now - self._t0)
+            changed = True
+
+        if changed:
+            self._rebuild_table()
+
+    def _sample(self, t):
+        """BMP180/LDR benzeri sinyaller: yavaş periyodik değişim + gürültü"""
+        jitter = self._rng.gauss if self.noise else (lambda mu, sigma: 0.0)
+        self.outdoor_temp = self.base_temp + 1.5 * math.sin(2 * math.pi * t / 600.0) + jitter(0, 0.05)
+        self.outdoor_press = self.base_press + 0.8 * math.sin(2 * math.pi * t / 1800.0) + jitter(0, 0.1)
+        light = self.base_light + 20.0 * math.sin(2 * math.pi * t / 300.0) + jitter(0, 1.0)
+        self.light = min(100.0, max(0.0, light))
+
+
+class Board2Simulator(PicUartSimulator):
+    """
+    pty üzerinden hizmet veren Board #2
+
+    Örnek Kullanım:
+        >>> sim = Board2Simulator(curtain=40.0).start()
+        >>> curtain = CurtainControlSystemConnection()
+        >>> curtain.setComPort(sim.port)
+        >>> sim.stop()
+    """
+
+    def __init__(self, curtain=0.0, outdoor_temp=12.5, outdoor_press=1013.2, light=65.0,
+                 step_rate=100.0, noise=True, seed=None, service_latency=0.0, baud=None, link=None,
+                 boot_delay=0.0):
+        firmware = Board2Firmware(curtain, outdoor_temp, outdoor_press, light, step_rate, noise, seed)
+        super().__init__(firmware, service_latency=service_latency, baud=baud, link=link,
+                         boot_delay=boot_delay)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Board #2 (perde) pty simülatörü")
+    parser.add_argument("--curtain", type=float, default=0.0, help="Başlangıç perde konumu (%%)")
+    parser.add_argument("--step-rate", type=float, default=100.0, help="Step motor hızı (step/s)")
+    parser.add_argument("--no-noise", action="store_true", help="Sensör gürültüsünü kapat")
+    parser.add_argument("--latency-us", type=float, default=0.0, help="Byte başına servis gecikmesi (µs)")
+    parser.add_argument("--baud", type=int, default=None, help="Hat hızını taklit et (örn: 9600)")
+    parser.add_argument("--boot-ms", type=float, default=0.0, help="Başlangıçta cevapsız açılış süresi (ms)")
+    parser.add_argument("--link", default=None, help="pty yoluna sabit bir symlink oluştur")
+    args = parser.parse_args(argv)
+
+    sim = Board2Simulator(curtain=args.curtain, step_rate=args.step_rate, noise=not args.no_noise,
+                          service_latency=args.latency_us / 1e6, baud=args.baud,
+                          boot_delay=args.boot_ms / 1e3)
+    if args.link:
+        if os.path.lexists(args.link):
+            os.remove(args.link)
+        os.symlink(sim.port, args.link)
+
+    print(f"✓ Board #2 simülatörü: {args.link or sim.port}")
+    sys.stdout.flush()
+    started = time.monotonic()
+    try:
+        sim.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.link.close()
+        if args.link and os.path.islink(args.link):
+            os.remove(args.link)
+        fw = sim.firmware
+        print(f"\n📊 {time.monotonic() - started:.0f} s: {sim.stats} | "
+              f"SET kabul={fw.accepted} ret={fw.rejected} | perde=%{fw.curtain:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+PIC16F877A UART Modeli - Simülatör Çekirdeği
+EEM Projesi - Donanımsız Test Altyapısı
+
+Board firmware'lerinin UART_Service döngüsünü pty üzerinde taklit
+eder. Firmware modeli (Board1Firmware, Board2Firmware) yalnızca
+byte başına ne yapılacağını bilir; zamanlama burada modellenir:
+
+- Hat süresi: baud verilirse her byte 10 bit süresi kadar sürer
+  (gelen ve giden yönde ayrı ayrı)
+- Servis gecikmesi: ana döngü UART_Service'i service_latency
+  aralıkla çağırır, her çağrıda en fazla bir byte işlenir
+- Overrun: 2 byte'lık RX FIFO doluyken gelen byte OERR'i kurar ve
+  kaybolur; OERR kuruluyken gelen byte'lar da kaybolur. Sonraki
+  servis çağrısı byte okumadan yalnızca OERR'i temizler
+  (UART_CLR_OERR: CREN 0 → 1)
+- Açılış: boot_delay verilirse start()/reset() sonrası o süre
+  boyunca gelen byte'lar kaybolur (DTR reseti sonrası firmware
+  henüz UART'ı kurmamıştır)
+
+service_latency=0 ve baud=None iken zamanlama atlanır ve her gelen
+blok tek geçişte cevaplanır (yük testi için en hızlı yol).
+"""
+
+import math
+import threading
+import time
+from collections import deque
+
+from .pty_link import PtyLink
+
+INF = float("inf")
+
+
+class PicUartSimulator:
+    """
+    pty üzerinde bir firmware modelini çalıştıran UART simülatörü
+
+    Firmware nesnesi şu metotları sağlamalıdır:
+        process_byte(byte_val) -> int or None   (cevap byte'ı)
+        advance(now)                            (zamanlayıcılar)
+    İsteğe bağlı olarak process_block(data) -> bytes ile zamanlamasız
+    yolda bütün bir bloğu tek çağrıda cevaplayabilir.
+
+    Örnek Kullanım:
+        >>> sim = PicUartSimulator(Board1Firmware(), baud=9600).start()
+        >>> ac.setComPort(sim.port)
+        >>> sim.stop()
+    """
+
+    FIFO_DEPTH = 2  # PIC16F877A RCREG FIFO derinliği
+
+    def __init__(self, firmware, service_latency=0.0, baud=None, link=None, boot_delay=0.0):
+        self.firmware = firmware
+        self.service_latency = service_latency         # Ana döngü periyodu (s)
+        self.byte_time = 10.0 / baud if baud else 0.0  # 8N1 byte süresi (s)
+        self.boot_delay = boot_delay                   # Reset sonrası açılış süresi (s)
+        self.link = link or PtyLink()
+        self.stats = {"rx": 0, "tx": 0, "overruns": 0, "dropped": 0}
+
+        self._arrivals = deque()   # (varış zamanı, byte)
+        self._fifo = deque()       # RCREG FIFO
+        self._outgoing = deque()   # (gönderim zamanı, byte)
+        self._oerr = False
+        self._tick_at = None       # İş bekleyen bir sonraki UART_Service çağrısı
+        self._last_tick = -INF
+        self._rx_free = 0.0        # Gelen hat boşalma zamanı
+        self._tx_free = 0.0        # Giden hat boşalma zamanı
+        self._boot_until = 0.0     # Bu zamana kadar gelen byte'lar kaybolur
+
+        self._running = False
+        self._thread = None
+
+    @property
+    def port(self):
+        """İstemcinin açacağı port yolu (örn: /dev/pts/3)"""
+        return self.link.port
+
+    @property
+    def realtime(self):
+        return self.service_latency > 0 or self.byte_time > 0
+
+    def start(self):
+        self.reset()
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="pic-uart-sim", daemon=True)
+        self._thread.start()
+        return self
+
+    def reset(self):
+        """PIC reseti (DTR kenarı): boot_delay boyunca UART cevap vermez"""
+        self._boot_until = time.monotonic() + self.boot_delay
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=1)
+        self.link.close()
+
+    def serve_forever(self):
+        """Ön planda çalış (CLI için)"""
+        self._running = True
+        self._serve()
+
+    # ═════════════════════════════════════════════════════════
+    # OLAY DÖNGÜSÜ
+    # ═════════════════════════════════════════════════════════
+
+    def _serve(self):
+        while self._running:
+            now = time.monotonic()
+            data = self.link.read(self._wait_time(now))
+            now = time.monotonic()
+            self.firmware.advance(now)
+            if data and now < self._boot_until:
+                self.stats["dropped"] += len(data)   # Firmware henüz açılmadı
+                continue
+
+            if not self.realtime:
+                if data:
+                    self._process_block(data)
+                continue
+
+            if data:
+                self._receive(data, now)
+            self._run_until(now)
+            self._flush(now)
+
+    def _process_block(self, data):
+        """Zamanlamasız hızlı yol: bloktaki her byte'ı sırayla cevapla"""
+        process_block = getattr(self.firmware, "process_block", None)
+        if process_block is not None:
+            replies = process_block(data)
+        else:
+            process = self.firmware.process_byte
+            replies = bytearray()
+            for byte_val in data:
+                reply = process(byte_val)
+                if reply is not None:
+                    replies.append(reply)
+        self.stats["rx"] += len(data)
+        if replies:
+            self.stats["tx"] += len(replies)
+            self.link.write(bytes(replies))
+
+    def _wait_time(self, now):
+        pending = INF
+        if self._arrivals:
+            pending = self._arrivals[0][0]
+        if self._tick_at is not None:
+            pending = min(pending, self._tick_at)
+        if self._outgoing:
+            pending = min(pending, self._outgoing[0][0])
+        return max(0.0, min(pending - now, 0.05))
+
+    def _receive(self, data, now):
+        for byte_val in data:
+            arrival = max(now, self._rx_free) + self.byte_time
+            self._rx_free = arrival
+            self._arrivals.append((arrival, byte_val))
+
+    def _next_tick(self, t):
+        """t anından sonraki ilk UART_Service çağrısı (ana döngü fazında)"""
+        period = self.service_latency
+        if period <= 0:
+            return t
+        if self._last_tick == -INF:
+            return t + period
+        return self._last_tick + max(1, math.ceil((t - self._last_tick) / period)) * period
+
+    def _run_until(self, now):
+        while True:
+            t_arr = self._arrivals[0][0] if self._arrivals else INF
+            t_srv = self._tick_at if self._tick_at is not None else INF
+            if min(t_arr, t_srv) > now:
+                return
+
+            if t_arr <= t_srv:
+                _, byte_val = self._arrivals.popleft()
+                self.stats["rx"] += 1
+                if self._oerr:
+                    self.stats["dropped"] += 1
+                elif len(self._fifo) >= self.FIFO_DEPTH:
+                    self._oerr = True
+                    self.stats["overruns"] += 1
+                    self.stats["dropped"] += 1
+                else:
+                    self._fifo.append(byte_val)
+                if self._tick_at is None:
+                    self._tick_at = self._next_tick(t_arr)
+                continue
+
+            tick = self._tick_at
+            self._last_tick = tick
+            if self._oerr:
+                self._oerr = False  # UART_CLR_OERR: bu çağrıda byte okunmaz
+            else:
+                reply = self.firmware.process_byte(self._fifo.popleft())
+                if reply is not None:
+                    sent = max(tick, self._tx_free) + self.byte_time
+                    self._tx_free = sent
+                    self._outgoing.append((sent, reply))
+            self._tick_at = tick + self.service_latency if (self._fifo or self._oerr) else None
+
+    def _flush(self, now):
+        out = bytearray()
+        while self._outgoing and self._outgoing[0][0] <= now:
+            out.append(self._outgoing.popleft()[1])
+        if out:
+            self.stats["tx"] += len(out)
+            self.link.write(bytes(out))
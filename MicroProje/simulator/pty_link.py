@@ -0,0 +1,63 @@
+"""
+pty Bağlantısı - Simülatörler için Sanal Seri Port
+EEM Projesi - Donanımsız Test Altyapısı
+
+Linux pty çifti açar. Simülatör master ucunu kullanır, istemciler
+(api/, uart_tools/) slave ucunun yolunu (örn: /dev/pts/3) normal
+bir COM port gibi açar.
+"""
+
+import os
+import pty
+import select
+import tty
+
+
+class PtyLink:
+    """
+    Simülatör tarafı pty ucu
+
+    Örnek Kullanım:
+        >>> link = PtyLink()
+        >>> print(link.port)      # istemcinin açacağı port
+        >>> data = link.read(0.1)
+        >>> link.write(b"\\x18")
+        >>> link.close()
+    """
+
+    def __init__(self):
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+
+    def fileno(self):
+        return self.master
+
+    def read(self, timeout):
+        """
+        Gelen byte'ları oku
+
+        Args:
+            timeout (float or None): En fazla bekleme süresi (s)
+
+        Returns:
+            bytes: Gelen veri (timeout'ta b"")
+        """
+        ready, _, _ = select.select([self.master], [], [], timeout)
+        if not ready:
+            return b""
+        try:
+            return os.read(self.master, 4096)
+        except OSError:
+            return b""
+
+    def write(self, data):
+        """Byte'ları istemciye gönder"""
+        os.write(self.master, data)
+
+    def close(self):
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
@@ -0,0 +1,77 @@
+"""
+Board #2 Poll Throughput ve Kuyruk Gecikmesi (Benchmark)
+EEM Projesi - BM-2 Görevi
+
+Zamanlamasız (baud=None, service_latency=0) simulator.board2'ye
+karşı CurtainControlSystemConnection.update() art arda çağrılır.
+Simülatör GET bloklarını tek translate() ile cevapladığı için
+ölçülen süre istemci yığınının (pyserial + api/) süresidir.
+
+Kullanım:
+    python tests/bench_board2_throughput.py [sure_saniye]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.curtain_control import CurtainControlSystemConnection
+from api.read_cache import ReadCache
+from simulator.board2 import Board2Simulator
+
+
+def percentile(sorted_samples, p):
+    """Sıralı örneklerden p. yüzdelik (en yakın sıra)"""
+    index = min(len(sorted_samples) - 1, int(round(p / 100.0 * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def measure(duration, pipelined):
+    """duration saniye boyunca update() çağır, (poll/s, örnekler ms) döndür"""
+    board = Board2Simulator(curtain=40.0, step_rate=1000.0).start()
+    curtain = CurtainControlSystemConnection()
+    samples = []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            curtain.setComPort(board.port)
+            curtain.setPipelined(pipelined)
+            curtain.setReadCache(ReadCache())   # önbelleksiz: her update() porta gider
+            if not curtain.open():
+                raise RuntimeError(f"Port açılamadı: {board.port}")
+            started = time.perf_counter()
+            end = started + duration
+            while True:
+                t0 = time.perf_counter()
+                if t0 >= end:
+                    break
+                curtain.update()
+                samples.append((time.perf_counter() - t0) * 1000.0)
+            elapsed = time.perf_counter() - started
+            curtain.close()
+    finally:
+        board.stop()
+    samples.sort()
+    return len(samples) / elapsed, samples
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+
+    print("=" * 76)
+    print(f"  Board #2 update() THROUGHPUT - {duration:.0f} s (pty simülatör, ms)")
+    print("=" * 76)
+    print(f"  {'Mod':<12}{'poll/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'maks':>10}")
+    for name, pipelined in (("Byte byte", False), ("Toplu", True)):
+        rate, samples = measure(duration, pipelined)
+        cells = "".join(f"{percentile(samples, p):>10.3f}" for p in (50, 95, 99))
+        print(f"  {name:<12}{rate:>10.0f}{cells}{samples[-1]:>10.3f}")
+    print("=" * 76)
+
+
+if __name__ == "__main__":
+    main()
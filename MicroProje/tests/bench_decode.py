@@ -0,0 +1,100 @@
+"""
+Byte Çözme Ölçümü (Micro-benchmark)
+EEM Projesi - BM-2 Görevi
+
+Eski decode_command (her çağrıda iki dict kurup bit testi yapan)
+ile api.protocol tablosundan çözme karşılaştırılır. Tablo yolunun
+byte başına maliyeti 1 µs'nin altında kalmalıdır. format_chunk
+satırı ayrıca gösterilir (maliyetin çoğu log satırı biçimlendirme).
+
+Kullanım:
+    python tests/bench_decode.py [byte_sayisi]
+"""
+
+import os
+import sys
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.protocol import decode_table
+from uart_tools.uart_monitor import UARTMonitor
+
+LIMIT_NS = 1000.0   # byte başına üst sınır
+
+
+def legacy_decode_command(byte_val):
+    """Tablo öncesi UARTMonitor.decode_command (karşılaştırma için)"""
+    commands_board1 = {
+        0x01: "İstenen sıcaklık (ondalık) AL",
+        0x02: "İstenen sıcaklık (tam) AL",
+        0x03: "Ortam sıcaklığı (ondalık) AL",
+        0x04: "Ortam sıcaklığı (tam) AL",
+        0x05: "Fan hızı AL"
+    }
+    commands_board2 = {
+        0x01: "Perde (ondalık) AL",
+        0x02: "Perde (tam) AL",
+        0x03: "Dış sıcaklık (ondalık) AL",
+        0x04: "Dış sıcaklık (tam) AL",
+        0x05: "Dış basınç (ondalık) AL",
+        0x06: "Dış basınç (tam) AL",
+        0x07: "Işık (ondalık) AL",
+        0x08: "Işık (tam) AL"
+    }
+    if byte_val & 0xC0 == 0xC0:
+        return f"SET (tam) = {byte_val & 0x3F}"
+    elif byte_val & 0x80 == 0x80:
+        return f"SET (ondalık) = {byte_val & 0x3F}"
+    if byte_val in commands_board1:
+        return f"[B1] {commands_board1[byte_val]}"
+    elif byte_val in commands_board2:
+        return f"[B2] {commands_board2[byte_val]}"
+    else:
+        return f"Bilinmeyen komut"
+
+
+def per_byte_ns(fn, data, chunk=64):
+    """fn(parça) süresini byte başına ns olarak ölç"""
+    chunks = [data[i:i + chunk] for i in range(0, len(data), chunk)]
+    t0 = time.perf_counter_ns()
+    for part in chunks:
+        fn(part)
+    return (time.perf_counter_ns() - t0) / len(data)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    # Tipik trafik: GET taraması + SET çiftleri + ara sıra bilinmeyen byte
+    pattern = bytes([0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0xDE, 0x85, 0x7F, 0x40])
+    data = (pattern * (size // len(pattern) + 1))[:size]
+
+    table = decode_table("both")
+    assert all(table[b] == legacy_decode_command(b) for b in range(256))
+
+    monitor = UARTMonitor()
+    cases = [
+        ("Eski decode_command", lambda part: [legacy_decode_command(b) for b in part]),
+        ("Tablo, byte byte", lambda part: [table[part[i]] for i in range(len(part))]),
+        ("Tablo, tek geçiş (map)", lambda part: list(map(table.__getitem__, part))),
+        ("Tablo, liste üreteci", lambda part: [table[b] for b in part]),
+        ("format_chunk (log satırı)", lambda part: monitor.format_chunk(0, part)),
+    ]
+
+    print("=" * 50)
+    print(f"  BYTE ÇÖZME - {size} byte, 64 byte'lık parçalar")
+    print("=" * 50)
+    results = {}
+    for name, fn in cases:
+        results[name] = min(per_byte_ns(fn, data) for _ in range(3))
+        print(f"  {name:<28}{results[name]:>10.1f} ns/byte")
+    print("=" * 50)
+
+    ok = all(results[name] < LIMIT_NS for name in results if name.startswith("Tablo"))
+    print(f"  {'✓' if ok else '✗'} Tablo yolu < {LIMIT_NS / 1000:.0f} µs/byte")
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,82 @@
+"""
+Mock Filo Motoru Ölçümü (Benchmark)
+EEM Projesi - BM-2 Görevi
+
+pc_app/mock_engine.MockFleetEngine.step() süresini farklı ev
+sayıları için ölçer ve tek evlik mock görünümlerinin (mock_api)
+motorla tutarlı kaldığını ve perde motor profilini kontrol eder.
+
+Kullanım:
+    python tests/bench_mock_engine.py [tekrar_sayisi]
+"""
+
+import os
+import sys
+import time
+
+# pc_app modülleri düz import kullanır (from mock_api import ...)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'pc_app')))
+
+from mock_api import build_mock_fleet
+from mock_engine import CurtainMotorProfile, MockFleetEngine
+
+CONFIG = {"port_board1": "COM3", "port_board2": "COM4", "baudrate": 9600}
+
+
+def check_views():
+    """Görünüm üzerinden yazılan değer motor satırına yansımalı"""
+    systems = build_mock_fleet(CONFIG, 3, seed=1)
+    engine = systems[0]["conn"].engine
+    systems[1]["aircon"].setDesiredTemp(30.0)
+    systems[2]["conn"].light_intensity = 10
+    engine.step(now=engine.last_update[0] + 1.0)
+
+    assert engine.desired_temp[1] == 30.0 and systems[0]["aircon"].getDesiredTemp() == 24.0
+    assert systems[2]["curtain"].getDesiredCurtain() == 100       # karanlık → otomatik kapan
+    assert systems[2]["curtain"].getCurrentCurtain() == 50        # 1 s × 10 %/s
+    assert isinstance(systems[0]["curtain"].getLightIntensity(), int)
+
+
+def check_motor():
+    """Perde hareketi kapalı formda: uzun bekleme tek adımda, ondalıklı konum"""
+    engine = MockFleetEngine(2, seed=1, motor=CurtainMotorProfile(step_rate=100.0, accel=200.0))
+    t0 = engine.last_update[0]
+    engine.light_intensity[:] = 100
+    engine.desired_curtain[:] = (45.3, 40.2)   # 53 step ve 2 step
+    engine.step(now=t0 + 0.5)
+    # 0.5 s rampa: 25 step; 2 step'lik üçgen profil 0.2 s'de biter
+    assert list(engine.current_curtain) == [42.5, 40.2], engine.current_curtain
+    engine.step(now=t0 + 1e6)
+    assert list(engine.current_curtain) == [45.3, 40.2]
+
+    engine.desired_curtain[0] = 0.0           # geri dönüş, sabit hız sonrası
+    engine.step(now=t0 + 1e6 + 1.0)
+    assert 0.0 < engine.current_curtain[0] < 45.3
+
+
+def measure(size, rounds):
+    """Ortalama step() süresi (ms)"""
+    engine = MockFleetEngine(size, seed=0)
+    now = time.time()
+    engine.step(now)
+    t0 = time.perf_counter()
+    for i in range(rounds):
+        engine.step(now + 0.5 * (i + 1))
+    return (time.perf_counter() - t0) * 1000.0 / rounds
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    check_views()
+    check_motor()
+
+    print("=" * 44)
+    print(f"  MockFleetEngine.step() - {rounds} tekrar")
+    print("=" * 44)
+    for size in (1, 100, 1000, 10000, 100000):
+        print(f"  {size:>7} ev {measure(size, rounds):>12.3f} ms")
+    print("=" * 44)
+
+
+if __name__ == "__main__":
+    main()
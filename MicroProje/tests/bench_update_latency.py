@@ -0,0 +1,105 @@
+"""
+update() Gecikme Ölçümü (Benchmark)
+EEM Projesi - BM-2 Görevi
+
+Eski davranış (her byte sonrası sabit 50 ms bekleme), cevap
+odaklı byte byte mod ve toplu (pipelined) mod pty üzerindeki
+simulator.board1 / simulator.board2'ye karşı ölçülür. Simülatörler
+9600 baud hat süresini (byte başına ~1.04 ms) taklit eder.
+
+Kullanım:
+    python tests/bench_update_latency.py [tekrar_sayisi]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.curtain_control import CurtainControlSystemConnection
+from api.read_cache import ReadCache
+from simulator.board1 import Board1Simulator
+from simulator.board2 import Board2Simulator
+
+
+class _LegacyMixin:
+    """Eski _send_byte davranışı: her byte sonrası sabit 50 ms"""
+
+    def _send_byte(self, byte_val):
+        self.ser.write(bytes([byte_val]))
+        time.sleep(0.05)
+        return True
+
+    def _query(self, cmd):
+        self._send_byte(cmd)
+        return self._read_byte()
+
+
+class LegacyAirConditioner(_LegacyMixin, AirConditionerSystemConnection):
+    pass
+
+
+class LegacyCurtainControl(_LegacyMixin, CurtainControlSystemConnection):
+    pass
+
+
+def board1():
+    return Board1Simulator(ambient=22.3, baud=9600).start()
+
+
+def board2():
+    return Board2Simulator(curtain=40.0, baud=9600).start()
+
+
+def measure(conn_cls, make_board, rounds, pipelined=False):
+    """update() süresini ölç, (ortalama, en kötü) ms döndür"""
+    board = make_board()
+    conn = conn_cls()
+    samples = []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            conn.setComPort(board.port)
+            conn.setPipelined(pipelined)
+            conn.setReadCache(ReadCache())   # önbelleksiz: her update() porta gider
+            if not conn.open():
+                raise RuntimeError(f"Port açılamadı: {board.port}")
+            for _ in range(rounds):
+                t0 = time.perf_counter()
+                conn.update()
+                samples.append((time.perf_counter() - t0) * 1000.0)
+            conn.close()
+    finally:
+        board.stop()
+    return sum(samples) / len(samples), max(samples)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    cases = [
+        ("Board #1 update()", LegacyAirConditioner, AirConditionerSystemConnection, board1),
+        ("Board #2 update()", LegacyCurtainControl, CurtainControlSystemConnection, board2),
+    ]
+
+    print("=" * 76)
+    print(f"  update() GECİKMESİ - {rounds} tekrar (pty simülatör, ort/maks ms)")
+    print("=" * 76)
+    print(f"  {'Durum':<20}{'Eski (50 ms)':>18}{'Byte byte':>18}{'Toplu':>18}")
+    for name, legacy_cls, new_cls, make_board in cases:
+        results = [
+            measure(legacy_cls, make_board, rounds),
+            measure(new_cls, make_board, rounds, pipelined=False),
+            measure(new_cls, make_board, rounds, pipelined=True),
+        ]
+        cells = "".join(f"{avg:>10.1f} / {worst:<5.1f}" for avg, worst in results)
+        print(f"  {name:<20}{cells}")
+    print("=" * 76)
+
+
+if __name__ == "__main__":
+    main()
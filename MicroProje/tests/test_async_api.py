@@ -0,0 +1,141 @@
+"""
+asyncio API Test Programı
+EEM Projesi - BM-2 Görevi
+
+AsyncAirConditionerSystemConnection ve
+AsyncCurtainControlSystemConnection sınıflarını pty üzerindeki
+simülatörlere karşı test eder (donanım gerekmez, Linux).
+
+Kullanım:
+    python tests/test_async_api.py
+"""
+
+import asyncio
+import os
+import sys
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.async_home_automation import (
+    AsyncAirConditionerSystemConnection,
+    AsyncCurtainControlSystemConnection,
+)
+from simulator.board1 import Board1Simulator
+from simulator.board2 import Board2Simulator
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+async def _open(conn_cls, board):
+    conn = conn_cls()
+    conn.setComPort(board.port)
+    if not await conn.open():
+        raise RuntimeError(f"Port açılamadı: {board.port}")
+    return conn
+
+
+def test_update_and_set():
+    """
+    Test 1: Tek board okuma + ayarlama
+    """
+    print_subheader("TEST 1: update() / setDesiredTemp()")
+
+    async def scenario():
+        board = Board1Simulator(ambient=22.3).start()
+        ac = await _open(AsyncAirConditionerSystemConnection, board)
+        try:
+            assert await ac.update()
+            assert ac.getAmbientTemp() == 22.3
+            assert ac.getDesiredTemp() == 25.0
+            assert ac.getFanSpeed() == 0
+
+            assert await ac.setDesiredTemp(31.5)
+            assert not await ac.setDesiredTemp(55.0)
+            await ac.update()
+            assert ac.getDesiredTemp() == 31.5
+        finally:
+            await ac.close()
+            board.stop()
+
+    asyncio.run(scenario())
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_many_boards_many_clients():
+    """
+    Test 2: Tek event loop, 4 board, board başına 20 eşzamanlı istemci
+    """
+    print_subheader("TEST 2: Çoklu board / eşzamanlı istemci")
+
+    async def scenario():
+        boards = [Board1Simulator().start(), Board2Simulator(curtain=40.0, noise=False).start(),
+                  Board1Simulator().start(), Board2Simulator(curtain=40.0, noise=False).start()]
+        classes = [AsyncAirConditionerSystemConnection, AsyncCurtainControlSystemConnection] * 2
+        conns = await asyncio.gather(*(_open(cls, b) for cls, b in zip(classes, boards)))
+        conns[3].setIntWindow(True)
+        try:
+            results = await asyncio.gather(*(c.update() for c in conns for _ in range(20)))
+            assert all(results)
+            assert conns[1].getCurtainStatus() == 40.0
+            assert 10.0 < conns[1].getOutdoorTemp() < 15.0
+            assert conns[1].getOutdoorPress() == 245.2   # varsayılan: ham byte (baseline)
+            assert conns[3].getOutdoorPress() == 1013.2  # setIntWindow: düşük byte pencereye açılır
+        finally:
+            for conn in conns:
+                await conn.close()
+            for board in boards:
+                board.stop()
+
+    asyncio.run(scenario())
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_missing_reply_fallback():
+    """
+    Test 3: Overrun ile eksik cevap → byte byte geri dönüş
+    """
+    print_subheader("TEST 3: Eksik cevap")
+
+    async def scenario():
+        board = Board2Simulator(curtain=40.0, noise=False, baud=9600, service_latency=0.004).start()
+        curtain = await _open(AsyncCurtainControlSystemConnection, board)
+        try:
+            curtain.setBatchFallback(False)
+            assert not await curtain.update()
+            assert curtain.getCurtainStatus() == 0.0  # okunamadı → eski değer
+
+            curtain.setBatchFallback(True)
+            assert await curtain.update()
+            assert curtain.getCurtainStatus() == 40.0
+            assert board.stats["overruns"] >= 1
+        finally:
+            await curtain.close()
+            board.stop()
+
+    asyncio.run(scenario())
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Okuma/Ayarlama": test_update_and_set(),
+        "Çoklu Board": test_many_boards_many_clients(),
+        "Eksik Cevap": test_missing_reply_fallback(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
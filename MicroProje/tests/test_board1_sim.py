@@ -0,0 +1,151 @@
+"""
+Board #1 Simülatör Testi
+EEM Projesi - BM-2 Görevi
+
+Gerçek istemci kodunu (api/, uart_tools/) donanım olmadan
+simulator.board1 üzerinde çalıştırır (Linux pty).
+
+Kullanım:
+    python tests/test_board1_sim.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.log import configure
+from simulator.board1 import Board1Firmware, Board1Simulator
+from uart_tools.uart_board1 import UARTBoard1
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def _open_api(sim):
+    ac = AirConditionerSystemConnection()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ac.setComPort(sim.port)
+        assert ac.open()
+    return ac
+
+
+def test_commit_rules():
+    """
+    Test 1: UART_TRY_COMMIT doğrulama kuralları (saf model)
+    """
+    print_subheader("TEST 1: SET çifti doğrulama")
+
+    fw = Board1Firmware()
+    cases = [
+        ((0xC0 | 30, 0x80 | 5), 30.5),   # normal
+        ((0x80 | 2, 0xC0 | 21), 21.2),   # önce ondalık, sonra tam
+        ((0xC0 | 50, 0x80 | 0), 50.0),   # üst sınır
+        ((0xC0 | 50, 0x80 | 1), 50.0),   # 50.1 → ret
+        ((0xC0 | 9, 0x80 | 9), 50.0),    # 9.9 → ret
+        ((0xC0 | 20, 0x80 | 10), 50.0),  # ondalık > 9 → ret
+        ((0xC0 | 10, 0x80 | 0), 10.0),   # alt sınır
+    ]
+    for cmds, expected in cases:
+        for cmd in cmds:
+            assert fw.process_byte(cmd) is None
+        assert fw.desired == expected, (cmds, fw.desired)
+    assert fw.rejected == 3 and fw.error_timer == 2
+    assert fw.process_byte(0x06) is None and fw.process_byte(0x7F) is None
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_api_roundtrip():
+    """
+    Test 2: AirConditionerSystemConnection update()/setDesiredTemp()
+    """
+    print_subheader("TEST 2: API okuma/ayarlama")
+
+    sim = Board1Simulator(ambient=22.3, baud=9600).start()
+    ac = _open_api(sim)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.update()
+            assert (ac.getAmbientTemp(), ac.getDesiredTemp()) == (22.3, 25.0)
+            assert ac.setDesiredTemp(31.5)
+            ac.update()
+            assert ac.getDesiredTemp() == 31.5
+    finally:
+        ac.close()
+        sim.stop()
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_overrun_fallback():
+    """
+    Test 3: Yavaş ana döngüde toplu okuma overrun → byte byte geri dönüş
+    """
+    print_subheader("TEST 3: Overrun")
+
+    sim = Board1Simulator(ambient=22.3, baud=9600, service_latency=0.004).start()
+    ac = _open_api(sim)
+    try:
+        out = io.StringIO()
+        configure("warning", stream=out)   # geri dönüş uyarısı api/log üzerinden gelir
+        try:
+            ac.update()
+        finally:
+            configure("warning", console=False)
+        assert sim.stats["overruns"] >= 1, sim.stats
+        assert "Byte byte" in out.getvalue()
+        assert ac.getAmbientTemp() == 22.3 and ac.getDesiredTemp() == 25.0
+    finally:
+        ac.close()
+        sim.stop()
+    print(f"  ✓ Başarılı ({sim.stats})")
+    return True
+
+
+def test_uart_tools_client():
+    """
+    Test 4: uart_tools.UARTBoard1 ham komutları
+    """
+    print_subheader("TEST 4: UARTBoard1")
+
+    sim = Board1Simulator(ambient=18.6).start()
+    uart = UARTBoard1(sim.port)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert uart.connect()
+            assert uart.get_ambient_temp_integral() == 18
+            assert uart.get_ambient_temp_fractional() == 6
+            assert uart.set_desired_temp(44.5)
+            assert uart.get_desired_temp_integral() == 44
+            assert uart.get_desired_temp_fractional() == 5
+    finally:
+        uart.disconnect()
+        sim.stop()
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "SET Doğrulama": test_commit_rules(),
+        "API": test_api_roundtrip(),
+        "Overrun": test_overrun_fallback(),
+        "UARTBoard1": test_uart_tools_client(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
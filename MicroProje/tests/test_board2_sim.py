@@ -0,0 +1,138 @@
+"""
+Board #2 Simülatör Testi
+EEM Projesi - BM-2 Görevi
+
+Gerçek istemci kodunu (api/, uart_tools/) donanım olmadan
+simulator.board2 üzerinde çalıştırır (Linux pty).
+
+Kullanım:
+    python tests/test_board2_sim.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.curtain_control import CurtainControlSystemConnection
+from simulator.board2 import Board2Firmware, Board2Simulator
+from uart_tools.uart_board2 import UARTBoard2
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_stepper_model():
+    """
+    Test 1: SET çifti doğrulama ve step motor hareketi (saf model)
+    """
+    print_subheader("TEST 1: SET + step motor")
+
+    fw = Board2Firmware(curtain=10.0, step_rate=100.0, noise=False)
+    fw.advance(0.0)
+    assert fw.process_byte(0x02) == 10 and fw.process_byte(0x01) == 0
+
+    fw.process_byte(0x80 | 5)
+    fw.process_byte(0xC0 | 12)           # önce ondalık, sonra tam → %12.5
+    assert fw.target == 125 and fw.moving
+
+    fw.advance(0.1)                      # 100 step/s × 0.1 s = 10 step
+    assert fw.curtain == 11.0
+    assert fw.process_block(bytes([0x02, 0x01])) == bytes([11, 0])
+    fw.advance(1.0)
+    assert fw.curtain == 12.5 and not fw.moving
+
+    fw.process_byte(0xC0 | 20)
+    fw.process_byte(0x80 | 10)           # ondalık > 9 → ret
+    assert fw.target == 125 and fw.rejected == 1
+
+    # GET + SET karışık blok: yavaş yoldan sırayla işlenir
+    assert fw.process_block(bytes([0xC0 | 30, 0x80 | 0, 0x02, 0x06])) == bytes([12, 245])
+    assert fw.target == 300
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_api_roundtrip():
+    """
+    Test 2: CurtainControlSystemConnection update()/setCurtainStatus()
+    """
+    print_subheader("TEST 2: API okuma/ayarlama")
+
+    sim = Board2Simulator(curtain=40.0, step_rate=1000.0, noise=False, baud=9600).start()
+    curtain = CurtainControlSystemConnection()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            curtain.setComPort(sim.port)
+            assert curtain.open()
+            assert curtain.update()
+            assert curtain.getCurtainStatus() == 40.0
+            assert abs(curtain.getLightIntensity() - sim.firmware.light) < 0.1
+            assert curtain.setCurtainStatus(25.5)
+            time.sleep(0.3)              # 145 step @ 1000 step/s
+            assert curtain.update()
+            assert curtain.getCurtainStatus() == 25.5
+    finally:
+        curtain.close()
+        sim.stop()
+
+    # Eksik cevap (overrun, geri dönüş kapalı) → update() False, eski değer korunur
+    sim = Board2Simulator(curtain=40.0, noise=False, baud=9600, service_latency=0.004).start()
+    curtain = CurtainControlSystemConnection()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            curtain.setComPort(sim.port)
+            assert curtain.open()
+            curtain.setBatchFallback(False)
+            assert not curtain.update()
+            assert curtain.getCurtainStatus() == 0.0
+    finally:
+        curtain.close()
+        sim.stop()
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_uart_tools_client():
+    """
+    Test 3: uart_tools.UARTBoard2 toplu okuma
+    """
+    print_subheader("TEST 3: UARTBoard2")
+
+    sim = Board2Simulator(curtain=62.3, outdoor_temp=8.4, noise=False).start()
+    uart = UARTBoard2(sim.port)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert uart.connect()
+            data = uart.read_all_data()
+        assert data["curtain"] == 62.3
+        assert data["outdoor_temp"] == 8.4
+    finally:
+        uart.disconnect()
+        sim.stop()
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Step Motor": test_stepper_model(),
+        "API": test_api_roundtrip(),
+        "UARTBoard2": test_uart_tools_client(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,149 @@
+"""
+Hızlı Bağlantı (Hazır Olma Yoklaması) Testi
+EEM Projesi - BM-2 Görevi
+
+api.board_ready yoklamasının sabit reset beklemesi yerine kart
+açılır açılmaz döndüğünü, DTR reseti kapalıyken hiç beklemediğini
+ve cevap vermeyen kartta üst sınırda vazgeçtiğini simülatörün
+açılış gecikmesi (boot_delay) ile test eder.
+
+Kullanım:
+    python tests/test_board_ready.py
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.async_home_automation import AsyncCurtainControlSystemConnection
+from api.log import configure
+from simulator.board1 import Board1Simulator
+from simulator.board2 import Board2Simulator
+from uart_tools.uart_board2 import UARTBoard2
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_probe_after_boot():
+    """
+    Test 1: open() kart açılınca döner, yoklama cevabı okumaları kaydırmaz
+    """
+    print_subheader("TEST 1: Açılış sonrası hemen")
+
+    sim = Board1Simulator(ambient=21.7, boot_delay=0.4).start()
+    ac = AirConditionerSystemConnection()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.setComPort(sim.port)
+            started = time.monotonic()
+            assert ac.open()
+            elapsed = time.monotonic() - started
+            assert ac.update()
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.close()
+        sim.stop()
+
+    assert 0.35 <= elapsed < 1.0, elapsed
+    assert sim.stats["dropped"] > 0              # açılışta yoklamalar kayboldu
+    assert ac.getAmbientTemp() == 21.7 and ac.getFanSpeed() == 0
+    print(f"  Bağlantı süresi: {elapsed:.2f} s (eski: 2 s)")
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_dtr_reset_disabled():
+    """
+    Test 2: DTR reseti kapalı → hiç beklenmez, yoklama gönderilmez
+    """
+    print_subheader("TEST 2: DTR reseti kapalı")
+
+    sim = Board2Simulator(curtain=40.0, noise=False).start()
+    uart = UARTBoard2(sim.port, dtr_reset=False)
+    try:
+        started = time.monotonic()
+        assert uart.connect()
+        elapsed = time.monotonic() - started
+        assert sim.stats["rx"] == 0
+        assert uart.read_all_data()["curtain"] == 40.0
+    finally:
+        uart.disconnect()
+        sim.stop()
+
+    assert elapsed < 0.2, elapsed
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_unresponsive_board():
+    """
+    Test 3: Cevap vermeyen kart → üst sınırda uyarıyla devam (sync + async)
+    """
+    print_subheader("TEST 3: Üst sınır")
+
+    sim = Board1Simulator(boot_delay=10.0).start()
+    ac = AirConditionerSystemConnection()
+    log = io.StringIO()
+    try:
+        configure("warning", stream=log)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.setComPort(sim.port)
+            ac.setReadyTimeout(0.3)
+            started = time.monotonic()
+            assert ac.open()
+            elapsed = time.monotonic() - started
+    finally:
+        configure("warning", console=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.close()
+        sim.stop()
+    assert 0.3 <= elapsed < 0.8, elapsed
+    assert "cevap vermedi" in log.getvalue()
+
+    async def run_async():
+        sim2 = Board2Simulator(curtain=25.0, noise=False, boot_delay=0.3).start()
+        curtain = AsyncCurtainControlSystemConnection()
+        curtain.setComPort(sim2.port)
+        try:
+            t0 = time.monotonic()
+            assert await curtain.open()
+            took = time.monotonic() - t0
+            assert await curtain.update()
+            return took, curtain.getCurtainStatus()
+        finally:
+            await curtain.close()
+            sim2.stop()
+
+    took, status = asyncio.run(run_async())
+    assert 0.25 <= took < 1.0, took
+    assert status == 25.0
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Açılış": test_probe_after_boot(),
+        "DTR kapalı": test_dtr_reset_disabled(),
+        "Üst sınır": test_unresponsive_board(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,217 @@
+"""
+Arka Plan Servisi (Daemon) Testi
+EEM Projesi - BM-3 Görevi
+
+pc_app/daemon.TelemetryDaemon'ın sorgulama döngüsünü ve yerel
+sorgu API'sini (HTTP/1.1 keep-alive; TCP ve Unix soket) test eder:
+son değerler, geçmiş aralıkları, bağlantı hatasında geri çekilme,
+sürekli okuma hatasında yeniden bağlanma ve bellekten okuma
+gecikmesi.
+
+Kullanım:
+    python tests/test_daemon.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Üst dizini (MicroProje) ve pc_app'i (düz import) path'e ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'pc_app'))
+
+from daemon import DaemonClient, TelemetryDaemon
+from mock_api import build_mock_system
+from simulator.board1 import Board1Simulator
+from simulator.board2 import Board2Simulator
+
+CONFIG = {"port_board1": "COM3", "port_board2": "COM4", "baudrate": 9600, "refresh_interval_ms": 50}
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def wait_for(predicate, timeout=3.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_mock_unix_socket():
+    """
+    Test 1: Mock sistem, Unix soket: /latest, /range, /channels, hatalar
+    """
+    print_subheader("TEST 1: Mock + Unix soket")
+
+    path = os.path.join(tempfile.mkdtemp(), "eem.sock")
+    daemon = TelemetryDaemon(CONFIG, listen=path, system=build_mock_system(CONFIG)).start()
+    client = DaemonClient(path)
+    try:
+        assert wait_for(lambda: daemon.stats["polls"] >= 5)
+        latest = client.get("/latest")
+        assert latest["connected"] is True and latest["seq"] >= 1
+        assert latest["desired_temp"] == 24.0
+        assert abs(latest["polled_at"] - time.time()) < 1.0
+
+        assert "ambient_temp" in client.get("/channels")
+        rng = client.get("/range/ambient_temp?last=10")
+        assert len(rng["t"]) == len(rng["v"]) >= 5
+        assert rng["t"] == sorted(rng["t"])
+        summary = client.get("/range/ambient_temp?last=10&buckets=2")["buckets"]
+        assert sum(row[4] for row in summary) == len(rng["v"])
+        assert client.get("/health") == {"ok": True}
+
+        for bad in ("/range/nope", "/range/ambient_temp?last=x", "/nope", "/range/ambient_temp?last=inf",
+                    "/range/ambient_temp?since=nan", "/range/ambient_temp?last=10&buckets=0",
+                    "/range/ambient_temp?last=10&buckets=10001"):
+            try:
+                client.get(bad)
+                raise AssertionError(bad)
+            except RuntimeError as e:
+                assert "HTTP 4" in str(e), e
+    finally:
+        client.close()
+        daemon.stop()
+    assert not os.path.exists(path)
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_real_keepalive_latency():
+    """
+    Test 2: Simülatörlü RealConnection, TCP keep-alive: okumalar bellekten
+    """
+    print_subheader("TEST 2: RealConnection + TCP keep-alive")
+
+    sim1 = Board1Simulator(ambient=22.5).start()
+    sim2 = Board2Simulator(curtain=35.0, noise=False).start()
+    cfg = {**CONFIG, "port_board1": sim1.port, "port_board2": sim2.port, "use_mock": False}
+    with contextlib.redirect_stdout(io.StringIO()):
+        daemon = TelemetryDaemon(cfg, listen="127.0.0.1:0").start()
+    client = DaemonClient(daemon.address)
+    try:
+        assert wait_for(lambda: daemon.snapshot is not None and daemon.snapshot.current_curtain == 35.0)
+        latest = client.get("/latest")
+        assert latest["ambient_temp"] == 22.5 and latest["current_curtain"] == 35.0
+
+        rx_before = sim1.stats["rx"] + sim2.stats["rx"]
+        timings = []
+        for _ in range(1000):
+            t0 = time.perf_counter()
+            client.get("/latest")
+            timings.append(time.perf_counter() - t0)
+        elapsed = sum(timings)
+        wire = sim1.stats["rx"] + sim2.stats["rx"] - rx_before
+        polls = daemon.stats["polls"]
+    finally:
+        client.close()
+        with contextlib.redirect_stdout(io.StringIO()):
+            daemon.stop()
+        sim1.stop()
+        sim2.stop()
+
+    timings.sort()
+    p50, p99 = timings[500] * 1e3, timings[990] * 1e3
+    rate = len(timings) / elapsed
+    print(f"  1000 okuma: {rate:.0f}/s, p50={p50:.3f} ms, p99={p99:.3f} ms, "
+          f"aynı sürede port baytı={wire} ({polls} sorgu)")
+    assert p50 < 1.0 and rate > 500, (p50, rate)
+    assert wire < 1000                                    # istemci okumaları porta gitmez
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_connect_backoff():
+    """
+    Test 3: Port açılamazsa servis ayakta kalır, /health 503 ve hata görünür
+    """
+    print_subheader("TEST 3: Bağlantı hatası")
+
+    cfg = {**CONFIG, "port_board1": "/dev/eem-yok-1", "port_board2": "/dev/eem-yok-2"}
+    system = build_mock_system(cfg)
+
+    def refuse():
+        raise RuntimeError("port açılamadı")
+
+    system["conn"].connect = refuse
+    daemon = TelemetryDaemon(cfg, listen="127.0.0.1:0", system=system).start()
+    client = DaemonClient(daemon.address)
+    try:
+        assert wait_for(lambda: daemon.snapshot is not None)
+        try:
+            client.get("/health")
+            raise AssertionError("sağlıklı görünmemeli")
+        except RuntimeError as e:
+            assert "503" in str(e)
+        stats = client.get("/stats")
+        assert stats["connects"] == 0 and stats["polls"] == 0
+        assert "port açılamadı" in stats["last_error"]
+        assert client.get("/latest")["connected"] is False
+    finally:
+        client.close()
+        started = time.monotonic()
+        daemon.stop()
+    assert time.monotonic() - started < 1.0               # geri çekilme beklemesi durdurulabilir
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_read_failures_reconnect():
+    """
+    Test 4: Üst üste 3 başarısız sorgudan sonra portlar kapatılıp yeniden açılır
+    """
+    print_subheader("TEST 4: Okuma hatasında yeniden bağlanma")
+
+    system = build_mock_system(CONFIG)
+    conn = system["conn"]
+    closes = []
+    close = conn.close
+
+    def broken_update():
+        raise RuntimeError("cevap yok")
+
+    def counted_close():
+        closes.append(time.monotonic())
+        close()
+
+    conn.update = broken_update
+    conn.close = counted_close
+    daemon = TelemetryDaemon(CONFIG, listen="127.0.0.1:0", system=system).start()
+    try:
+        assert wait_for(lambda: daemon.stats["connects"] >= 2)
+        stats = daemon._stats()
+    finally:
+        daemon.stop()
+    assert stats["polls"] == 0 and stats["poll_errors"] >= 3
+    assert len(closes) >= 2                               # hata turu + stop()
+    assert "cevap yok" in stats["last_error"]
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Unix soket": test_mock_unix_socket(),
+        "Keep-alive": test_real_keepalive_latency(),
+        "Bağlantı hatası": test_connect_backoff(),
+        "Okuma hatası": test_read_failures_reconnect(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
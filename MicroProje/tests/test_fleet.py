@@ -0,0 +1,165 @@
+"""
+Filo Yöneticisi Testi
+EEM Projesi - BM-3 Görevi
+
+pc_app/fleet.FleetManager'ın N evin portlarını sınırlı bir iş
+havuzunda eşzamanlı sorguladığını (tur süresi ev sayısıyla
+büyümez), hata veren evin kendi başına geri çekildiğini ve toplu
+durum raporunu test eder.
+
+Kullanım:
+    python tests/test_fleet.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+
+# Üst dizini (MicroProje) ve pc_app'i (düz import) path'e ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'pc_app'))
+
+from fleet import FleetManager, home_configs
+from simulator.board1 import Board1Simulator
+from simulator.board2 import Board2Simulator
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def start_homes(count, baud=None):
+    """count ev için simülatör çiftleri ve filo tanımı"""
+    sims, homes = [], []
+    for i in range(count):
+        sim1 = Board1Simulator(ambient=20.0 + i, baud=baud).start()
+        sim2 = Board2Simulator(curtain=10.0 * i, noise=False, baud=baud).start()
+        sims += [sim1, sim2]
+        homes.append({"name": f"oda-{i + 1}", "port_board1": sim1.port, "port_board2": sim2.port})
+    return sims, homes
+
+
+def test_mock_fleet():
+    """
+    Test 1: Yapılandırma birleştirme + mock filo toplu durumu
+    """
+    print_subheader("TEST 1: Mock filo")
+
+    fleet = {"defaults": {"use_mock": True, "refresh_interval_ms": 200},
+             "homes": [{"name": "salon"}, {"name": "mutfak", "baudrate": 19200}, {}]}
+    configs = home_configs(fleet)
+    assert [cfg["name"] for cfg in configs] == ["salon", "mutfak", "home-3"]
+    assert configs[1]["baudrate"] == 19200 and configs[0]["baudrate"] == 9600
+    try:
+        home_configs({"homes": [{"name": "a"}, {"name": "a"}]})
+        raise AssertionError("aynı isim kabul edildi")
+    except ValueError:
+        pass
+
+    manager = FleetManager(fleet)
+    engine = manager.homes[0].conn.engine
+    steps = []
+    step = engine.step
+
+    def logged_step(now=None, rows=None):
+        steps.append((rows, threading.current_thread().name))
+        step(now, rows)
+
+    engine.step = logged_step
+    try:
+        manager.poll_round()
+        manager.poll_round()
+        status = manager.status()
+    finally:
+        manager.stop()
+    assert status["homes"] == 3 and status["ok"] == 3 and status["rounds"] == 2
+    salon = status["per_home"]["salon"]
+    assert salon["polls"] == 2 and salon["values"]["connected"] is True
+    assert manager.homes[0].conn.engine is manager.homes[2].conn.engine   # tek vektörel motor
+    # Tur başına tek vektörel adım, havuz iş parçacıkları motoru değiştirmez
+    assert steps == [(None, threading.current_thread().name)] * 2, steps
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_concurrent_rounds():
+    """
+    Test 2: 10 ev bir tur, tek ev bir tur kadar sürer
+    """
+    print_subheader("TEST 2: Eşzamanlı tur süresi")
+
+    def measure(count):
+        sims, homes = start_homes(count, baud=9600)   # gerçek hat süresi
+        manager = FleetManager({"defaults": {"adaptive_polling": False}, "homes": homes})
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager.poll_round()                       # bağlan + ilk okuma
+                took = min(manager.poll_round() for _ in range(3))
+            status = manager.status()
+        finally:
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager.stop()
+            for sim in sims:
+                sim.stop()
+        assert status["ok"] == count, status
+        return took, status
+
+    one, _ = measure(1)
+    ten, status = measure(10)
+    values = status["per_home"]["oda-4"]["values"]
+    assert values["ambient_temp"] == 23.0 and values["current_curtain"] == 30.0
+    print(f"  Tur süresi: 1 ev={one * 1e3:.1f} ms, 10 ev={ten * 1e3:.1f} ms")
+    assert ten < 3 * one, (one, ten)
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_backoff():
+    """
+    Test 3: Açılamayan ev geri çekilir, diğerleri her turda sorgulanır
+    """
+    print_subheader("TEST 3: Ev başına geri çekilme")
+
+    sims, homes = start_homes(2)
+    homes.append({"name": "bozuk", "port_board1": "/dev/eem-yok-1", "port_board2": "/dev/eem-yok-2"})
+    manager = FleetManager({"homes": homes})
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(3):
+                manager.poll_round()
+        status = manager.status()
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager.stop()
+        for sim in sims:
+            sim.stop()
+
+    broken = status["per_home"]["bozuk"]
+    assert status["ok"] == 2 and status["backoff"] == 1, status
+    assert broken["polls"] == 1 and broken["failures"] == 1 and broken["retry_in"] > 0
+    assert "/dev/eem-yok-1" in broken["last_error"]
+    assert status["per_home"]["oda-1"]["polls"] == 3
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Mock filo": test_mock_fleet(),
+        "Eşzamanlılık": test_concurrent_rounds(),
+        "Geri çekilme": test_backoff(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,160 @@
+"""
+Günlük Altyapısı Testi
+EEM Projesi - BM-2 Görevi
+
+api.log'un varsayılan olarak sessiz olduğunu, kapalı seviyelerde
+mesaj biçimlendirmediğini ve yapılandırılmış modda makine
+tarafından okunabilir JSON satırları ürettiğini test eder.
+
+Kullanım:
+    python tests/test_log.py
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import sys
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.log import ENV_VAR, ROOT_NAME, configure, configure_from_env, get_logger
+from simulator.board1 import Board1Simulator
+from uart_tools.uart_board1 import UARTBoard1
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+class _Counted:
+    """str() çağrılarını sayan argüman (tembel biçimlendirme kontrolü)"""
+
+    calls = 0
+
+    def __str__(self):
+        _Counted.calls += 1
+        return "x"
+
+
+def test_quiet_by_default():
+    """
+    Test 1: configure() çağrılmadan update() konsola hiçbir şey yazmaz
+    """
+    print_subheader("TEST 1: Varsayılan sessiz")
+
+    sim = Board1Simulator(ambient=21.7).start()
+    ac = AirConditionerSystemConnection()
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.setComPort(sim.port)
+            assert ac.open()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            assert ac.update()
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.close()
+        sim.stop()
+
+    assert "📥" not in out.getvalue() and "Ortam" not in out.getvalue(), out.getvalue()
+    assert err.getvalue() == ""
+    assert ac.getAmbientTemp() == 21.7
+
+    # Kapalı seviyede argümanlar biçimlendirilmez
+    log = get_logger("test")
+    for _ in range(100):
+        log.debug("değer: %s", _Counted())
+    assert _Counted.calls == 0
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_structured():
+    """
+    Test 2: Yapılandırılmış mod - tx/rx olayları ve update alanları
+    """
+    print_subheader("TEST 2: JSON satırları")
+
+    sim = Board1Simulator(ambient=23.4).start()
+    uart = UARTBoard1(sim.port)
+    ac = AirConditionerSystemConnection()
+    out = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert uart.connect()
+        configure("debug", structured=True, stream=out)
+        uart.send_byte(0x04)
+        assert uart.read_byte() == 23
+        uart.disconnect()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.setComPort(sim.port)
+            assert ac.open()
+        configure("info", structured=True, stream=out)
+        assert ac.update()
+    finally:
+        configure("warning", console=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.close()
+        sim.stop()
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    events = [r.get("event") for r in records]
+    tx = records[events.index("tx")]
+    rx = records[events.index("rx")]
+    assert tx["args"] == [4] and tx["logger"] == "eem.uart.board1"
+    assert rx["args"] == [23, 23] and rx["level"] == "DEBUG"
+
+    update = records[events.index("update")]
+    assert update["ambient_temp"] == 23.4 and update["level"] == "INFO"
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_unknown_level():
+    """
+    Test 3: Bilinmeyen seviye adı (EEM_LOG=verbose) INFO'ya düşer ve uyarır
+    """
+    print_subheader("TEST 3: Bilinmeyen seviye")
+
+    out = io.StringIO()
+    old = os.environ.get(ENV_VAR)
+    os.environ[ENV_VAR] = "verbose"
+    try:
+        assert configure_from_env(stream=out)          # eskiden setLevel("Level VERBOSE") → ValueError
+        level = logging.getLogger(ROOT_NAME).level
+        get_logger("test").debug("görünmemeli")
+    finally:
+        if old is None:
+            del os.environ[ENV_VAR]
+        else:
+            os.environ[ENV_VAR] = old
+        configure("warning", console=False)
+
+    assert level == logging.INFO, level
+    assert out.getvalue() == "⚠ Bilinmeyen log seviyesi 'verbose', INFO kullanılıyor\n", out.getvalue()
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Sessiz": test_quiet_by_default(),
+        "Yapılandırılmış": test_structured(),
+        "Bilinmeyen seviye": test_unknown_level(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,163 @@
+"""
+Uyarlamalı Sorgulama Zamanlayıcısı Testi
+EEM Projesi - BM-2 Görevi
+
+pc_app/poll_scheduler.PortScheduler'ın kanal başına hızlarını
+(değişimde hızlanma, kararlıyken geri çekilme, SET sonrası
+hızlanma) ve port bayt bütçesini; ayrıca RealConnection'ın
+simülatörlere karşı sabit aralıklı sorgulamadan çok daha az hat
+trafiğiyle çalıştığını test eder.
+
+Kullanım:
+    python tests/test_poll_scheduler.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Üst dizini (MicroProje) ve pc_app'i (düz import) path'e ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'pc_app'))
+
+from api.protocol import BOARD1_CHANNELS, BOARD2_CHANNELS
+from api.serial_broker import BoardBroker, URL_PREFIX
+from poll_scheduler import PortScheduler
+from real_uart_system import build_real_system
+from simulator.board1 import Board1Simulator
+from simulator.board2 import Board2Simulator
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_rates():
+    """
+    Test 1: Değişimde hızlı, kararlıyken geri çekilme, SET sonrası hemen
+    """
+    print_subheader("TEST 1: Kanal hızları")
+
+    now = [0.0]
+    sched = PortScheduler(BOARD2_CHANNELS, budget_bps=1000, clock=lambda: now[0])
+    assert set(sched.due()) == {"curtain", "outdoor_temp", "outdoor_press", "light"}
+    sched.observe({"curtain": 40.0, "outdoor_temp": 12.0, "outdoor_press": 1013.2, "light": 65.0})
+
+    # Kararlı değerler: aralık yavaş sınıra kadar büyür
+    for _ in range(20):
+        now[0] = sched.next_due()
+        names = sched.due()
+        sched.observe({name: {"curtain": 40.0, "outdoor_temp": 12.0,
+                              "outdoor_press": 1013.2, "light": 65.0}[name] for name in names})
+    intervals = sched.intervals()
+    assert intervals["curtain"] == 2.0 and intervals["outdoor_press"] > 1.0, intervals
+
+    # SET: perde hemen okunur; hareket ettikçe hızlı kalır
+    sched.boost("curtain")
+    assert sched.due() == ("curtain",)
+    sched.observe({"curtain": 45.0})
+    assert sched.intervals()["curtain"] == 0.1
+    # Gürültü (±0.1) değişim sayılmaz
+    now[0] += 0.1
+    assert sched.due() == ("curtain",)
+    sched.observe({"curtain": 45.1})
+    assert sched.intervals()["curtain"] > 0.1
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_budget():
+    """
+    Test 2: Port bayt bütçesi aşılmaz, en çok geciken önce okunur
+    """
+    print_subheader("TEST 2: Bayt bütçesi")
+
+    now = [0.0]
+    sched = PortScheduler(BOARD1_CHANNELS, budget_bps=8, clock=lambda: now[0])
+    assert sched.due() == ("desired_temp", "ambient_temp")   # 4 + 4 bayt; fan (2) bekler
+    assert sched.due() == ()
+    assert sched.next_due() == 0.25                          # 2 bayt için bütçe dolumu
+    now[0] = 0.25
+    assert sched.due() == ("fan_speed",)
+
+    total = 6
+    for step in range(1, 41):
+        now[0] = 0.25 + step * 0.25
+        names = sched.due()
+        total += sum(4 if name != "fan_speed" else 2 for name in names)
+        sched.observe({name: 1.0 for name in names})
+    assert total <= 8 * (now[0] + 1), total
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_real_connection():
+    """
+    Test 3: RealConnection uyarlamalı modda sabit aralıktan az bayt kullanır
+    """
+    print_subheader("TEST 3: RealConnection (simülatör)")
+
+    tmp = tempfile.mkdtemp()
+
+    def run(adaptive, duration=1.5, tick=0.05):
+        sim1 = Board1Simulator(ambient=22.0).start()
+        sim2 = Board2Simulator(curtain=40.0, noise=False).start()
+        brokers = [BoardBroker(sim.port, os.path.join(tmp, f"{name}-{adaptive}.sock")).start()
+                   for name, sim in (("b1", sim1), ("b2", sim2))]
+        system = build_real_system({"port_board1": URL_PREFIX + brokers[0].address,
+                                    "port_board2": URL_PREFIX + brokers[1].address,
+                                    "adaptive_polling": adaptive})
+        conn = system["conn"]
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                conn.connect()
+                end = time.monotonic() + duration
+                while time.monotonic() < end:
+                    conn.update()
+                    time.sleep(tick)
+                system["curtain"].setDesiredCurtain(50)
+                end = time.monotonic() + 0.5
+                while time.monotonic() < end:
+                    conn.update()
+                    time.sleep(tick)
+            return sim1.stats["rx"] + sim2.stats["rx"], conn.current_curtain, conn.poll_stats()
+        finally:
+            with contextlib.redirect_stdout(io.StringIO()):
+                conn.close()
+            for broker in brokers:
+                broker.stop()
+            sim1.stop()
+            sim2.stop()
+
+    fixed_bytes, fixed_curtain, _ = run(adaptive=False)
+    adaptive_bytes, adaptive_curtain, stats = run(adaptive=True)
+
+    assert adaptive_bytes * 3 < fixed_bytes, (adaptive_bytes, fixed_bytes)
+    assert adaptive_curtain > 40.0 and fixed_curtain > 40.0   # hareket her iki modda görüldü
+    assert stats["board2"]["intervals"]["curtain"] == 0.1
+    print(f"  GET baytı: sabit={fixed_bytes}, uyarlamalı={adaptive_bytes}")
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Hızlar": test_rates(),
+        "Bütçe": test_budget(),
+        "RealConnection": test_real_connection(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
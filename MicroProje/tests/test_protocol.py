@@ -0,0 +1,146 @@
+"""
+Protokol Şeması Testi
+EEM Projesi - BM-2 Görevi
+
+api.protocol şemasından üretilen komut tablolarını, toplu okuma
+planlarını ve SET kodlayıcılarını; ayrıca istemcilerin (api/ ve
+uart_tools/) bu şemayı simülatöre karşı doğru kullandığını test eder.
+
+Kullanım:
+    python tests/test_protocol.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.curtain_control import CurtainControlSystemConnection
+from api.log import configure
+from api.protocol import BOARD1_COMMANDS, BOARD2_COMMANDS, decode_set, read_plan, set_encoder
+from simulator.board1 import Board1Simulator
+from uart_tools.uart_board1 import UARTBoard1
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_schema_tables():
+    """
+    Test 1: Komut tabloları ve okuma planları şemadan üretilir
+    """
+    print_subheader("TEST 1: Şema → tablolar")
+
+    assert [cmd.code for cmd in BOARD1_COMMANDS] == [1, 2, 3, 4, 5]
+    assert [cmd.code for cmd in BOARD2_COMMANDS] == list(range(1, 9))
+    assert BOARD1_COMMANDS[4].description == "Fan hızı AL"
+    assert BOARD2_COMMANDS[5].description == "Dış basınç (tam) AL"
+
+    plan = read_plan("2")
+    assert sorted(plan.commands) == list(range(1, 9))
+    values = plan.decode([62, 3, 8, 4, 245, 2, 65, 0])
+    assert values == {"curtain": 62.3, "outdoor_temp": 8.4, "outdoor_press": 245.2, "light": 65.0}
+    # İsteğe bağlı pencere: düşük byte 850-1100 hPa'ya açılır, 1101-1105 ucu sarılmaz
+    assert plan.decode([62, 3, 8, 4, 245, 2, 65, 0], windowed=True)["outdoor_press"] == 1013.2
+    press = read_plan("2", ("outdoor_press",))
+    assert press.decode([850 & 0xFF, 0], True) == {"outdoor_press": 850.0}
+    assert press.decode([1100 & 0xFF, 5], True) == {"outdoor_press": 1100.5}
+    assert press.decode([1101 & 0xFF, 0], True) == {"outdoor_press": None}
+
+    # Eksik ya da geçersiz (ondalık > 9) cevap yalnızca kendi kanalını düşürür
+    values = read_plan("1").decode([25, None, 22, 12, 8])
+    assert values == {"desired_temp": None, "ambient_temp": None, "fan_speed": 8}
+    assert read_plan("2", ("light",)).commands == (0x08, 0x07)
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_set_encoder():
+    """
+    Test 2: SET kodlama - yuvarlama, aralık ve 6 bit sınırı
+    """
+    print_subheader("TEST 2: SET kodlayıcı")
+
+    ac = set_encoder("1")
+    assert ac.encode(44.4) == bytes([0xC0 | 44, 0x80 | 4])     # kesme değil yuvarlama
+    assert ac.encode(30.55) == bytes([0xC0 | 30, 0x80 | 6])
+    assert ac.encode(50.0) == bytes([0xC0 | 50, 0x80 | 0])
+    for bad in (9.9, 50.1, float("nan")):
+        try:
+            ac.encode(bad)
+            raise AssertionError(bad)
+        except ValueError:
+            pass
+
+    curtain = set_encoder("2")
+    assert curtain.wire_maximum == 63.9
+    assert curtain.encode(63.9) == bytes([0xFF, 0x89])
+    try:
+        curtain.encode(100.0)   # eskiden 0xC0 | (100 & 0x3F) → %36
+        raise AssertionError("100 kodlanmamalı")
+    except ValueError as e:
+        assert "6 bit" in str(e)
+    assert curtain.channel.maximum == 100.0                  # ayar aralığı daralmaz, sınır kodlayıcıda
+
+    assert decode_set(30, 5, "1") == (30.5, True)
+    assert decode_set(5, 5, "1") == (5.5, False)
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_clients():
+    """
+    Test 3: İstemciler şemayı kullanır (simülatör + doğrulama)
+    """
+    print_subheader("TEST 3: İstemciler")
+
+    sim = Board1Simulator(ambient=21.7).start()
+    uart = UARTBoard1(sim.port)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert uart.connect()
+            assert uart.set_desired_temp(44.4)
+            data = uart.read_all_data()
+        assert data == {"desired_temp": 44.4, "ambient_temp": 21.7, "fan_speed": 0}
+    finally:
+        uart.disconnect()
+        sim.stop()
+
+    # Port açılmadan önce doğrulama: geçersiz değer hiç gönderilmez,
+    # geçerli değer de kapalı porta "ayarlandı" denmeden reddedilir (hatalar günlükte)
+    out = io.StringIO()
+    configure("error", stream=out)
+    try:
+        curtain = CurtainControlSystemConnection()
+        assert not curtain.setCurtainStatus(100.0)
+        assert not curtain.setCurtainStatus(-1.0)
+        assert not AirConditionerSystemConnection().setDesiredTemp(24.5)
+    finally:
+        configure("warning", console=False)
+    assert "6 bit" in out.getvalue() and "Port açık değil" in out.getvalue(), out.getvalue()
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Tablolar": test_schema_tables(),
+        "SET Kodlayıcı": test_set_encoder(),
+        "İstemciler": test_clients(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,196 @@
+"""
+Okuma Önbelleği Testi
+EEM Projesi - BM-2 Görevi
+
+api.read_cache.ReadCache'in kanal başına TTL davranışını, eşzamanlı
+okumaların birleştirilmesini ve SET sonrası geçersiz kılmayı;
+ayrıca AirConditionerSystemConnection üzerinden simülatöre karşı
+kullanımını test eder.
+
+Kullanım:
+    python tests/test_read_cache.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.read_cache import ReadCache
+from simulator.board1 import Board1Simulator
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_ttl():
+    """
+    Test 1: Kanal başına TTL, TTL'den eski değer dönmez
+    """
+    print_subheader("TEST 1: TTL")
+
+    now = [0.0]
+    calls = []
+
+    def fetch(names):
+        calls.append(names)
+        return {name: now[0] for name in names}
+
+    cache = ReadCache({"fan_speed": 1.0, "curtain": 0.1}, clock=lambda: now[0])
+    assert cache.read(("fan_speed", "curtain"), fetch) == {"fan_speed": 0.0, "curtain": 0.0}
+    now[0] = 0.5
+    assert cache.read(("fan_speed", "curtain"), fetch) == {"fan_speed": 0.0, "curtain": 0.5}
+    now[0] = 1.0
+    assert cache.read(("fan_speed", "curtain"), fetch) == {"fan_speed": 1.0, "curtain": 1.0}
+    assert calls == [("fan_speed", "curtain"), ("curtain",), ("fan_speed", "curtain")]
+
+    # Okunamayan (None) değer önbelleğe alınmaz
+    cache.invalidate()
+    assert cache.read(("fan_speed",), lambda names: {}) == {"fan_speed": None}
+    assert cache.lookup("fan_speed") is None
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_coalescing_and_invalidate():
+    """
+    Test 2: Süren okumaya katılma; SET'ten önce başlamış okuma saklanmaz
+    """
+    print_subheader("TEST 2: Birleştirme + geçersiz kılma")
+
+    cache = ReadCache({"ambient_temp": 10.0})
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch(names):
+        calls.append(names)
+        release.wait(2)
+        return {"ambient_temp": 22.5}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.read(("ambient_temp",), slow_fetch)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    cache.invalidate("ambient_temp")   # okuma sürerken SET gönderildi
+    release.set()
+    for thread in threads:
+        thread.join(2)
+
+    assert calls == [("ambient_temp",)]
+    assert results == [{"ambient_temp": 22.5}] * 5
+    assert cache.stats["coalesced"] == 4
+    assert cache.lookup("ambient_temp") is None   # SET öncesi değer saklanmadı
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_connection_cache():
+    """
+    Test 3: update() önbellekten okur, SET istenen sıcaklığı yeniler
+    """
+    print_subheader("TEST 3: AirConditionerSystemConnection")
+
+    sim = Board1Simulator(ambient=21.7).start()
+    ac = AirConditionerSystemConnection()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.setComPort(sim.port)
+            assert ac.open()
+            rx_before = sim.stats["rx"]
+            for _ in range(5):
+                assert ac.update()
+            wire = sim.stats["rx"] - rx_before
+            assert ac.setDesiredTemp(30.5)
+            time.sleep(0.05)
+            assert ac.readChannels(("desired_temp", "fan_speed")) == {"desired_temp": 30.5, "fan_speed": 0}
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.close()
+        sim.stop()
+
+    assert wire == len(ac.UPDATE_COMMANDS), wire   # 5 update() → tek toplu okuma
+    assert ac.getAmbientTemp() == 21.7
+    assert ac.readCache.stats["hits"] >= 4 * 3 + 1
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_wire_lock():
+    """
+    Test 4: Eşzamanlı SET çiftleri ve toplu GET'ler hatta bölünmez
+    """
+    print_subheader("TEST 4: Hat kilidi")
+
+    sim = Board1Simulator(ambient=21.7).start()
+    fw = sim.firmware
+    committed = []
+    commit = fw._try_commit
+
+    def logged_commit():
+        before = fw.accepted
+        commit()
+        if fw.accepted != before:
+            committed.append(fw.desired_int + fw.desired_frac / 10.0)
+
+    fw._try_commit = logged_commit
+    ac = AirConditionerSystemConnection()
+    replies = []
+
+    def setter(value):
+        for _ in range(15):
+            assert ac.setDesiredTemp(value)
+
+    def reader():
+        for _ in range(15):
+            replies.append(ac._query_batch(ac.UPDATE_COMMANDS))
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.setComPort(sim.port)
+            assert ac.open()
+            threads = [threading.Thread(target=setter, args=(v,)) for v in (20.1, 30.9)]
+            threads.append(threading.Thread(target=reader))
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            time.sleep(0.05)
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.close()
+        sim.stop()
+
+    # Karışan çift 20.9 / 30.1 gibi hiç gönderilmemiş bir değer üretirdi
+    assert len(committed) == 30 and set(committed) == {20.1, 30.9}, committed
+    assert len(replies) == 15 and all(None not in r for r in replies)
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "TTL": test_ttl(),
+        "Birleştirme": test_coalescing_and_invalidate(),
+        "Bağlantı": test_connection_cache(),
+        "Hat kilidi": test_wire_lock(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,239 @@
+"""
+Seri Port Aracısı Testi
+EEM Projesi - BM-2 Görevi
+
+api.serial_broker aracısını Board #1 simülatörüne karşı test eder:
+istemcilerin beklemeden bağlanması, eşzamanlı özdeş GET'lerin tek
+hat işleminde birleştirilmesi, SET'lerin aracı üzerinden geçmesi ve
+farklı istemcilerin SET çiftlerinin hatta karışmaması, durdurulunca
+bekleyen isteklerin hata ile sonuçlanması.
+
+Kullanım:
+    python tests/test_serial_broker.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.serial_broker import OP_GET, STATUS_ERROR, BoardBroker, BrokerSerial, URL_PREFIX
+from simulator.board1 import Board1Simulator
+from uart_tools.uart_board1 import UARTBoard1
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+@contextlib.contextmanager
+def broker_on_sim(**sim_kwargs):
+    """Simülatör + aracı başlat, (aracı, "broker:..." adresi) ver"""
+    sim = Board1Simulator(**sim_kwargs).start()
+    path = os.path.join(tempfile.mkdtemp(), "board1.sock")
+    broker = BoardBroker(sim.port, path).start()
+    try:
+        yield broker, URL_PREFIX + path, sim
+    finally:
+        broker.stop()
+        sim.stop()
+
+
+def test_attach():
+    """
+    Test 1: İstemciler reset beklemeden bağlanır
+    """
+    print_subheader("TEST 1: Anında bağlanma")
+
+    with broker_on_sim(ambient=21.7) as (broker, url, _):
+        clients = [AirConditionerSystemConnection() for _ in range(3)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            for ac in clients:
+                ac.setComPort(url)
+                assert ac.open()
+            elapsed = time.perf_counter() - started
+            for ac in clients:
+                assert ac.update()
+                assert ac.getAmbientTemp() == 21.7
+                ac.close()
+        assert elapsed < 0.5, elapsed
+        assert broker.stats["clients"] == 3
+        ser = BrokerSerial(url)
+        assert ser.ping() == broker.port
+        ser.close()
+    print(f"  3 istemci: {elapsed * 1000:.1f} ms")
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_coalescing():
+    """
+    Test 2: Eşzamanlı özdeş GET vektörleri birleştirilir
+    """
+    print_subheader("TEST 2: GET birleştirme")
+
+    # Hat hızı taklidiyle her işlem ~5 ms sürer; bu sırada gelenler beklemeye katılır
+    with broker_on_sim(ambient=23.4, baud=9600) as (broker, url, _):
+        results = []
+        errors = []
+
+        def reader():
+            ac = AirConditionerSystemConnection()
+            ac.comPort = url
+            ac.open()
+            try:
+                for _ in range(10):
+                    values = ac.READ_PLAN.decode(ac._query_batch(ac.UPDATE_COMMANDS))
+                    results.append(values["ambient_temp"])
+            except Exception as e:
+                errors.append(e)
+            finally:
+                ac.ser.close()
+
+        # redirect_stdout süreç geneli: iş parçacıklarında iç içe girerse sys.stdout geri dönmez
+        with contextlib.redirect_stdout(io.StringIO()):
+            threads = [threading.Thread(target=reader) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+
+        stats = broker.stats
+        assert not errors, errors
+        assert results == [23.4] * 60
+        assert stats["requests"] == 60
+        assert stats["coalesced"] > 0
+        assert stats["transactions"] + stats["coalesced"] == 60
+    print(f"  60 istek → {stats['transactions']} hat işlemi ({stats['coalesced']} birleştirildi)")
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_set_through_broker():
+    """
+    Test 3: SET aracıdan geçer, sonraki GET yeni değeri görür
+    """
+    print_subheader("TEST 3: SET")
+
+    with broker_on_sim() as (broker, url, sim):
+        uart = UARTBoard1(url)
+        ac = AirConditionerSystemConnection()
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert uart.connect()
+            ac.setComPort(url)
+            assert ac.open()
+            assert ac.setDesiredTemp(30.5)
+            time.sleep(0.05)
+            assert uart.read_all_data()["desired_temp"] == 30.5
+            uart.disconnect()
+            ac.close()
+        assert (sim.firmware.desired_int, sim.firmware.desired_frac) == (30, 5)
+        assert broker.stats["errors"] == 0
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_set_pairs_atomic():
+    """
+    Test 4: İki istemcinin byte byte yazdığı SET çiftleri hatta karışmaz
+    """
+    print_subheader("TEST 4: Bölünmez SET çifti")
+
+    with broker_on_sim() as (broker, url, sim):
+        fw = sim.firmware
+        committed = []
+        commit = fw._try_commit
+
+        def logged_commit():
+            before = fw.accepted
+            commit()
+            if fw.accepted != before:
+                committed.append(fw.desired_int + fw.desired_frac / 10.0)
+
+        fw._try_commit = logged_commit
+
+        def client(value):
+            ser = BrokerSerial(url)
+            high, low = 0xC0 | int(value), 0x80 | round(value * 10) % 10
+            try:
+                for _ in range(20):
+                    ser.write(bytes([high]))      # api/ istemcileri gibi: byte başına bir write
+                    ser.write(bytes([low]))
+            finally:
+                ser.close()
+
+        threads = [threading.Thread(target=client, args=(v,)) for v in (20.1, 30.9)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        time.sleep(0.05)
+        # Karışan çift 20.9 / 30.1 gibi hiç gönderilmemiş bir değer üretirdi
+        assert len(committed) == 40 and set(committed) == {20.1, 30.9}, committed
+        assert broker.stats["errors"] == 0
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_stop():
+    """
+    Test 5: Durdurma bekleyen istemci bırakmaz, dinlenemeyen adres portu açık bırakmaz
+    """
+    print_subheader("TEST 5: Durdurma")
+
+    with broker_on_sim() as (broker, url, sim):
+        release = threading.Event()
+        write = broker.ser.write
+
+        def stuck_write(data):
+            release.wait(5)               # Hatta takılı kalan board: port iş parçacığı join(2)'yi aşar
+            return write(data)
+
+        broker.ser.write = stuck_write
+        futures = [broker.submit(OP_GET, bytes([0x04, i])) for i in range(5)]
+        time.sleep(0.05)
+        broker.stop()
+        release.set()
+        # İlki hatta (port kapanınca hata ile biter), geri kalanı kuyrukta kalmıştı
+        assert all(f.done() and f.result()[0] == STATUS_ERROR for f in futures[1:])
+        assert broker.submit(OP_GET, bytes([0x04])).result(0)[0] == STATUS_ERROR
+        assert futures[0].result(2)[0] == STATUS_ERROR
+
+        bad = BoardBroker(sim.port, os.path.join(tempfile.mkdtemp(), "yok", "board1.sock"))
+        try:
+            bad.start()
+            raise AssertionError("bind hatası bekleniyordu")
+        except OSError:
+            pass
+        assert not bad.ser.is_open
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Bağlanma": test_attach(),
+        "Birleştirme": test_coalescing(),
+        "SET": test_set_through_broker(),
+        "SET çifti": test_set_pairs_atomic(),
+        "Durdurma": test_stop(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,172 @@
+"""
+Sistem Anlık Görüntüsü (SystemSnapshot) Testi
+EEM Projesi - BM-3 Görevi
+
+pc_app/snapshot'ın değişmez, __slots__ tabanlı görüntülerini (sıra
+numarası + alan başına değişim maskesi), değişmeyen durumda aynı
+nesnenin döndüğünü ve BackgroundPoller'ın GUI'ye yalnızca değişen
+görüntüleri ilettiğini test eder.
+
+Kullanım:
+    python tests/test_snapshot.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Üst dizini (MicroProje) ve pc_app'i (düz import) path'e ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'pc_app'))
+
+from mock_api import build_mock_system
+from poller import BackgroundPoller
+from real_uart_system import build_real_system
+from simulator.board1 import Board1Simulator
+from simulator.board2 import Board2Simulator
+from snapshot import ALL_DIRTY, BIT, SnapshotTracker
+
+CONFIG = {"port_board1": "COM3", "port_board2": "COM4", "baudrate": 9600}
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_tracker():
+    """
+    Test 1: Değişmezlik, önbellek, sıra numarası ve değişim maskesi
+    """
+    print_subheader("TEST 1: SnapshotTracker")
+
+    tracker = SnapshotTracker()
+    values = {"connected": True, "last_error": "", "desired_temp": 24.0, "ambient_temp": 22.3}
+    first = tracker.publish(values)
+    assert first.seq == 1 and first.dirty == ALL_DIRTY
+    assert tracker.publish(dict(values)) is first              # değişiklik yok → aynı nesne
+
+    second = tracker.publish({**values, "ambient_temp": 22.4})
+    assert second.seq == 2 and second.dirty == BIT["ambient_temp"]
+    assert second.changed("ambient_temp") and not second.changed("desired_temp")
+    third = tracker.publish({**values, "ambient_temp": 22.4, "desired_temp": 30.0})
+    assert third.dirty == BIT["desired_temp"]
+
+    # Arada görüntü kaçıran tüketici: alanlar doğrudan karşılaştırılır
+    assert third.changes_since(first) == BIT["ambient_temp"] | BIT["desired_temp"]
+    assert third.changes_since(third) == 0 and third.changes_since(None) == ALL_DIRTY
+
+    try:
+        third.desired_temp = 10.0
+        raise AssertionError("görüntü değiştirilebildi")
+    except AttributeError:
+        pass
+    assert not hasattr(third, "__dict__")
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_mock_update():
+    """
+    Test 2: Mock update() görüntü döndürür, SET alanı kirli işaretlenir
+    """
+    print_subheader("TEST 2: Mock bağlantı")
+
+    system = build_mock_system(CONFIG)
+    conn = system["conn"]
+    conn.connect()
+    first = conn.update()
+    assert conn.take_snapshot() is first
+    assert first.desired_temp == system["aircon"].getDesiredTemp()
+
+    system["aircon"].setDesiredTemp(30.0)
+    snap = conn.take_snapshot()
+    assert snap.seq == first.seq + 1 and snap.dirty == BIT["desired_temp"]
+    assert snap.desired_temp == 30.0 and first.desired_temp == 24.0
+
+    conn.close()
+    closed = conn.take_snapshot()
+    assert closed.dirty == BIT["connected"] and closed.connected is False
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_poller_changes_only():
+    """
+    Test 3: Kararlı değerlerde GUI'ye yeni görüntü gitmez, perde hareketi gider
+    """
+    print_subheader("TEST 3: BackgroundPoller (simülatör)")
+
+    sim1 = Board1Simulator(ambient=22.0).start()
+    sim2 = Board2Simulator(curtain=40.0, noise=False).start()
+    system = build_real_system({"port_board1": sim1.port, "port_board2": sim2.port,
+                                "adaptive_polling": False})
+    conn = system["conn"]
+    poller = BackgroundPoller(conn, system["aircon"], system["curtain"], interval_ms=100)
+    received = []
+    errors = []
+
+    def collect(duration):
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            snap = poller.poll_events()
+            if snap is not None:
+                received.append(snap)
+            time.sleep(0.01)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            poller.start()
+            poller.submit(conn.connect, refresh=True)
+            poller.set_auto(True)
+            collect(1.0)
+            steady = len(received)
+            polls = len(conn.history.window("ambient_temp")[0])
+            poller.submit(system["curtain"].setDesiredCurtain, 45.0, refresh=True)
+            collect(0.8)
+            # 6 bit SET yükünü aşan değer gönderilmez: False döner, sebep last_error'da
+            poller.submit(lambda v: (system["curtain"].setDesiredCurtain(v), conn.last_error), 80.0,
+                          on_done=lambda result, error: errors.append((result, error)))
+            collect(0.2)
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            poller.submit(conn.close)      # GUI kapanışı: portlar edinim iş parçacığında kapanır
+            poller.stop()
+        sim1.stop()
+        sim2.stop()
+
+    assert not conn.connected and not poller._thread.is_alive()
+
+    assert polls >= 8 and steady <= 2, (polls, steady)
+    assert received[-1].current_curtain == 45.0
+    (ok, reason), error = errors[0]
+    assert len(errors) == 1 and ok is False and error is None and "6 bit" in reason, errors
+    assert conn.desired_curtain == 45.0
+    moving = received[steady:]
+    board2 = BIT["desired_curtain"] | BIT["current_curtain"]
+    assert moving and all(snap.dirty & ~board2 == 0 for snap in moving), moving
+    assert [snap.seq for snap in received] == sorted({snap.seq for snap in received})
+    print(f"  Sorgu: {polls}, kararlı durumda GUI'ye giden görüntü: {steady}")
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Tracker": test_tracker(),
+        "Mock": test_mock_update(),
+        "Poller": test_poller_changes_only(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,113 @@
+"""
+Telemetri Geçmişi Testi
+EEM Projesi - BM-2 Görevi
+
+api.telemetry_history halka tamponunu ve update() ile beslenmesini
+(simulator.board1 üzerinde) test eder.
+
+Kullanım:
+    python tests/test_telemetry_history.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.air_conditioner import AirConditionerSystemConnection
+from api.read_cache import ReadCache
+from api.telemetry_history import TelemetryChannel, TelemetryHistory
+from simulator.board1 import Board1Simulator
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_ring_buffer():
+    """
+    Test 1: Kapasite dolunca en eskinin üzerine yazılır, pencere sırası korunur
+    """
+    print_subheader("TEST 1: Halka tampon")
+
+    ch = TelemetryChannel("x", capacity=4)
+    assert ch.latest() is None and ch.window() == ([], [])
+    for i in range(10):
+        ch.append(float(i), t=100.0 + i)
+    assert len(ch) == 4
+    assert ch.window() == ([106.0, 107.0, 108.0, 109.0], [6.0, 7.0, 8.0, 9.0])
+    assert ch.window(107.5, 108.5) == ([108.0], [8.0])
+    assert ch.latest() == (109.0, 9.0)
+
+    ch.append(1.5, t=50.0)                  # geri giden saat → son zamana eşitlenir
+    assert ch.latest() == (109.0, 1.5)
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_downsample():
+    """
+    Test 2: Kova başına min/max/ortalama (tampon sarmışken)
+    """
+    print_subheader("TEST 2: Kova özeti")
+
+    ch = TelemetryChannel("x", capacity=8)
+    for i in range(12):                      # fiziksel olarak iki parçaya bölünür
+        ch.append(float(i), t=float(i))
+    buckets = ch.downsample(4.0, 12.0, 2)
+    assert buckets == [(4.0, 4.0, 7.0, 5.5, 4), (8.0, 8.0, 11.0, 9.5, 4)], buckets
+    assert ch.downsample(100.0, 200.0, 4) == []
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_update_feeds_history():
+    """
+    Test 3: AirConditionerSystemConnection.update() geçmişe yazar
+    """
+    print_subheader("TEST 3: update() → geçmiş")
+
+    history = TelemetryHistory(capacity=16)
+    sim = Board1Simulator(ambient=21.7).start()
+    ac = AirConditionerSystemConnection()
+    ac.setHistory(history)
+    ac.setReadCache(ReadCache())   # TTL 0: her update() porttan okur ve geçmişe yazar
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.setComPort(sim.port)
+            assert ac.open()
+            for _ in range(3):
+                ac.update()
+    finally:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ac.close()
+        sim.stop()
+
+    assert history.names() == ["ambient_temp", "desired_temp", "fan_speed"]
+    _, values = history.window("ambient_temp")
+    assert len(values) == 3 and abs(values[-1] - 21.7) < 1e-5   # float32
+    assert history.window("yok") == ([], [])
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Halka Tampon": test_ring_buffer(),
+        "Kova Özeti": test_downsample(),
+        "update()": test_update_feeds_history(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
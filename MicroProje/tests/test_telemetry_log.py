@@ -0,0 +1,147 @@
+"""
+Kalıcı Telemetri Kaydı Testi
+EEM Projesi - BM-2 Görevi
+
+api.telemetry_log yazıcı/okuyucu çiftini geçici bir klasörde test
+eder: gün segmentleri, kapasite taşması, aralık sorgusu, özet ve
+yazma hatasında zaman sınırlı kapanış.
+
+Kullanım:
+    python tests/test_telemetry_log.py
+"""
+
+import math
+import os
+import sys
+import tempfile
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.telemetry_log import TelemetryLogReader, TelemetryLogWriter
+
+DAY1 = time.mktime((2025, 12, 11, 23, 59, 0, 0, 0, -1))   # yerel saat
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_segments():
+    """
+    Test 1: Gün değişimi ve kapasite dolunca yeni parça
+    """
+    print_subheader("TEST 1: Segmentler")
+
+    with tempfile.TemporaryDirectory() as folder:
+        log = TelemetryLogWriter(folder, columns=("ambient_temp", "fan_speed"), capacity=50)
+        for i in range(120):                      # 60 s gün 1 + 60 s gün 2
+            log.append({"ambient_temp": 20.0 + i / 10.0, "fan_speed": i % 7}, t=DAY1 + i)
+        log.close()
+        assert log.written == 120 and log.dropped == 0
+
+        reader = TelemetryLogReader(folder)
+        names = [os.path.basename(p) for p in reader.paths()]
+        assert names == ["telemetry-20251211.tlog", "telemetry-20251211.1.tlog",
+                         "telemetry-20251212.tlog", "telemetry-20251212.1.tlog"], names
+
+        times, cols = reader.query()
+        assert len(times) == 120 and times == sorted(times)
+        assert abs(cols["ambient_temp"][-1] - 31.9) < 1e-5
+        reader.close()
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_query_aggregate():
+    """
+    Test 2: Aralık sorgusu, eksik değer (NaN) ve özet
+    """
+    print_subheader("TEST 2: Sorgu + özet")
+
+    with tempfile.TemporaryDirectory() as folder:
+        log = TelemetryLogWriter(folder, columns=("ambient_temp", "fan_speed"))
+        for i in range(10):
+            log.append({"ambient_temp": float(i), "fan_speed": None if i == 3 else 2.0}, t=DAY1 - 100 + i)
+        log.append({"ambient_temp": 99.0}, t=DAY1 - 200)   # geri giden saat → eşitlenir
+        log.close()
+
+        reader = TelemetryLogReader(folder)
+        times, cols = reader.query(DAY1 - 98, DAY1 - 95, columns=["fan_speed"])
+        assert times == [DAY1 - 98, DAY1 - 97, DAY1 - 96, DAY1 - 95]
+        assert list(cols) == ["fan_speed"] and math.isnan(cols["fan_speed"][1])
+
+        stats = reader.aggregate("fan_speed")
+        assert stats == {"count": 9, "min": 2.0, "max": 2.0, "mean": 2.0}, stats
+        stats = reader.aggregate("ambient_temp", DAY1 - 100, DAY1 - 92)
+        assert stats["count"] == 9 and stats["mean"] == 4.0
+        assert reader.aggregate("ambient_temp", DAY1 - 91)["max"] == 99.0
+        assert reader.aggregate("ambient_temp", DAY1)["count"] == 0
+        reader.close()
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_write_error():
+    """
+    Test 3: Yazma hatası iş parçacığını öldürmez, close() süresiz beklemez
+    """
+    print_subheader("TEST 3: Yazma hatası")
+
+    with tempfile.TemporaryDirectory() as folder:
+        log = TelemetryLogWriter(folder, columns=("ambient_temp",), flush_interval=0.05)
+        segment_for = log._segment_for
+
+        def disk_full(day):
+            raise OSError(28, "No space left on device")
+
+        log._segment_for = disk_full
+        for i in range(5):
+            log.append({"ambient_temp": float(i)}, t=DAY1 + i)
+        end = time.monotonic() + 2.0
+        while log.errors == 0 and time.monotonic() < end:
+            time.sleep(0.01)
+        log._segment_for = segment_for
+        for i in range(5, 8):
+            log.append({"ambient_temp": float(i)}, t=DAY1 + i)
+
+        started = time.monotonic()
+        log.close()
+        assert time.monotonic() - started < 1.0
+        assert log.errors == 1 and log.written == 3, (log.errors, log.written)
+
+        reader = TelemetryLogReader(folder)
+        assert reader.query(DAY1, DAY1 + 10)[0] == [DAY1 + 5, DAY1 + 6, DAY1 + 7]
+        reader.close()
+
+        # Ölü yazıcı + dolu kuyruk: close() zaman sınırıyla döner
+        log = TelemetryLogWriter(folder, columns=("ambient_temp",), max_pending=2)
+        log._pending.put(None)
+        log._thread.join(1.0)
+        log._pending.put((DAY1, [1.0]))
+        log._pending.put((DAY1, [2.0]))
+        started = time.monotonic()
+        log.close(timeout=0.2)
+        assert time.monotonic() - started < 1.0
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Segmentler": test_segments(),
+        "Sorgu + Özet": test_query_aggregate(),
+        "Yazma hatası": test_write_error(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
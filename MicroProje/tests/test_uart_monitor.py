@@ -0,0 +1,276 @@
+"""
+UART İzleyici Testi
+EEM Projesi - BM-2 Görevi
+
+uart_tools.log_writer (kuyruk, döndürme), UARTMonitor'ün pty
+üzerinden yakaladığı trafiği loglamasını, ham yakalama (.ucap) +
+uart_decode çözücüsünü ve çift port istek/cevap eşleştirmesini
+(RequestCorrelator, DualPortMonitor) test eder.
+
+Kullanım:
+    python tests/test_uart_monitor.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Üst dizini (MicroProje) path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulator.pty_link import PtyLink
+from uart_tools import uart_decode
+from uart_tools.log_writer import LogWriter
+from uart_tools.uart_capture import CaptureWriter, iter_records, read_header
+from uart_tools.uart_correlator import RX, TX, LatencyHistogram, RequestCorrelator
+from uart_tools.uart_monitor import DualPortMonitor, UARTMonitor
+
+
+def print_subheader(text):
+    """Alt başlık yazdır"""
+    print(f"\n[{text}]")
+
+
+def test_rotation():
+    """
+    Test 1: max_bytes aşılınca log.txt → log.txt.1 → log.txt.2
+    """
+    print_subheader("TEST 1: Döndürme")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "log.txt")
+        writer = LogWriter(path, formatter=lambda ts, data: [data], echo=False,
+                           max_bytes=100, backup_count=2).start()
+        for i in range(40):
+            writer.submit(i, f"satir {i:02d} " + "x" * 10)   # 21 byte/satır
+        writer.close()
+
+        assert sorted(os.listdir(folder)) == ["log.txt", "log.txt.1", "log.txt.2"]
+        assert writer.stats["lines"] == 40 and writer.stats["rotations"] >= 2
+        with open(path, encoding="utf-8") as f:
+            assert f.read().splitlines()[-1].startswith("satir 39")
+        assert all(os.path.getsize(os.path.join(folder, n)) <= 100 for n in os.listdir(folder))
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_full_queue_drops():
+    """
+    Test 2: Kuyruk doluyken submit beklemez, atılan byte'lar sayılır
+    """
+    print_subheader("TEST 2: Dolu kuyruk")
+
+    writer = LogWriter(echo=False, max_queue=2)   # başlatılmadı → tüketen yok
+    assert writer.submit(0, b"ab") and writer.submit(0, b"cd")
+    t0 = time.perf_counter()
+    assert not writer.submit(0, b"efg")
+    assert time.perf_counter() - t0 < 0.01
+    assert writer.stats["dropped_chunks"] == 1 and writer.stats["dropped_bytes"] == 3
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_monitor_capture():
+    """
+    Test 3: UARTMonitor pty'den okuduğu byte'ları çözüp loglar
+    """
+    print_subheader("TEST 3: UARTMonitor")
+
+    link = PtyLink()
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "uart.txt")
+        monitor = UARTMonitor(port=link.port, log_file=path)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            monitor.log_message("önce")     # yazıcı yok → yalnızca ekran, dosyaya dokunulmaz
+            thread = threading.Thread(target=monitor.monitor)
+            thread.start()
+            time.sleep(0.3)
+            link.write(bytes([0x04, 0xDE, 0x85]))
+            time.sleep(0.3)
+            monitor.log_message("işaret")   # yazıcı kuyruğu üzerinden
+            monitor.running = False
+            thread.join(2)
+        link.close()
+
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    assert len(lines) == 4, lines
+    assert "#0001 → 0x04" in lines[0] and "SET (tam) = 30" in lines[1] and "SET (ondalık) = 5" in lines[2]
+    assert lines[3].endswith("] işaret") and "] önce" in out.getvalue()
+    assert "Toplam 3 byte" in out.getvalue()
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_capture_decode():
+    """
+    Test 4: Ham yakalama → uart_decode (metin, CSV, istatistik)
+    """
+    print_subheader("TEST 4: Yakalama + çözme")
+
+    link = PtyLink()
+    traffic = bytes([0x01, 0x02, 0x03, 0x04, 0x05, 0xDE, 0x85]) * 50
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "cap.ucap")
+        monitor = UARTMonitor(port=link.port, baudrate=115200, capture_file=path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            thread = threading.Thread(target=monitor.monitor)
+            thread.start()
+            time.sleep(0.3)
+            for i in range(0, len(traffic), 35):
+                link.write(traffic[i:i + 35])
+                time.sleep(0.005)
+            time.sleep(0.3)
+            monitor.running = False
+            thread.join(2)
+        link.close()
+
+        with open(path, "rb") as f:
+            header = read_header(f)
+            data = b"".join(chunk for _, _, chunk in iter_records(f))
+        assert header["baudrate"] == 115200 and header["port"] == link.port
+        assert data == traffic
+
+        text_out = os.path.join(folder, "out.txt")
+        csv_out = os.path.join(folder, "out.csv")
+        uart_decode.main([path, "-o", text_out, "--board", "1"])
+        uart_decode.main([path, "--format", "csv", "-o", csv_out])
+        with open(text_out, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        with open(csv_out, encoding="utf-8") as f:
+            rows = f.read().splitlines()
+        stats = io.StringIO()
+        with contextlib.redirect_stdout(stats):
+            uart_decode.main([path, "--format", "stats", "--board", "2"])
+
+    assert len(lines) == len(traffic) and len(rows) == len(traffic) + 1
+    assert lines[3].endswith("0x04 (  4) | [B1] Ortam sıcaklığı (tam) AL")
+    assert rows[6].endswith(',222,"SET (tam) = 30"')
+    assert "350 byte" in stats.getvalue() and "[B2] Perde (tam) AL" in stats.getvalue()
+
+    # Yazma hatası (disk dolu): yazıcı ölmez, close() takılmaz
+    with tempfile.TemporaryDirectory() as folder:
+        cap = CaptureWriter(os.path.join(folder, "cap.ucap"), flush_interval=0.01).start()
+
+        def full_disk(data):
+            raise OSError(28, "No space left on device")
+
+        cap._file.write = full_disk
+        with contextlib.redirect_stdout(io.StringIO()):
+            cap.submit(0, b"abc")
+            time.sleep(0.1)
+            cap.submit(1, b"de")
+            t0 = time.perf_counter()
+            cap.close(timeout=1.0)
+        assert time.perf_counter() - t0 < 1.0 and not cap._thread.is_alive()
+        assert cap.stats["errors"] >= 2 and cap.stats["dropped_bytes"] == 5 and cap.stats["bytes"] == 0
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_correlator():
+    """
+    Test 5: GET → cevap eşleştirme, SET çifti, zaman aşımı, yüzdelikler
+    """
+    print_subheader("TEST 5: İstek/cevap eşleştirme")
+
+    events = []
+    corr = RequestCorrelator(board="both", timeout=0.1, on_event=lambda t, text: events.append(text))
+    ms = 1_000_000
+    # Pipeline: 3 GET tek parçada, cevaplar sırayla
+    corr.feed(0, TX, bytes([0x04, 0x03, 0x05]))
+    corr.feed(1 * ms, RX, bytes([22]))
+    corr.feed(2 * ms, RX, bytes([5, 1]))
+    # SET çifti ters sırada (önce ondalık) → 30.5
+    corr.feed(3 * ms, TX, bytes([0x85, 0xDE]))
+    # Cevapsız GET: sonraki trafikte zaman aşımı sayılır, cevap eşleşmez
+    corr.feed(10 * ms, TX, bytes([0x02]))
+    corr.feed(200 * ms, RX, bytes([7]))
+    # Board #2'ye özgü komut → etiketler B2'ye geçer
+    corr.feed(300 * ms, TX, bytes([0x06]))
+    corr.feed(305 * ms, RX, bytes([0xF5]))
+
+    rows = {row[0]: row for row in corr.report()}
+    assert rows[0x04][2:6] == (1, 1, 0, 1.0), rows[0x04]
+    assert rows[0x02][2:5] == (1, 0, 1)
+    assert rows[0x06][1] == "[B2] Dış basınç (tam) AL" and rows[0x06][5] == 5.0
+    assert corr.sets == 1 and corr.last_set == 30.5 and corr.unsolicited == 1
+    assert "SET → 30.5" in events and any("zaman aşımı" in e for e in events)
+    assert "t.aşımı" in corr.format_report()
+
+    hist = LatencyHistogram()
+    for us in [1000] * 90 + [5000] * 9 + [40000]:
+        hist.add(us)
+    assert hist.percentile(50) == 1000.0
+    assert 5000 <= hist.percentile(95) < 5000 * 1.26
+    assert hist.percentile(99) == hist.percentile(95) and hist.percentile(100) == 40000
+    print("  ✓ Başarılı")
+    return True
+
+
+def test_dual_port():
+    """
+    Test 6: DualPortMonitor iki pty'den TX/RX okur, eşleştirir ve yakalar
+    """
+    print_subheader("TEST 6: Çift port")
+
+    tx_link, rx_link = PtyLink(), PtyLink()
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "dual.ucap")
+        monitor = DualPortMonitor(tx_port=tx_link.port, rx_port=rx_link.port, board="1",
+                                  capture_file=path, report_interval=0)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            thread = threading.Thread(target=monitor.monitor)
+            thread.start()
+            time.sleep(0.3)
+            for _ in range(20):
+                tx_link.write(bytes([0x04, 0x05]))
+                time.sleep(0.004)
+                rx_link.write(bytes([23, 2]))
+                time.sleep(0.01)
+            tx_link.write(bytes([0xC0 | 25, 0x80 | 5]))
+            time.sleep(0.3)
+            monitor.running = False
+            thread.join(3)
+        tx_link.close()
+        rx_link.close()
+
+        rows = {row[0]: row for row in monitor.correlator.report()}
+        assert rows[0x04][2:5] == (20, 20, 0), rows
+        assert 2.0 <= rows[0x04][5] < 100.0, rows[0x04]
+        assert monitor.correlator.last_set == 25.5
+        assert "Ortam sıcaklığı (tam) AL → 23" in out.getvalue()
+
+        report = io.StringIO()
+        with contextlib.redirect_stdout(report):
+            uart_decode.main([path, "--format", "latency", "--board", "1"])
+    assert "[B1] Fan hızı AL" in report.getvalue() and "SET çifti: 1 (son: 25.5)" in report.getvalue()
+    print("  ✓ Başarılı")
+    return True
+
+
+def run_all_tests():
+    """
+    Tüm testleri sırayla çalıştır
+    """
+    results = {
+        "Döndürme": test_rotation(),
+        "Dolu Kuyruk": test_full_queue_drops(),
+        "UARTMonitor": test_monitor_capture(),
+        "Yakalama": test_capture_decode(),
+        "Eşleştirme": test_correlator(),
+        "Çift Port": test_dual_port(),
+    }
+    passed = sum(results.values())
+    print(f"\n  TOPLAM: {passed}/{len(results)} test başarılı")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -0,0 +1,154 @@
+"""
+Arka Plan Log Yazıcı
+BM-1 Görevi - UART İletişim Analizi
+
+İzleme döngüsü dosyaya hiç dokunmaz: yalnızca ham
+(timestamp_ns, bytes) demetlerini sınırlı bir kuyruğa ekler.
+Yazıcı iş parçacığı bunları biçimlendirir, toplu halde yazar,
+flush_interval'da bir diske boşaltır ve dosya max_bytes'ı aşınca
+döndürür (log.txt → log.txt.1 → log.txt.2 ...).
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+
+
+class LogWriter:
+    """
+    Sınırlı kuyruklu, toplu yazan log iş parçacığı
+
+    Örnek Kullanım:
+        >>> writer = LogWriter("uart_log.txt", formatter=format_chunk).start()
+        >>> writer.submit(time.time_ns(), data)   # izleme döngüsünden
+        >>> writer.close()
+    """
+
+    def __init__(self, path=None, formatter=None, echo=True, max_queue=4096,
+                 flush_interval=0.2, max_bytes=10 * 1024 * 1024, backup_count=5):
+        """
+        Args:
+            path (str): Log dosyası (None = yalnızca ekrana)
+            formatter (callable): (timestamp_ns, veri) → satır listesi
+            echo (bool): Satırları ekrana da yaz
+            max_queue (int): Kuyruk kapasitesi (dolunca yeni parçalar atılır)
+            flush_interval (float): Diske boşaltma aralığı (s)
+            max_bytes (int): Döndürme eşiği (0 = döndürme yok)
+            backup_count (int): Saklanacak eski dosya sayısı
+        """
+        self.path = path
+        self.formatter = formatter or self._default_format
+        self.echo = echo
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self.stats = {"chunks": 0, "lines": 0, "dropped_chunks": 0, "dropped_bytes": 0, "rotations": 0}
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._file = None
+        self._size = 0
+        self._thread = threading.Thread(target=self._run, name="uart-log-writer", daemon=True)
+
+    @staticmethod
+    def _default_format(timestamp_ns, data):
+        return [f"{timestamp_ns} {data if isinstance(data, str) else data.hex(' ')}"]
+
+    def start(self):
+        if self.path:
+            self._open()
+        self._thread.start()
+        return self
+
+    def submit(self, timestamp_ns, data):
+        """
+        Ham veriyi kuyruğa ekle (hiç beklemez)
+
+        Returns:
+            bool: Kuyruk doluysa False (veri atıldı, stats'a sayılır)
+        """
+        try:
+            self._queue.put_nowait((timestamp_ns, data))
+            return True
+        except queue.Full:
+            self.stats["dropped_chunks"] += 1
+            self.stats["dropped_bytes"] += len(data)
+            return False
+
+    def close(self):
+        """Kuyruktakileri yaz ve dosyayı kapat"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    # ─────────────────────────────────────────────────────
+    # YAZICI İŞ PARÇACIĞI
+    # ─────────────────────────────────────────────────────
+
+    def _run(self):
+        next_flush = time.monotonic() + self.flush_interval
+        stop = False
+        while not stop:
+            lines = []
+            try:
+                item = self._queue.get(timeout=max(0.0, next_flush - time.monotonic()))
+                while item is not None:
+                    self.stats["chunks"] += 1
+                    lines.extend(self.formatter(*item))
+                    item = self._queue.get_nowait()
+                stop = True
+            except queue.Empty:
+                pass
+
+            if lines:
+                self._write(lines)
+            if stop or time.monotonic() >= next_flush:
+                if self._file:
+                    self._file.flush()
+                if self.echo:
+                    sys.stdout.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+    def _write(self, lines):
+        self.stats["lines"] += len(lines)
+        if self.echo:
+            sys.stdout.write("\n".join(lines) + "\n")
+        if not self._file:
+            return
+        if not self.max_bytes:
+            self._file.write("\n".join(lines) + "\n")
+            return
+
+        # Parti, döndürme sınırlarında bölünerek tek write ile yazılır
+        chunk = []
+        for line in lines:
+            size = len(line.encode("utf-8")) + 1
+            if self._size and self._size + size > self.max_bytes:
+                self._file.write("".join(chunk))
+                chunk = []
+                self._rotate()
+            chunk.append(line + "\n")
+            self._size += size
+        self._file.write("".join(chunk))
+
+    def _open(self):
+        self._file = open(self.path, "a", encoding="utf-8", newline="\n")
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = f"{self.path}.{i}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.stats["rotations"] += 1
+        self._open()
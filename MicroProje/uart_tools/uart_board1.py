@@ -8,160 +8,230 @@ Bu program Board #1 ile direkt UART komutları gönderir ve cevapları okur.
 API kullanmadan ham UART iletişimi yapar (BM-1 gereksinimi).
 """
 
-import serial
+import os
 import time
 import sys
 
+# Proje kökünü (api/) path'e ekle - script olarak çalıştırıldığında gerekli
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from api.board_ready import READY_TIMEOUT, open_port, wait_ready
+from api.log import DEBUG, RX, TIMEOUT, TX, configure_from_env, get_logger
+from api.serial_broker import BrokerSerial, is_broker_url
+from api.protocol import channel, read_plan, set_encoder
+
+_log = get_logger("uart.board1")
+
+DESIRED = channel("1", "desired_temp")
+AMBIENT = channel("1", "ambient_temp")
+FAN = channel("1", "fan_speed")
+
 class UARTBoard1:
     """
     Board #1 için direkt UART iletişim sınıfı
     
-    UART Protokolü (R2.1.4-1):
-    - 0x01: İstenen sıcaklık (ondalık) AL
-    - 0x02: İstenen sıcaklık (tam) AL
-    - 0x03: Ortam sıcaklığı (ondalık) AL
-    - 0x04: Ortam sıcaklığı (tam) AL
-    - 0x05: Fan hızı AL
-    - 0xC0 | değer: Sıcaklık (tam) AYARLA
-    - 0x80 | değer: Sıcaklık (ondalık) AYARLA
+    UART Protokolü (R2.1.4-1): api.protocol.BOARD1_CHANNELS
+    - GET: desired_temp (0x02/0x01), ambient_temp (0x04/0x03), fan_speed (0x05)
+    - SET: 0xC0|tam + 0x80|ondalık → desired_temp (10.0-50.0°C)
     """
     
-    def __init__(self, port="COM14", baudrate=9600):
+    # read_all_data() toplu okuma planı (GET vektörü + çözücü)
+    READ_PLAN = read_plan("1")
+    SET_ENCODER = set_encoder("1")
+    
+    def __init__(self, port="COM14", baudrate=9600, batch_fallback=True, dtr_reset=True, ready_timeout=READY_TIMEOUT):
         self.port = port
         self.baudrate = baudrate
         self.ser = None
+        self.batch_fallback = batch_fallback  # Toplu okuma eksikse byte byte tekrar dene
+        self.dtr_reset = dtr_reset            # False: DTR düşük tutulur, kart resetlenmez, bekleme yok
+        self.ready_timeout = ready_timeout    # Hazır olma yoklaması üst sınırı (s)
     
     def connect(self):
         """Seri porta bağlan"""
         try:
-            self.ser = serial.Serial(
-                port=self.port,
-                baudrate=self.baudrate,
-                bytesize=8,
-                parity='N',
-                stopbits=1,
-                timeout=1
-            )
-            time.sleep(2)  # PIC reset bekleme
+            if is_broker_url(self.port):
+                # Port aracıda zaten açık: reset beklemesi yok
+                self.ser = BrokerSerial(self.port, timeout=1)
+                _log.info("✓ Aracıya bağlanıldı: %s", self.port)
+                return True
+            self.ser = open_port(self.port, self.baudrate, timeout=1, dtr_reset=self.dtr_reset)
+            if self.dtr_reset:
+                # Sabit bekleme yerine: kart ilk yoklamaya cevap verince devam
+                waited = wait_ready(self.ser, self.ready_timeout)
+                if waited is None:
+                    _log.warning("⚠ Kart %s s içinde cevap vermedi", self.ready_timeout)
+                else:
+                    _log.debug("  Kart hazır (%.2f s)", waited)
             self.ser.reset_input_buffer()
             self.ser.reset_output_buffer()
-            print(f"✓ Bağlantı kuruldu: {self.port} @ {self.baudrate}")
+            _log.info("✓ Bağlantı kuruldu: %s @ %s", self.port, self.baudrate)
             return True
         except Exception as e:
-            print(f"✗ Bağlantı hatası: {e}")
+            _log.error("✗ Bağlantı hatası: %s", e)
             return False
     
     def disconnect(self):
         """Bağlantıyı kes"""
         if self.ser and self.ser.is_open:
             self.ser.close()
-            print("✓ Bağlantı kapatıldı")
+            _log.info("✓ Bağlantı kapatıldı")
     
     def send_byte(self, byte_val):
         """Tek byte gönder"""
         if not self.ser or not self.ser.is_open:
-            print("✗ Port açık değil!")
+            _log.error("✗ Port açık değil!")
             return False
         
         self.ser.write(bytes([byte_val]))
-        print(f"  → Gönderildi: 0x{byte_val:02X}")
+        _log.debug("  → Gönderildi: 0x%02X", byte_val, extra=TX)
         time.sleep(0.05)
         return True
     
     def read_byte(self):
         """Tek byte oku"""
         if not self.ser or not self.ser.is_open:
-            print("✗ Port açık değil!")
+            _log.error("✗ Port açık değil!")
             return None
         
         data = self.ser.read(1)
         if len(data) == 1:
-            print(f"  ← Alındı: 0x{data[0]:02X} ({data[0]})")
+            _log.debug("  ← Alındı: 0x%02X (%s)", data[0], data[0], extra=RX)
             return data[0]
         else:
-            print("  ⚠ Timeout - cevap yok")
+            _log.warning("  ⚠ Timeout - cevap yok", extra=TIMEOUT)
             return None
     
+    def query(self, cmd):
+        """Tek GET komutu gönder, cevabını oku (sabit bekleme yok)"""
+        if not self.ser or not self.ser.is_open:
+            _log.error("✗ Port açık değil!")
+            return None
+        
+        self.ser.reset_input_buffer()  # Önceki timeout'tan kalan geç cevapları at
+        self.ser.write(bytes([cmd]))
+        data = self.ser.read(1)
+        return data[0] if len(data) == 1 else None
+    
+    def query_batch(self, cmds):
+        """
+        GET komutlarını tek seferde gönder, cevapları sırayla oku
+        
+        Cevaplar komut sırasıyla eşlenir. Eksik cevapta hangi byte'ın
+        kaybolduğu bilinemeyeceği için liste tümüyle None döner.
+        """
+        if not self.ser or not self.ser.is_open:
+            _log.error("✗ Port açık değil!")
+            return [None] * len(cmds)
+        
+        self.ser.reset_input_buffer()
+        self.ser.write(bytes(cmds))
+        if _log.isEnabledFor(DEBUG):
+            _log.debug("  → Gönderildi: %s", bytes(cmds).hex(' ').upper(), extra=TX)
+        data = self.ser.read(len(cmds))
+        if len(data) != len(cmds):
+            _log.warning("  ⚠ Toplu okuma eksik: %s/%s cevap", len(data), len(cmds), extra=TIMEOUT)
+            return [None] * len(cmds)
+        if _log.isEnabledFor(DEBUG):
+            _log.debug("  ← Alındı: %s", data.hex(' ').upper(), extra=RX)
+        return list(data)
+    
     def get_desired_temp_integral(self):
         """İstenen sıcaklık (tam kısım) oku"""
-        print("\n[Komut] İstenen Sıcaklık (Tam Kısım)")
-        self.send_byte(0x02)
+        _log.debug("[Komut] İstenen Sıcaklık (Tam Kısım)")
+        self.send_byte(DESIRED.int_code)
         return self.read_byte()
     
     def get_desired_temp_fractional(self):
         """İstenen sıcaklık (ondalık kısım) oku"""
-        print("\n[Komut] İstenen Sıcaklık (Ondalık Kısım)")
-        self.send_byte(0x01)
+        _log.debug("[Komut] İstenen Sıcaklık (Ondalık Kısım)")
+        self.send_byte(DESIRED.frac_code)
         return self.read_byte()
     
     def get_ambient_temp_integral(self):
         """Ortam sıcaklığı (tam kısım) oku"""
-        print("\n[Komut] Ortam Sıcaklığı (Tam Kısım)")
-        self.send_byte(0x04)
+        _log.debug("[Komut] Ortam Sıcaklığı (Tam Kısım)")
+        self.send_byte(AMBIENT.int_code)
         return self.read_byte()
     
     def get_ambient_temp_fractional(self):
         """Ortam sıcaklığı (ondalık kısım) oku"""
-        print("\n[Komut] Ortam Sıcaklığı (Ondalık Kısım)")
-        self.send_byte(0x03)
+        _log.debug("[Komut] Ortam Sıcaklığı (Ondalık Kısım)")
+        self.send_byte(AMBIENT.frac_code)
         return self.read_byte()
     
     def get_fan_speed(self):
         """Fan hızı oku"""
-        print("\n[Komut] Fan Hızı")
-        self.send_byte(0x05)
+        _log.debug("[Komut] Fan Hızı")
+        self.send_byte(FAN.int_code)
         return self.read_byte()
     
     def set_desired_temp(self, temp):
-        """İstenen sıcaklığı ayarla"""
-        if temp < 10.0 or temp > 50.0:
-            print(f"✗ Hata: Sıcaklık 10-50°C arası olmalı! (Girilen: {temp})")
+        """İstenen sıcaklığı ayarla (0.1°C'ye yuvarlanır)"""
+        try:
+            cmd_h, cmd_l = self.SET_ENCODER.encode(temp)
+        except ValueError as e:
+            _log.error("✗ Hata: %s", e)
             return False
         
-        temp_h = int(temp)
-        temp_l = int((temp - temp_h) * 10)
-        
-        print(f"\n[Komut] İstenen Sıcaklık Ayarla: {temp:.1f}°C")
-        print(f"  Tam kısım: {temp_h}, Ondalık: {temp_l}")
+        _log.info("[Komut] İstenen Sıcaklık Ayarla: %.1f°C", temp)
+        _log.debug("  Tam kısım: %s, Ondalık: %s", cmd_h & 0x3F, cmd_l & 0x3F)
         
         # Tam kısım gönder
-        cmd_h = 0xC0 | (temp_h & 0x3F)
         self.send_byte(cmd_h)
         
         # Ondalık kısım gönder
-        cmd_l = 0x80 | (temp_l & 0x3F)
         self.send_byte(cmd_l)
         
-        print("✓ Komut gönderildi")
+        _log.info("✓ Komut gönderildi")
         return True
     
+    def read_channels(self, names):
+        """
+        Seçilen kanalları tek toplu sorguyla oku (zamanlayıcı için)
+        
+        Args:
+            names (tuple): Kanal adları (örn: ("ambient_temp", "fan_speed"))
+        
+        Returns:
+            dict: kanal adı → değer (okunamayanlar None)
+        """
+        plan = read_plan("1", tuple(names))
+        replies = self.query_batch(plan.commands)
+        if None in replies and self.batch_fallback:
+            replies = [self.query(cmd) for cmd in plan.commands]
+        return plan.decode(replies)
+    
     def read_all_data(self):
-        """Tüm verileri oku ve göster"""
-        print("\n" + "="*50)
-        print("  TÜM VERİLERİ OKU")
-        print("="*50)
+        """
+        Tüm verileri tek toplu sorguyla oku
         
-        # Ortam sıcaklığı
-        amb_h = self.get_ambient_temp_integral()
-        amb_l = self.get_ambient_temp_fractional()
-        if amb_h is not None and amb_l is not None:
-            ambient = float(amb_h) + float(amb_l) / 10.0
-            print(f"\n📊 Ortam Sıcaklığı: {ambient:.1f}°C")
+        Okuma planının GET vektörü tek write ile gönderilir, beş cevap
+        byte'ı tek geçişte çözülür. Cevap eksikse ve batch_fallback
+        açıksa komutlar byte byte tekrarlanır.
         
-        # İstenen sıcaklık
-        des_h = self.get_desired_temp_integral()
-        des_l = self.get_desired_temp_fractional()
-        if des_h is not None and des_l is not None:
-            desired = float(des_h) + float(des_l) / 10.0
-            print(f"📊 İstenen Sıcaklık: {desired:.1f}°C")
+        Returns:
+            dict: desired_temp, ambient_temp, fan_speed
+                  (okunamayan değerler None)
+        """
+        _log.debug("[Komut] Tüm veriler (toplu)")
         
-        # Fan hızı
-        fan = self.get_fan_speed()
-        if fan is not None:
-            print(f"📊 Fan Hızı: {fan} rps")
+        commands = self.READ_PLAN.commands
+        replies = self.query_batch(commands)
+        if None in replies and self.batch_fallback:
+            _log.warning("  → Byte byte moda geçiliyor...")
+            replies = [self.query(cmd) for cmd in commands]
+        data = self.READ_PLAN.decode(replies)
         
-        print("="*50)
-
+        if data["ambient_temp"] is not None:
+            _log.info("📊 Ortam Sıcaklığı: %.1f°C", data['ambient_temp'])
+        if data["desired_temp"] is not None:
+            _log.info("📊 İstenen Sıcaklık: %.1f°C", data['desired_temp'])
+        if data["fan_speed"] is not None:
+            _log.info("📊 Fan Hızı: %s rps", data['fan_speed'])
+        return data
 
 def interactive_mode():
     """İnteraktif mod - Kullanıcı menüsü"""
@@ -265,6 +335,8 @@ def demo_mode():
 
 
 if __name__ == "__main__":
+    # İnteraktif araç: byte izleri varsayılan olarak görünür (EEM_LOG ile değiştirilebilir)
+    configure_from_env(default="debug", stream=sys.stdout)
     print("\n")
     print("╔" + "="*58 + "╗")
     print("║" + " "*58 + "║")
@@ -7,159 +7,233 @@ Tarih: 11 Aralık 2025
 DÜZELTME: Timeout kısaltıldı (0.3s), döngü hatası giderildi
 """
 
-import serial
+import os
 import time
 import sys
 
+# Proje kökünü (api/) path'e ekle - script olarak çalıştırıldığında gerekli
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from api.board_ready import open_port, wait_ready
+from api.log import DEBUG, RX, TIMEOUT, TX, configure_from_env, get_logger
+from api.serial_broker import BrokerSerial, is_broker_url
+from api.protocol import read_plan, set_encoder
+
+_log = get_logger("uart.board2")
+
 class UARTBoard2:
-    """Board #2 için direkt UART iletişim sınıfı"""
+    """Board #2 için direkt UART iletişim sınıfı (protokol: api.protocol.BOARD2_CHANNELS)"""
+    
+    # read_all_data() toplu okuma planı (GET vektörü + çözücü)
+    READ_PLAN = read_plan("2")
+    ALL_COMMANDS = READ_PLAN.commands
+    SET_ENCODER = set_encoder("2")
     
-    def __init__(self, port="COM14", baudrate=9600):
+    def __init__(self, port="COM14", baudrate=9600, batch_fallback=True, dtr_reset=True, ready_timeout=1.0,
+                 int_window=False):
         self.port = port
         self.baudrate = baudrate
         self.ser = None
+        self.batch_fallback = batch_fallback  # Toplu okuma eksikse byte byte tekrar dene
+        self.dtr_reset = dtr_reset            # False: DTR düşük tutulur, kart resetlenmez, bekleme yok
+        self.ready_timeout = ready_timeout    # Hazır olma yoklaması üst sınırı (s)
+        self.int_window = int_window          # True: basınç byte'ı 850-1100 hPa penceresine açılır
     
     def connect(self):
         """Seri porta bağlan"""
         try:
-            self.ser = serial.Serial(
-                port=self.port,
-                baudrate=self.baudrate,
-                bytesize=8,
-                parity='N',
-                stopbits=1,
-                timeout=0.3  # DÜZELTME: 1 saniye → 0.3 saniye
-            )
-            time.sleep(1)  # DÜZELTME: 2 saniye → 1 saniye
+            if is_broker_url(self.port):
+                # Port aracıda zaten açık: reset beklemesi yok
+                self.ser = BrokerSerial(self.port, timeout=0.3)
+                _log.info("✓ Aracıya bağlanıldı: %s", self.port)
+                return True
+            self.ser = open_port(self.port, self.baudrate, timeout=0.3, dtr_reset=self.dtr_reset)
+            if self.dtr_reset:
+                # Sabit bekleme yerine: kart ilk yoklamaya cevap verince devam
+                waited = wait_ready(self.ser, self.ready_timeout)
+                if waited is None:
+                    _log.warning("⚠ Kart %s s içinde cevap vermedi", self.ready_timeout)
+                else:
+                    _log.debug("  Kart hazır (%.2f s)", waited)
             self.ser.reset_input_buffer()
             self.ser.reset_output_buffer()
-            print(f"✓ Bağlantı kuruldu: {self.port} @ {self.baudrate}")
+            _log.info("✓ Bağlantı kuruldu: %s @ %s", self.port, self.baudrate)
             return True
         except Exception as e:
-            print(f"✗ Bağlantı hatası: {e}")
+            _log.error("✗ Bağlantı hatası: %s", e)
             return False
     
     def disconnect(self):
         """Bağlantıyı kes"""
         if self.ser and self.ser.is_open:
             self.ser.close()
-            print("✓ Bağlantı kapatıldı")
+            _log.info("✓ Bağlantı kapatıldı")
     
     def send_byte(self, byte_val):
         """Tek byte gönder"""
         if not self.ser or not self.ser.is_open:
-            print("✗ Port açık değil!")
+            _log.error("✗ Port açık değil!")
             return False
         
         self.ser.write(bytes([byte_val]))
-        print(f"  → Gönderildi: 0x{byte_val:02X}")
+        _log.debug("  → Gönderildi: 0x%02X", byte_val, extra=TX)
         time.sleep(0.05)
         return True
     
     def read_byte(self):
         """Tek byte oku"""
         if not self.ser or not self.ser.is_open:
-            print("✗ Port açık değil!")
+            _log.error("✗ Port açık değil!")
             return None
         
         data = self.ser.read(1)
         if len(data) == 1:
-            print(f"  ← Alındı: 0x{data[0]:02X} ({data[0]})")
+            _log.debug("  ← Alındı: 0x%02X (%s)", data[0], data[0], extra=RX)
             return data[0]
         else:
-            print("  ⚠ Timeout - cevap yok")
+            _log.warning("  ⚠ Timeout - cevap yok", extra=TIMEOUT)
+            return None
+    
+    def query(self, cmd):
+        """Tek GET komutu gönder, cevabını oku (sabit bekleme yok)"""
+        if not self.ser or not self.ser.is_open:
+            _log.error("✗ Port açık değil!")
             return None
+        
+        self.ser.reset_input_buffer()  # Önceki timeout'tan kalan geç cevapları at
+        self.ser.write(bytes([cmd]))
+        data = self.ser.read(1)
+        return data[0] if len(data) == 1 else None
+    
+    def query_batch(self, cmds):
+        """
+        GET komutlarını tek seferde gönder, cevapları sırayla oku
+        
+        Cevaplar komut sırasıyla eşlenir. Eksik cevapta hangi byte'ın
+        kaybolduğu bilinemeyeceği için liste tümüyle None döner.
+        """
+        if not self.ser or not self.ser.is_open:
+            _log.error("✗ Port açık değil!")
+            return [None] * len(cmds)
+        
+        self.ser.reset_input_buffer()
+        self.ser.write(bytes(cmds))
+        if _log.isEnabledFor(DEBUG):
+            _log.debug("  → Gönderildi: %s", bytes(cmds).hex(' ').upper(), extra=TX)
+        data = self.ser.read(len(cmds))
+        if len(data) != len(cmds):
+            _log.warning("  ⚠ Toplu okuma eksik: %s/%s cevap", len(data), len(cmds), extra=TIMEOUT)
+            return [None] * len(cmds)
+        if _log.isEnabledFor(DEBUG):
+            _log.debug("  ← Alındı: %s", data.hex(' ').upper(), extra=RX)
+        return list(data)
+    
+    def read_channel(self, name):
+        """Tek kanalı (tam + ondalık GET çifti) oku ve şemaya göre çöz"""
+        plan = read_plan("2", (name,))
+        replies = []
+        for cmd in plan.commands:
+            self.send_byte(cmd)
+            replies.append(self.read_byte())
+        return plan.decode(replies, self.int_window)[name]
     
     def get_curtain_status(self):
         """Perde durumunu oku"""
-        print("\n[Komut] Perde Durumu")
-        self.send_byte(0x02)  # Tam
-        curt_h = self.read_byte()
-        self.send_byte(0x01)  # Ondalık
-        curt_l = self.read_byte()
-        
-        if curt_h is not None and curt_l is not None:
-            status = float(curt_h) + float(curt_l) / 10.0
-            print(f"📊 Perde: %{status:.1f}")
-            return status
-        return None
+        _log.debug("[Komut] Perde Durumu")
+        status = self.read_channel("curtain")
+        if status is not None:
+            _log.info("📊 Perde: %%%.1f", status)
+        return status
     
     def get_outdoor_temp(self):
         """Dış sıcaklık oku"""
-        print("\n[Komut] Dış Sıcaklık")
-        self.send_byte(0x04)  # Tam
-        temp_h = self.read_byte()
-        self.send_byte(0x03)  # Ondalık
-        temp_l = self.read_byte()
-        
-        if temp_h is not None and temp_l is not None:
-            temp = float(temp_h) + float(temp_l) / 10.0
-            print(f"📊 Dış Sıcaklık: {temp:.1f}°C")
-            return temp
-        return None
+        _log.debug("[Komut] Dış Sıcaklık")
+        temp = self.read_channel("outdoor_temp")
+        if temp is not None:
+            _log.info("📊 Dış Sıcaklık: %.1f°C", temp)
+        return temp
     
     def get_outdoor_pressure(self):
         """Dış basınç oku"""
-        print("\n[Komut] Dış Basınç")
-        self.send_byte(0x06)  # Tam
-        press_h = self.read_byte()
-        self.send_byte(0x05)  # Ondalık
-        press_l = self.read_byte()
-        
-        if press_h is not None and press_l is not None:
-            pressure = float(press_h) + float(press_l) / 10.0
-            print(f"📊 Dış Basınç: {pressure:.1f} hPa")
-            return pressure
-        return None
+        _log.debug("[Komut] Dış Basınç")
+        pressure = self.read_channel("outdoor_press")
+        if pressure is not None:
+            _log.info("📊 Dış Basınç: %.1f hPa", pressure)
+        return pressure
     
     def get_light_intensity(self):
         """Işık şiddeti oku"""
-        print("\n[Komut] Işık Şiddeti")
-        self.send_byte(0x08)  # Tam
-        light_h = self.read_byte()
-        self.send_byte(0x07)  # Ondalık
-        light_l = self.read_byte()
-        
-        if light_h is not None and light_l is not None:
-            light = float(light_h) + float(light_l) / 10.0
-            print(f"📊 Işık: {light:.1f} Lux")
-            return light
-        return None
+        _log.debug("[Komut] Işık Şiddeti")
+        light = self.read_channel("light")
+        if light is not None:
+            _log.info("📊 Işık: %.1f Lux", light)
+        return light
     
     def set_curtain_status(self, status):
-        """Perde durumu ayarla"""
-        if status < 0 or status > 100:
-            print(f"✗ Hata: Perde %0-100 arası olmalı! (Girilen: {status})")
+        """Perde durumu ayarla (0.1'e yuvarlanır; 6 bit SET yükü: en fazla %63.9)"""
+        try:
+            cmd_h, cmd_l = self.SET_ENCODER.encode(status)
+        except ValueError as e:
+            _log.error("✗ Hata: %s", e)
             return False
         
-        status_h = int(status)
-        status_l = int((status - status_h) * 10)
-        
-        print(f"\n[Komut] Perde Ayarla: %{status:.1f}")
-        print(f"  Tam kısım: {status_h}, Ondalık: {status_l}")
+        _log.info("[Komut] Perde Ayarla: %%%.1f", status)
+        _log.debug("  Tam kısım: %s, Ondalık: %s", cmd_h & 0x3F, cmd_l & 0x3F)
         
-        cmd_h = 0xC0 | (status_h & 0x3F)
         self.send_byte(cmd_h)
-        
-        cmd_l = 0x80 | (status_l & 0x3F)
         self.send_byte(cmd_l)
         
-        print("✓ Komut gönderildi")
+        _log.info("✓ Komut gönderildi")
         return True
     
+    def read_channels(self, names):
+        """
+        Seçilen kanalları tek toplu sorguyla oku (zamanlayıcı için)
+        
+        Args:
+            names (tuple): Kanal adları (örn: ("ambient_temp", "fan_speed"))
+        
+        Returns:
+            dict: kanal adı → değer (okunamayanlar None)
+        """
+        plan = read_plan("2", tuple(names))
+        replies = self.query_batch(plan.commands)
+        if None in replies and self.batch_fallback:
+            replies = [self.query(cmd) for cmd in plan.commands]
+        return plan.decode(replies, self.int_window)
+    
     def read_all_data(self):
-        """Tüm verileri oku"""
-        print("\n" + "="*50)
-        print("  TÜM VERİLERİ OKU")
-        print("="*50)
+        """
+        Tüm verileri tek toplu sorguyla oku
         
-        self.get_outdoor_temp()
-        self.get_outdoor_pressure()
-        self.get_light_intensity()
-        self.get_curtain_status()
+        Okuma planının GET vektörü tek write ile gönderilir, sekiz
+        cevap byte'ı tek geçişte çözülür. Cevap eksikse ve
+        batch_fallback açıksa komutlar byte byte tekrarlanır.
         
-        print("="*50)  # DÜZELTME: Bu satır eklendi
-
+        Returns:
+            dict: curtain, outdoor_temp, outdoor_press, light
+                  (okunamayan değerler None)
+        """
+        _log.debug("[Komut] Tüm veriler (toplu)")
+        
+        replies = self.query_batch(self.ALL_COMMANDS)
+        if None in replies and self.batch_fallback:
+            _log.warning("  → Byte byte moda geçiliyor...")
+            replies = [self.query(cmd) for cmd in self.ALL_COMMANDS]
+        
+        data = self.READ_PLAN.decode(replies, self.int_window)
+        
+        if data["outdoor_temp"] is not None:
+            _log.info("📊 Dış Sıcaklık: %.1f°C", data['outdoor_temp'])
+        if data["outdoor_press"] is not None:
+            _log.info("📊 Dış Basınç: %.1f hPa", data['outdoor_press'])
+        if data["light"] is not None:
+            _log.info("📊 Işık: %.1f Lux", data['light'])
+        if data["curtain"] is not None:
+            _log.info("📊 Perde: %%%.1f", data['curtain'])
+        return data
 
 def interactive_mode():
     """İnteraktif mod"""
@@ -241,6 +315,8 @@ def interactive_mode():
 
 
 if __name__ == "__main__":
+    # İnteraktif araç: byte izleri varsayılan olarak görünür (EEM_LOG ile değiştirilebilir)
+    configure_from_env(default="debug", stream=sys.stdout)
     print("\n")
     print("╔" + "="*58 + "╗")
     print("║" + " "*58 + "║")
@@ -0,0 +1,184 @@
+"""
+UART Ham Yakalama Biçimi (.ucap)
+BM-1 Görevi - UART İletişim Analizi
+
+pcap benzeri, çözümsüz ham yakalama. İzleme sırasında hiçbir byte
+çözülmez; çözme işi sonradan uart_decode.py ile yapılır.
+
+Dosya başlığı (48 byte, little-endian):
+    magic "UCAP" | sürüm u16 | ayrılmış u16 | baud u32 |
+    başlangıç zamanı u64 (time_ns) | port adı 28s (UTF-8, NUL dolgulu)
+
+Her kayıt (11 byte başlık + veri):
+    zaman u64 (time_ns) | kanal u8 (0 = RX, 1 = TX) | uzunluk u16 | veri
+
+Kayıt başına 11 byte ek yük; 115200 baud'da tipik read() parçaları
+(onlarca byte) ile yük birkaç yüzdeyi geçmez.
+"""
+
+import queue
+import struct
+import threading
+import time
+
+MAGIC = b"UCAP"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sHHIQ28s")
+RECORD_HEADER = struct.Struct("<QBH")
+MAX_RECORD = 0xFFFF
+
+CHANNEL_RX = 0
+CHANNEL_TX = 1   # Çift port izlemede PC → board hattı
+
+
+class CaptureWriter:
+    """
+    Ham parçaları arka planda .ucap dosyasına yazan iş parçacığı
+
+    LogWriter ile aynı arayüz (start/submit/close/stats); izleme
+    döngüsü yalnızca submit() çağırır.
+
+    Örnek Kullanım:
+        >>> cap = CaptureWriter("yakalama.ucap", baudrate=115200, port="COM14").start()
+        >>> cap.submit(time.time_ns(), data)
+        >>> cap.close()
+    """
+
+    def __init__(self, path, baudrate=9600, port="", max_queue=4096, flush_interval=0.5):
+        self.path = path
+        self.baudrate = baudrate
+        self.port = port
+        self.flush_interval = flush_interval
+        self.stats = {"chunks": 0, "bytes": 0, "dropped_chunks": 0, "dropped_bytes": 0, "errors": 0}
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._file = None
+        self._thread = threading.Thread(target=self._run, name="uart-capture-writer", daemon=True)
+
+    def start(self):
+        self._file = open(self.path, "wb")
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, 0, self.baudrate, time.time_ns(),
+                                          self.port.encode("utf-8")[:28]))
+        self._thread.start()
+        return self
+
+    def submit(self, timestamp_ns, data, channel=CHANNEL_RX):
+        """
+        Ham veriyi kuyruğa ekle (hiç beklemez)
+
+        Returns:
+            bool: Kuyruk doluysa False (veri atıldı, stats'a sayılır)
+        """
+        try:
+            self._queue.put_nowait((timestamp_ns, channel, data))
+            return True
+        except queue.Full:
+            self.stats["dropped_chunks"] += 1
+            self.stats["dropped_bytes"] += len(data)
+            return False
+
+    def close(self, timeout=5.0):
+        """
+        Kuyruktakileri yaz ve dosyayı kapat
+
+        Args:
+            timeout (float): Yazıcıyı bekleme üst sınırı (s); kapanış
+                hiçbir durumda süresiz beklemez
+        """
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                print("⚠ Yakalama kuyruğu boşalmadı, kapanış beklenmiyor")
+            self._thread.join(timeout)
+        if self._thread.is_alive():
+            # Dosya hâlâ yazıcıda; kapatmak ona bırakılmaz, daemon iş parçacığı süreçle biter
+            print(f"⚠ Yakalama yazıcısı {timeout} s içinde kapanmadı")
+            return
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _run(self):
+        pack = RECORD_HEADER.pack
+        next_flush = time.monotonic() + self.flush_interval
+        stop = False
+        while not stop:
+            out = bytearray()
+            chunks = size = 0
+            try:
+                item = self._queue.get(timeout=max(0.0, next_flush - time.monotonic()))
+                while item is not None:
+                    timestamp_ns, channel, data = item
+                    for i in range(0, len(data), MAX_RECORD):
+                        part = data[i:i + MAX_RECORD]
+                        out += pack(timestamp_ns, channel, len(part))
+                        out += part
+                    chunks += 1
+                    size += len(data)
+                    item = self._queue.get_nowait()
+                stop = True
+            except queue.Empty:
+                pass
+
+            try:
+                if out:
+                    self._file.write(out)
+                if stop or time.monotonic() >= next_flush:
+                    self._file.flush()
+            except Exception as e:
+                # Disk dolu, çıkarılan USB bellek...: iş parçacığı ölmez, bu parti atılır
+                self.stats["errors"] += 1
+                self.stats["dropped_chunks"] += chunks
+                self.stats["dropped_bytes"] += size
+                print(f"✗ Yakalama yazma hatası ({size} byte atıldı): {e}")
+            else:
+                self.stats["chunks"] += chunks
+                self.stats["bytes"] += size
+            if stop or time.monotonic() >= next_flush:
+                next_flush = time.monotonic() + self.flush_interval
+
+
+def read_header(f):
+    """
+    Dosya başlığını oku
+
+    Returns:
+        dict: version, baudrate, start_ns, port
+    """
+    raw = f.read(FILE_HEADER.size)
+    if len(raw) < FILE_HEADER.size:
+        raise ValueError("Dosya çok kısa: .ucap başlığı yok")
+    magic, version, _, baudrate, start_ns, port = FILE_HEADER.unpack(raw)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Geçersiz .ucap dosyası")
+    return {"version": version, "baudrate": baudrate, "start_ns": start_ns,
+            "port": port.rstrip(b"\0").decode("utf-8", "replace")}
+
+
+def iter_records(f, chunk_size=1 << 20):
+    """
+    Kayıtları sırayla üret (dosya parça parça okunur)
+
+    Yields:
+        tuple: (zaman_ns, kanal, veri)
+    """
+    unpack_from = RECORD_HEADER.unpack_from
+    header_size = RECORD_HEADER.size
+    buf = b""
+    pos = 0
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            break
+        buf = buf[pos:] + block
+        pos = 0
+        end = len(buf)
+        while pos + header_size <= end:
+            timestamp_ns, channel, length = unpack_from(buf, pos)
+            start = pos + header_size
+            if start + length > end:
+                break
+            yield timestamp_ns, channel, buf[start:start + length]
+            pos = start + length
+    # Sondaki yarım kayıt (yakalama kesildiyse) yok sayılır
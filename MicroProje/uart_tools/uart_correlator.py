@@ -0,0 +1,231 @@
+"""
+UART İstek/Cevap Eşleştirici
+BM-1 Görevi - UART İletişim Analizi
+
+Çift port izlemede (PC → board TX hattı ve board → PC RX hattı)
+her GET komutunu cevap byte'ıyla eşleştirir:
+
+- Board cevapları istek sırasıyla gönderir (UART_Service tek byte
+  işler), bu yüzden bekleyen GET'ler FIFO kuyrukta tutulur
+- timeout içinde cevabı gelmeyen GET zaman aşımı sayılır
+- 0xC0|tam ve 0x80|ondalık SET çiftleri (sıradan bağımsız) tam
+  değere çevrilir ve board biliniyorsa şemadaki aralıkla denetlenir
+- Komut başına gecikme histogramı (log ölçekli kovalar, sabit
+  bellek) ve p50/p95/p99
+
+Board #2'ye özgü bir GET (0x06-0x08) görülürse "both" profili
+Board #2'ye geçer; 0x01 artık "Perde (ondalık)" olarak etiketlenir.
+"""
+
+import math
+import os
+import sys
+from bisect import bisect_left
+from collections import Counter, deque
+
+# Proje kökünü (api/) path'e ekle - script olarak çalıştırıldığında gerekli
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from api.protocol import BOARDS, PAYLOAD_MASK, PROFILES, SET_FRAC, SET_INT, decode_set, decode_table, set_encoder
+
+TX = "TX"   # PC → board (istekler)
+RX = "RX"   # board → PC (cevaplar)
+
+
+class LatencyHistogram:
+    """
+    Log ölçekli gecikme histogramı (10 µs - 100 s, onlukta 10 kova)
+
+    Örnek Kullanım:
+        >>> h = LatencyHistogram()
+        >>> for us in (900, 1000, 1100, 25000):
+        ...     h.add(us)
+        >>> h.percentile(50)      # kova üst sınırı (µs)
+        1000.0
+    """
+
+    EDGES_US = tuple(10.0 * 10 ** (i / 10.0) for i in range(71))
+
+    def __init__(self):
+        self.counts = [0] * (len(self.EDGES_US) + 1)
+        self.count = 0
+        self.total_us = 0.0
+        self.max_us = 0.0
+
+    def add(self, value_us):
+        self.counts[bisect_left(self.EDGES_US, value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def percentile(self, p):
+        """p. yüzdelik (µs) - içine düştüğü kovanın üst sınırı, en fazla max"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(p / 100.0 * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                edge = self.EDGES_US[i] if i < len(self.EDGES_US) else self.max_us
+                return round(min(edge, self.max_us), 3)
+        return self.max_us
+
+    @property
+    def mean_us(self):
+        return self.total_us / self.count if self.count else None
+
+
+class RequestCorrelator:
+    """
+    TX/RX byte akışlarından istek/cevap eşleştirme
+
+    Örnek Kullanım:
+        >>> corr = RequestCorrelator(board="1")
+        >>> corr.feed(0, TX, b"\\x04")
+        >>> corr.feed(1_200_000, RX, b"\\x16")    # 1.2 ms sonra 22
+        >>> print(corr.format_report())
+    """
+
+    def __init__(self, board="both", timeout=0.3, on_event=None):
+        """
+        Args:
+            board (str): "1", "2" ya da "both" (bilinmiyor, otomatik)
+            timeout (float): Cevap bekleme üst sınırı (s)
+            on_event (callable): (zaman_ns, metin) - eşleşme/SET/zaman aşımı olayları
+        """
+        self.board = board
+        self.timeout_ns = int(timeout * 1e9)
+        self.on_event = on_event
+
+        self._names = decode_table(board)
+        self._gets = frozenset(cmd.code for _, commands in PROFILES[board] for cmd in commands)
+        self._pending = deque()          # (istek zamanı, komut)
+        self._set_int = None
+        self._set_frac = None
+
+        self.requests = Counter()
+        self.replies = Counter()
+        self.timeouts = Counter()
+        self.histograms = {}             # komut → LatencyHistogram
+        self.sets = 0
+        self.last_set = None
+        self.unsolicited = 0             # Bekleyen GET yokken gelen cevap byte'ları
+        self.unknown = 0                 # Tanımsız TX byte'ları
+
+    def _event(self, t_ns, text):
+        if self.on_event is not None:
+            self.on_event(t_ns, text)
+
+    def feed(self, t_ns, side, data):
+        """Bir hattan okunan parçayı işle (olaylar zaman sırasıyla verilmeli)"""
+        handle = self._tx_byte if side == TX else self._rx_byte
+        for byte_val in data:
+            handle(t_ns, byte_val)
+
+    def finish(self, t_ns=None):
+        """İzleme bitti: cevabı gelmemiş tüm GET'ler zaman aşımı sayılır"""
+        while self._pending:
+            t_req, cmd = self._pending.popleft()
+            self._timeout(t_req if t_ns is None else t_ns, cmd)
+
+    # ─────────────────────────────────────────────────────
+    # TX (istek) / RX (cevap)
+    # ─────────────────────────────────────────────────────
+
+    def _tx_byte(self, t_ns, byte_val):
+        self.expire(t_ns)
+        if byte_val & SET_INT == SET_INT:
+            self._set_int = byte_val & PAYLOAD_MASK
+            self._try_set(t_ns)
+        elif byte_val & SET_FRAC:
+            self._set_frac = byte_val & PAYLOAD_MASK
+            self._try_set(t_ns)
+        elif byte_val in self._gets:
+            if self.board == "both" and byte_val > 0x05:
+                self._switch_board("2", t_ns)
+            self._pending.append((t_ns, byte_val))
+            self.requests[byte_val] += 1
+        else:
+            self.unknown += 1
+
+    def _rx_byte(self, t_ns, byte_val):
+        self.expire(t_ns)
+        if not self._pending:
+            self.unsolicited += 1
+            self._event(t_ns, f"RX 0x{byte_val:02X} ({byte_val}) | bekleyen istek yok")
+            return
+        t_req, cmd = self._pending.popleft()
+        latency_us = (t_ns - t_req) / 1000.0
+        self.replies[cmd] += 1
+        hist = self.histograms.get(cmd)
+        if hist is None:
+            hist = self.histograms[cmd] = LatencyHistogram()
+        hist.add(latency_us)
+        self._event(t_ns, f"{self._names[cmd]} → {byte_val} ({latency_us / 1000.0:.2f} ms)")
+
+    def _try_set(self, t_ns):
+        if self._set_int is None or self._set_frac is None:
+            return
+        board = self.board if self.board in BOARDS else None
+        value, valid = decode_set(self._set_int, self._set_frac, board)
+        label = f" {set_encoder(board).channel.label}" if board else ""
+        self._set_int = self._set_frac = None
+        self.sets += 1
+        self.last_set = value
+        self._event(t_ns, f"SET{label} → {value:.1f}{'' if valid else ' (geçersiz)'}")
+
+    def expire(self, t_ns):
+        """t_ns anında timeout'u dolmuş GET'leri zaman aşımı say (hat boştayken de çağrılır)"""
+        while self._pending and t_ns - self._pending[0][0] > self.timeout_ns:
+            t_req, cmd = self._pending.popleft()
+            self._timeout(t_req + self.timeout_ns, cmd)
+
+    def _timeout(self, t_ns, cmd):
+        self.timeouts[cmd] += 1
+        self._event(t_ns, f"{self._names[cmd]} → ✗ zaman aşımı")
+
+    def _switch_board(self, board, t_ns):
+        self.board = board
+        self._names = decode_table(board)
+        self._event(t_ns, f"Board #{board} trafiği algılandı")
+
+    # ─────────────────────────────────────────────────────
+    # RAPOR
+    # ─────────────────────────────────────────────────────
+
+    def report(self):
+        """
+        Returns:
+            list: Komut başına (kod, ad, istek, cevap, zaman aşımı,
+                p50, p95, p99, max) - gecikmeler ms
+        """
+        rows = []
+        for cmd in sorted(self.requests):
+            hist = self.histograms.get(cmd)
+            stats = [None] * 4
+            if hist is not None:
+                stats = [hist.percentile(50), hist.percentile(95), hist.percentile(99), hist.max_us]
+                stats = [v / 1000.0 for v in stats]
+            rows.append((cmd, self._names[cmd], self.requests[cmd], self.replies[cmd], self.timeouts[cmd], *stats))
+        return rows
+
+    def format_report(self):
+        """report() tablosunu metin olarak döndür"""
+        lines = ["=" * 92,
+                 f"  {'Komut':<38}{'istek':>7}{'cevap':>7}{'t.aşımı':>9}"
+                 f"{'p50':>8}{'p95':>8}{'p99':>8}{'maks':>8}  (ms)",
+                 "=" * 92]
+        for cmd, name, req, rep, tmo, p50, p95, p99, worst in self.report():
+            cells = "".join(f"{v:>8.2f}" if v is not None else f"{'-':>8}" for v in (p50, p95, p99, worst))
+            lines.append(f"  {name[:38]:<38}{req:>7}{rep:>7}{tmo:>9}{cells}")
+        lines.append("=" * 92)
+        extra = f"  SET çifti: {self.sets}"
+        if self.last_set is not None:
+            extra += f" (son: {self.last_set:.1f})"
+        extra += f" | istek dışı cevap: {self.unsolicited} | tanımsız TX: {self.unknown}"
+        lines.append(extra)
+        return "\n".join(lines)
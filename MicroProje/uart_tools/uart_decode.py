@@ -0,0 +1,147 @@
+"""
+UART Yakalama Çözücü
+BM-1 Görevi - UART İletişim Analizi
+
+uart_monitor.py'nin ham yakalama modunda (.ucap) kaydettiği trafiği
+sonradan çözer: açıklamalı metin, CSV, istatistik veya (çift port
+yakalamalarında) GET → cevap gecikme raporu.
+
+Çözme tabloludur: her byte değeri için açıklama api.protocol'deki
+256 elemanlı profil tablosundan gelir, döngüde yalnızca indekslenir.
+
+Kullanım:
+    python uart_decode.py yakalama.ucap                  # metin
+    python uart_decode.py yakalama.ucap --format csv -o out.csv
+    python uart_decode.py yakalama.ucap --format stats --board 2
+    python uart_decode.py cift_port.ucap --format latency --board 1
+"""
+
+import argparse
+import heapq
+import os
+import sys
+from collections import Counter
+from datetime import datetime
+
+# Proje kökünü (api/) path'e ekle - script olarak çalıştırıldığında gerekli
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from api.protocol import SET_INT, decode_table, line_table
+
+try:
+    from .uart_capture import CHANNEL_TX, iter_records, read_header
+    from .uart_correlator import RX, TX, RequestCorrelator
+except ImportError:  # python uart_decode.py olarak çalıştırıldığında
+    from uart_capture import CHANNEL_TX, iter_records, read_header
+    from uart_correlator import RX, TX, RequestCorrelator
+
+REORDER_NS = 20_000_000   # Çift port kayıtları kuyruğa farklı sırada düşebilir
+
+
+# ═════════════════════════════════════════════════════════
+# ÇIKTI BİÇİMLERİ
+# ═════════════════════════════════════════════════════════
+
+def write_text(records, out, board):
+    table = line_table(board)
+    index = 0
+    for timestamp_ns, _, data in records:
+        stamp = datetime.fromtimestamp(timestamp_ns / 1e9).strftime("%H:%M:%S.%f")[:-3]
+        prefix = f"[{stamp}] #"
+        out.write("".join([f"{prefix}{i:06d} → {table[b]}\n" for i, b in enumerate(data, index + 1)]))
+        index += len(data)
+
+
+def write_csv(records, out, board, start_ns):
+    table = [name.replace('"', '""') for name in decode_table(board)]
+    out.write("time_ns,offset_s,index,byte,description\n")
+    index = 0
+    for timestamp_ns, _, data in records:
+        prefix = f"{timestamp_ns},{(timestamp_ns - start_ns) / 1e9:.6f},"
+        out.write("".join([f'{prefix}{i},{b},"{table[b]}"\n' for i, b in enumerate(data, index + 1)]))
+        index += len(data)
+
+
+def write_stats(records, out, board, header):
+    counts = Counter()
+    total = 0
+    chunks = 0
+    first_ns = last_ns = None
+    max_gap_ns = 0
+    for timestamp_ns, _, data in records:
+        counts.update(data)
+        total += len(data)
+        chunks += 1
+        if first_ns is None:
+            first_ns = timestamp_ns
+        elif timestamp_ns - last_ns > max_gap_ns:
+            max_gap_ns = timestamp_ns - last_ns
+        last_ns = timestamp_ns
+
+    duration = (last_ns - first_ns) / 1e9 if chunks > 1 else 0.0
+    out.write("=" * 60 + "\n")
+    out.write(f"  Port: {header['port'] or '-'} @ {header['baudrate']} baud\n")
+    out.write(f"  Başlangıç: {datetime.fromtimestamp(header['start_ns'] / 1e9):%Y-%m-%d %H:%M:%S}\n")
+    out.write(f"  Süre: {duration:.1f} s | {chunks} parça | {total} byte\n")
+    if duration:
+        out.write(f"  Ortalama: {total / duration:.1f} byte/s | en uzun sessizlik: {max_gap_ns / 1e6:.1f} ms\n")
+    out.write("=" * 60 + "\n")
+
+    names = decode_table(board)
+    groups = Counter()
+    for byte_val, n in counts.items():
+        groups[names[byte_val] if byte_val < 0x80 else
+               ("SET (tam)" if byte_val & SET_INT == SET_INT else "SET (ondalık)")] += n
+    for name, n in groups.most_common():
+        out.write(f"  {n:>10}  {100.0 * n / total:5.1f}%  {name}\n")
+
+
+def write_latency(records, out, board, timeout):
+    """Çift port yakalamasında GET → cevap gecikmeleri (kanal 1 = TX, 0 = RX)"""
+    correlator = RequestCorrelator(board, timeout)
+    heap = []
+    for seq, (timestamp_ns, channel, data) in enumerate(records):
+        heapq.heappush(heap, (timestamp_ns, seq, TX if channel == CHANNEL_TX else RX, data))
+        while heap[0][0] <= timestamp_ns - REORDER_NS:
+            t_ns, _, side, chunk = heapq.heappop(heap)
+            correlator.feed(t_ns, side, chunk)
+    while heap:
+        t_ns, _, side, chunk = heapq.heappop(heap)
+        correlator.feed(t_ns, side, chunk)
+    correlator.finish()
+    out.write(correlator.format_report() + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="UART .ucap yakalama çözücü")
+    parser.add_argument("capture", help=".ucap dosyası")
+    parser.add_argument("--format", choices=("text", "csv", "stats", "latency"), default="text")
+    parser.add_argument("--board", choices=("1", "2", "both"), default="both",
+                        help="GET komutlarını hangi board'a göre çöz")
+    parser.add_argument("--timeout", type=float, default=0.3,
+                        help="latency: GET cevabı için zaman aşımı (s)")
+    parser.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan: ekran)")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        with open(args.capture, "rb") as f:
+            header = read_header(f)
+            records = iter_records(f)
+            if args.format == "text":
+                write_text(records, out, args.board)
+            elif args.format == "csv":
+                write_csv(records, out, args.board, header["start_ns"])
+            elif args.format == "latency":
+                write_latency(records, out, args.board, args.timeout)
+            else:
+                write_stats(records, out, args.board, header)
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
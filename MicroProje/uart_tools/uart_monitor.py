@@ -5,21 +5,58 @@ Yazan: [SENIN ADIN SOYADIN]
 Tarih: 11 Aralık 2025
 
 PIC ile PC arasındaki UART trafiğini izler ve loglar.
+İzleme döngüsü yalnızca ham (timestamp_ns, bytes) parçalarını
+LogWriter kuyruğuna ekler; çözme, ekrana/dosyaya yazma ve dosya
+döndürme arka plandaki yazıcı iş parçacığında yapılır.
+
+Çift port modu (DualPortMonitor): TX ve RX hatları iki ayrı
+adaptörle dinlenir, her GET cevabıyla eşleştirilir ve komut başına
+gecikme histogramı (p50/p95/p99) ile zaman aşımı sayıları raporlanır.
 """
 
+import heapq
+import os
+import queue
+import sys
 import serial
+import threading
 import time
 from datetime import datetime
 
+# Proje kökünü (api/) path'e ekle - script olarak çalıştırıldığında gerekli
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from api.protocol import decode_table, line_table
+
+try:
+    from .log_writer import LogWriter
+    from .uart_capture import CHANNEL_RX, CHANNEL_TX, CaptureWriter
+    from .uart_correlator import RX, TX, RequestCorrelator
+except ImportError:  # python uart_monitor.py olarak çalıştırıldığında
+    from log_writer import LogWriter
+    from uart_capture import CHANNEL_RX, CHANNEL_TX, CaptureWriter
+    from uart_correlator import RX, TX, RequestCorrelator
+
 class UARTMonitor:
     """UART trafiğini izle ve logla"""
     
-    def __init__(self, port="COM14", baudrate=9600, log_file=None):
+    def __init__(self, port="COM14", baudrate=9600, log_file=None,
+                 max_log_bytes=10 * 1024 * 1024, log_backups=5, capture_file=None, board="both"):
         self.port = port
         self.baudrate = baudrate
         self.ser = None
         self.log_file = log_file
+        self.capture_file = capture_file     # Ham yakalama (.ucap); çözme uart_decode.py ile
+        self.max_log_bytes = max_log_bytes   # Log döndürme eşiği
+        self.log_backups = log_backups       # Saklanacak eski log sayısı
         self.running = False
+        self.writer = None
+        self._logged_bytes = 0               # Yazıcı tarafındaki byte sırası (#0001 ...)
+        # api.protocol'den profil tabloları: byte → açıklama, byte → log satırı sonu
+        self._decode = decode_table(board)
+        self._lines = line_table(board)
     
     def connect(self):
         """Porta bağlan"""
@@ -44,54 +81,43 @@ class UARTMonitor:
             print("\n✓ İzleme durduruldu")
     
     def log_message(self, message):
-        """Mesajı ekrana ve dosyaya yaz"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_line = f"[{timestamp}] {message}"
+        """
+        Serbest mesajı logla
         
-        print(log_line)
-        
-        if self.log_file:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_line + "\n")
+        Dosyaya yalnızca LogWriter kuyruğu üzerinden yazılır; izleme
+        dışında (ya da ham yakalamada) mesaj yalnızca ekrana çıkar.
+        """
+        if isinstance(self.writer, LogWriter):
+            self.writer.submit(time.time_ns(), message)
+            return
+        for line in self.format_chunk(time.time_ns(), message):
+            print(line)
     
-    def decode_command(self, byte_val):
-        """Komutu decode et"""
-        # Board #1 komutları
-        commands_board1 = {
-            0x01: "İstenen sıcaklık (ondalık) AL",
-            0x02: "İstenen sıcaklık (tam) AL",
-            0x03: "Ortam sıcaklığı (ondalık) AL",
-            0x04: "Ortam sıcaklığı (tam) AL",
-            0x05: "Fan hızı AL"
-        }
+    def format_chunk(self, timestamp_ns, data):
+        """
+        Ham parçayı log satırlarına çevir (yazıcı iş parçacığında çalışır)
         
-        # Board #2 komutları
-        commands_board2 = {
-            0x01: "Perde (ondalık) AL",
-            0x02: "Perde (tam) AL",
-            0x03: "Dış sıcaklık (ondalık) AL",
-            0x04: "Dış sıcaklık (tam) AL",
-            0x05: "Dış basınç (ondalık) AL",
-            0x06: "Dış basınç (tam) AL",
-            0x07: "Işık (ondalık) AL",
-            0x08: "Işık (tam) AL"
-        }
+        Args:
+            timestamp_ns (int): Parçanın alındığı an (time.time_ns)
+            data (bytes or str): Alınan byte'lar ya da serbest mesaj
         
-        # Set komutları
-        if byte_val & 0xC0 == 0xC0:
-            value = byte_val & 0x3F
-            return f"SET (tam) = {value}"
-        elif byte_val & 0x80 == 0x80:
-            value = byte_val & 0x3F
-            return f"SET (ondalık) = {value}"
+        Returns:
+            list: Log satırları
+        """
+        stamp = datetime.fromtimestamp(timestamp_ns / 1e9).strftime("%H:%M:%S.%f")[:-3]
+        if isinstance(data, str):
+            return [f"[{stamp}] {data}"]
         
-        # Get komutları
-        if byte_val in commands_board1:
-            return f"[B1] {commands_board1[byte_val]}"
-        elif byte_val in commands_board2:
-            return f"[B2] {commands_board2[byte_val]}"
-        else:
-            return f"Bilinmeyen komut"
+        first = self._logged_bytes + 1
+        self._logged_bytes += len(data)
+        prefix = f"[{stamp}] #"
+        lines = self._lines
+        # Parçanın tamamı tek geçişte tablodan çözülür
+        return [f"{prefix}{index:04d} → {lines[byte_val]}" for index, byte_val in enumerate(data, first)]
+    
+    def decode_command(self, byte_val):
+        """Komutu decode et (256 elemanlı profil tablosundan)"""
+        return self._decode[byte_val]
     
     def monitor(self):
         """Trafiği izle"""
@@ -103,27 +129,183 @@ class UARTMonitor:
         print("  CTRL+C ile durdurun")
         print("="*60 + "\n")
         
+        if self.capture_file:
+            # Ham yakalama: byte'lar çözülmez, ekrana da yazılmaz
+            self.writer = CaptureWriter(self.capture_file, self.baudrate, self.port).start()
+            print(f"⏺ Ham yakalama: {self.capture_file} (çözmek için: python uart_decode.py {self.capture_file})")
+        else:
+            self.writer = LogWriter(self.log_file, formatter=self.format_chunk,
+                                    max_bytes=self.max_log_bytes, backup_count=self.log_backups).start()
         self.running = True
         byte_count = 0
         
         try:
             while self.running:
-                if self.ser.in_waiting > 0:
-                    data = self.ser.read(self.ser.in_waiting)
-                    
-                    for byte_val in data:
-                        byte_count += 1
-                        decoded = self.decode_command(byte_val)
-                        self.log_message(f"#{byte_count:04d} → 0x{byte_val:02X} ({byte_val:3d}) | {decoded}")
-                
-                time.sleep(0.01)
+                # Veri yoksa en fazla port timeout'u (0.1 s) kadar bekler
+                data = self.ser.read(self.ser.in_waiting or 1)
+                if data:
+                    byte_count += len(data)
+                    self.writer.submit(time.time_ns(), data)
         
         except KeyboardInterrupt:
             print("\n\n⏸ Kullanıcı tarafından durduruldu")
         
         finally:
             self.disconnect()
+            self.writer.close()
+            stats = self.writer.stats
+            self.writer = None
             print(f"\n📊 Toplam {byte_count} byte izlendi")
+            if stats["dropped_chunks"]:
+                reason = "yazma hatası" if stats.get("errors") else "kuyruk doldu"
+                print(f"⚠ {stats['dropped_bytes']} byte loglanamadı ({reason})")
+
+
+class DualPortMonitor(UARTMonitor):
+    """
+    Çift port izleme: TX (PC → board) ve RX (board → PC) hatlarını
+    ayrı portlardan dinler, her GET'i cevabıyla eşleştirir
+    
+    Her port kendi okuyucu iş parçacığında okunur; parçalar zaman
+    damgasıyla tek kuyrukta birleşir ve reorder_window kadar
+    bekletilerek zaman sırasıyla RequestCorrelator'a verilir (iki
+    iş parçacığının kuyruğa yazma sırası farklı olabilir).
+    
+    Örnek Kullanım:
+        >>> mon = DualPortMonitor("COM14", "COM15", board="1")
+        >>> mon.monitor()          # CTRL+C → gecikme raporu
+    """
+    
+    def __init__(self, tx_port="COM14", rx_port="COM15", baudrate=9600, log_file=None,
+                 max_log_bytes=10 * 1024 * 1024, log_backups=5, capture_file=None, board="both",
+                 timeout=0.3, report_interval=10.0, reorder_window=0.02):
+        """
+        Args:
+            tx_port (str): PC'nin TX hattını dinleyen port
+            rx_port (str): Board'un TX (PC'nin RX) hattını dinleyen port
+            board (str): "1", "2" ya da "both" (0x06-0x08 görülünce Board #2)
+            timeout (float): GET cevabı için bekleme üst sınırı (s)
+            report_interval (float): Ara rapor aralığı (s, 0 = yalnızca sonda)
+            reorder_window (float): Sıralama için bekletme süresi (s)
+        """
+        super().__init__(port=tx_port, baudrate=baudrate, log_file=log_file, max_log_bytes=max_log_bytes,
+                         log_backups=log_backups, capture_file=capture_file, board=board)
+        self.rx_port = rx_port
+        self.rx_ser = None
+        self.report_interval = report_interval
+        self.reorder_ns = int(reorder_window * 1e9)
+        self.correlator = RequestCorrelator(board, timeout, on_event=self._on_event)
+        self.capture = None
+        self._events = queue.Queue()
+        self._byte_count = {TX: 0, RX: 0}
+    
+    def connect(self):
+        """İki porta da bağlan"""
+        try:
+            self.ser = serial.Serial(port=self.port, baudrate=self.baudrate, timeout=0.1)
+            self.rx_ser = serial.Serial(port=self.rx_port, baudrate=self.baudrate, timeout=0.1)
+            print(f"✓ Çift port izleme: TX {self.port} / RX {self.rx_port} @ {self.baudrate} baud")
+            if self.log_file:
+                print(f"✓ Log dosyası: {self.log_file}")
+            return True
+        except Exception as e:
+            print(f"✗ Bağlantı hatası: {e}")
+            if self.ser and self.ser.is_open:
+                self.ser.close()
+            return False
+    
+    def disconnect(self):
+        """İki bağlantıyı da kes"""
+        if self.rx_ser and self.rx_ser.is_open:
+            self.rx_ser.close()
+        super().disconnect()
+    
+    def _on_event(self, timestamp_ns, text):
+        self.writer.submit(timestamp_ns, text)
+    
+    def _reader(self, ser, side):
+        """Tek hattı oku, parçaları zaman damgasıyla birleşik kuyruğa ekle"""
+        channel = CHANNEL_TX if side == TX else CHANNEL_RX
+        while self.running:
+            try:
+                data = ser.read(ser.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError):
+                break   # Port kapatıldı
+            if data:
+                timestamp_ns = time.time_ns()
+                self._events.put((timestamp_ns, side, data))
+                if self.capture:
+                    self.capture.submit(timestamp_ns, data, channel)
+    
+    def monitor(self):
+        """İki hattı izle, istek/cevap eşleştir"""
+        if not self.connect():
+            return
+        
+        print("\n" + "="*60)
+        print("  UART ÇİFT PORT İZLEYİCİ (TX + RX)")
+        print("  CTRL+C ile durdurun")
+        print("="*60 + "\n")
+        
+        self.writer = LogWriter(self.log_file, formatter=self.format_chunk,
+                                max_bytes=self.max_log_bytes, backup_count=self.log_backups).start()
+        if self.capture_file:
+            # Ham yakalama (kanal 1 = TX, 0 = RX); eşleştirme yine canlı yapılır
+            self.capture = CaptureWriter(self.capture_file, self.baudrate, self.port).start()
+            print(f"⏺ Ham yakalama: {self.capture_file}")
+        
+        self.running = True
+        readers = [threading.Thread(target=self._reader, args=(self.ser, TX), name="uart-tx-reader", daemon=True),
+                   threading.Thread(target=self._reader, args=(self.rx_ser, RX), name="uart-rx-reader", daemon=True)]
+        for reader in readers:
+            reader.start()
+        
+        heap = []
+        seq = 0
+        next_report = time.monotonic() + self.report_interval
+        try:
+            while self.running:
+                try:
+                    timestamp_ns, side, data = self._events.get(timeout=0.05)
+                    heapq.heappush(heap, (timestamp_ns, seq, side, data))
+                    seq += 1
+                except queue.Empty:
+                    pass
+                # Pencereden çıkan parçalar zaman sırasıyla eşleştiriciye
+                horizon = time.time_ns() - self.reorder_ns
+                while heap and heap[0][0] <= horizon:
+                    timestamp_ns, _, side, data = heapq.heappop(heap)
+                    self._byte_count[side] += len(data)
+                    self.correlator.feed(timestamp_ns, side, data)
+                self.correlator.expire(horizon)
+                if self.report_interval and time.monotonic() >= next_report:
+                    self.writer.submit(time.time_ns(), "\n" + self.correlator.format_report())
+                    next_report = time.monotonic() + self.report_interval
+        
+        except KeyboardInterrupt:
+            print("\n\n⏸ Kullanıcı tarafından durduruldu")
+        
+        finally:
+            self.running = False
+            for reader in readers:
+                reader.join(1)
+            while not self._events.empty():
+                timestamp_ns, side, data = self._events.get_nowait()
+                heapq.heappush(heap, (timestamp_ns, seq, side, data))
+                seq += 1
+            while heap:
+                timestamp_ns, _, side, data = heapq.heappop(heap)
+                self._byte_count[side] += len(data)
+                self.correlator.feed(timestamp_ns, side, data)
+            self.correlator.finish()
+            self.disconnect()
+            self.writer.close()
+            self.writer = None
+            if self.capture:
+                self.capture.close()
+                self.capture = None
+            print("\n" + self.correlator.format_report())
+            print(f"\n📊 TX {self._byte_count[TX]} byte / RX {self._byte_count[RX]} byte izlendi")
 
 
 def main():
@@ -135,16 +317,33 @@ def main():
     print("║" + " "*58 + "║")
     print("╚" + "="*58 + "╝\n")
     
+    mode = input("Mod: (T)ek port / (Ç)ift port TX+RX eşleştirme (varsayılan: T): ").strip().upper()
+    dual = mode in ("Ç", "C")
+    
     port = input("COM Port (varsayılan: COM14): ").strip() or "COM14"
+    if dual:
+        rx_port = input("RX hattı COM Port (varsayılan: COM15): ").strip() or "COM15"
+        board = input("Board: 1 / 2 / (b)ilinmiyor (varsayılan: b): ").strip() or "both"
+        if board not in ("1", "2"):
+            board = "both"
+    
+    baudrate = int(input("Baud rate (varsayılan: 9600): ").strip() or 9600)
     
-    log_choice = input("Log dosyası oluştur? (E/H, varsayılan: H): ").strip().upper()
+    log_choice = input("Log: (H)ayır / (E)vet, metin / (B)inary ham yakalama (varsayılan: H): ").strip().upper()
     log_file = None
+    capture_file = None
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     if log_choice == "E":
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = f"uart_log_{timestamp}.txt"
+    elif log_choice == "B":
+        capture_file = f"uart_capture_{timestamp}.ucap"
     
-    monitor = UARTMonitor(port=port, log_file=log_file)
+    if dual:
+        monitor = DualPortMonitor(tx_port=port, rx_port=rx_port, baudrate=baudrate, log_file=log_file,
+                                  capture_file=capture_file, board=board)
+    else:
+        monitor = UARTMonitor(port=port, baudrate=baudrate, log_file=log_file, capture_file=capture_file)
     monitor.monitor()
 
 